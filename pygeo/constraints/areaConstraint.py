@@ -1,5 +1,6 @@
 # External modules
 import numpy as np
+from scipy.spatial import cKDTree
 
 # Local modules
 from .. import geo_utils
@@ -16,6 +17,10 @@ except ImportError:
 class TriangulatedSurfaceConstraint(GeometricConstraint):
     """
     This class is used to enclose a triangulated object inside an aerodynamic surface.
+
+    The geograd results are cached for the current surfaces, so the sensitivities reuse
+    the minimum distance and the culling of the forward evaluation. Only the triangles
+    that can be closer than the heuristic distance to the other surface are passed to geograd.
     """
 
     def __init__(
@@ -81,6 +86,12 @@ class TriangulatedSurfaceConstraint(GeometricConstraint):
         self.perim_length = None
         self.minimum_distance = None
 
+        # geograd results for the surfaces in cachedSurfs
+        self.cachedSurfs = None
+        self.cachedFuncs = None
+        self.cachedDerivs = None
+        self.activeTris = None
+
     def getVarNames(self):
         """
         return the var names relevant to this constraint. By default, this is the DVGeo
@@ -217,17 +228,18 @@ class TriangulatedSurfaceConstraint(GeometricConstraint):
         """
         Call geograd to compute the KS function and intersection length
         """
+        self._updateCache()
+        if self.cachedFuncs is not None:
+            return self.cachedFuncs
+
+        surfs = self._getActiveSurfaces()
+
         # first compute the length of the intersection surface between the object and surf mesh
         mindist_tmp = 0.0
 
         # first run to get the minimum distance
         _, perim_length, mindist, _, _ = geograd_parallel.compute(
-            self.surf1_p0,
-            self.surf1_p1,
-            self.surf1_p2,
-            self.surf2_p0,
-            self.surf2_p1,
-            self.surf2_p2,
+            *surfs,
             mindist_tmp,
             self.rho,
             self.maxdim,
@@ -235,12 +247,7 @@ class TriangulatedSurfaceConstraint(GeometricConstraint):
         )
         # second run gets the well-conditioned KS
         KS, perim_length, mindist, _, _ = geograd_parallel.compute(
-            self.surf1_p0,
-            self.surf1_p1,
-            self.surf1_p2,
-            self.surf2_p0,
-            self.surf2_p1,
-            self.surf2_p2,
+            *surfs,
             mindist,
             self.rho,
             self.maxdim,
@@ -273,28 +280,123 @@ class TriangulatedSurfaceConstraint(GeometricConstraint):
         else:
             failflag = False
 
+        self.cachedFuncs = (KS, perim_length, failflag)
+
         return KS, perim_length, failflag
 
     def evalTriangulatedSurfConstraintSens(self):
         """
         Call geograd to compute the derivatives of the KS function and intersection length
         """
+        self._updateCache()
+        if self.cachedDerivs is not None:
+            return self.cachedDerivs
+
         # first compute the length of the intersection surface between the object and surf mesh
         deriv_output = geograd_parallel.compute_derivs(
-            self.surf1_p0,
-            self.surf1_p1,
-            self.surf1_p2,
-            self.surf2_p0,
-            self.surf2_p1,
-            self.surf2_p2,
+            *self._getActiveSurfaces(),
             self.minimum_distance,
             self.rho,
             self.maxdim,
             self.comm.py2f(),
         )
 
+        self.cachedDerivs = self._expandDerivs(deriv_output)
+
+        return self.cachedDerivs
+
+    def _expandDerivs(self, deriv_output):
+        """
+        Expand the derivatives wrt the vertices of the active triangles (indices 5 to 16
+        of the geograd output) to all the triangles. The culled triangles do not
+        contribute, so their derivatives are zero.
+        """
+        if self.activeTris is None:
+            return deriv_output
+
+        deriv_output = list(deriv_output)
+        for iSurf, (active, size) in enumerate(zip(self.activeTris, (self.surf1_size, self.surf2_size))):
+            # KS derivatives start at index 5 and perimeter derivatives at 11, surface 2 is offset by 3
+            for i in range(5 + 3 * iSurf, 17, 6):
+                for j in range(i, i + 3):
+                    deriv = np.zeros(deriv_output[j].shape[:-1] + (size,))
+                    deriv[..., active] = deriv_output[j]
+                    deriv_output[j] = deriv
+
         return deriv_output
 
+    def _getSurfaces(self):
+        """
+        Return the triangle vertices of both surfaces
+        """
+        return self.surf1_p0, self.surf1_p1, self.surf1_p2, self.surf2_p0, self.surf2_p1, self.surf2_p2
+
+    def _getActiveSurfaces(self):
+        """
+        Return the triangle vertices of both surfaces without the culled triangles
+        """
+        surfs = self._getSurfaces()
+        if self.activeTris is None:
+            return surfs
+
+        return [surf[:, self.activeTris[i // 3]] for i, surf in enumerate(surfs)]
+
+    def _updateCache(self):
+        """
+        Clear the cached geograd results and cull the triangles again if the surfaces changed
+        """
+        surfs = self._getSurfaces()
+        if self.cachedSurfs is not None and all(np.array_equal(a, b) for a, b in zip(surfs, self.cachedSurfs)):
+            return
+
+        self.cachedSurfs = [surf.copy() for surf in surfs]
+        self.cachedFuncs = None
+        self.cachedDerivs = None
+        self.activeTris = self._cullTriangles()
+
+    def _cullTriangles(self):
+        """
+        Find the triangles of each surface that may be within maxdim of the other surface.
+        geograd skips the pairs of facets farther apart than maxdim, so the other triangles
+        do not contribute to the KS function or the intersection length.
+
+        Each triangle is bounded by the sphere around its bounding box, and the nearest sphere
+        center on the other surface is found with a k-d tree. A triangle is kept if this center
+        is closer than maxdim plus its radius plus the largest radius on the other surface.
+        Every pair closer than maxdim is then kept, including the closest pair that sets the
+        minimum distance. If no pair is certainly closer than maxdim, the closest pair could be
+        culled, so nothing is culled.
+
+        Returns
+        -------
+        activeTris : list of arrays or None
+            The indices of the triangles to keep on each surface,
+            or None if all the triangles are kept
+        """
+        surfs = self._getSurfaces()
+        centers = []
+        radii = []
+        for p0, p1, p2 in (surfs[:3], surfs[3:]):
+            xyzmin = np.minimum(np.minimum(p0, p1), p2).T
+            xyzmax = np.maximum(np.maximum(p0, p1), p2).T
+            centers.append(0.5 * (xyzmin + xyzmax))
+            radii.append(0.5 * np.linalg.norm(xyzmax - xyzmin, axis=1))
+
+        activeTris = []
+        closePair = False
+        for i, j in ((0, 1), (1, 0)):
+            dist, nearest = cKDTree(centers[j]).query(centers[i])
+            activeTris.append(np.nonzero(dist <= self.maxdim + radii[i] + radii[j].max())[0])
+
+            # the spheres bound the distance between any two points of a pair from above
+            closePair = closePair or np.any(dist + radii[i] + radii[j][nearest] <= self.maxdim)
+
+        nActive = [len(active) for active in activeTris]
+        if not closePair or nActive == [self.surf1_size, self.surf2_size]:
+            return None
+
+        return activeTris
+
     def addConstraintsPyOpt(self, optProb, exclude_wrt=None):
         """
         Add the constraints to pyOpt, if the flag is set
@@ -1,6 +1,9 @@
 # External modules
 import numpy as np
 
+# Local modules
+from .file_io import writePlot3DFile
+
 
 def write_wing_FFD_file(fileName, slices, N0, N1, N2, axes=None, dist=None):
     """
@@ -93,9 +96,6 @@ def write_wing_FFD_file(fileName, slices, N0, N1, N2, axes=None, dist=None):
         assert len(size[iVol]) == Nvol
     N0, N1, N2 = size
 
-    f = open(fileName, "w")
-    f.write(f"{Nvol}\n")
-
     def getDistribution(distIn, N):
         if not isinstance(distIn, str):
             assert len(distIn) == N
@@ -110,18 +110,9 @@ def write_wing_FFD_file(fileName, slices, N0, N1, N2, axes=None, dist=None):
             dist = np.linspace(0, 1, N) ** (2.0 / 3.0)
         return dist
 
-    for i in range(Nvol):
-        size = [N0[i], N1[i], N2[i]]
-        Ni = size[axes.index("i")]
-        Nj = size[axes.index("j")]
-        Nk = size[axes.index("k")]
-        f.write("%d\t%d\t%d\n" % (Ni, Nj, Nk))
-
+    blocks = []
     for iVol in range(Nvol):
         size = [N0[iVol], N1[iVol], N2[iVol]]
-        Ni = size[axes.index("i")]
-        Nj = size[axes.index("j")]
-        Nk = size[axes.index("k")]
         # Get distributions for each axis
         d0 = getDistribution(dist[iVol][0], size[0])
         d1 = getDistribution(dist[iVol][1], size[1])
@@ -140,23 +131,10 @@ def write_wing_FFD_file(fileName, slices, N0, N1, N2, axes=None, dist=None):
                 V = Q + np.outer(d1, (S - Q))[k]
                 X[j, k] = U + np.outer(d2, (V - U))
 
-        for dim in range(3):
-            line = ""
-            for k in range(Nk):
-                for j in range(Nj):
-                    for i in range(Ni):
-                        idc = [-1, -1, -1]
-                        idc[axes.index("i")] = i
-                        idc[axes.index("j")] = j
-                        idc[axes.index("k")] = k
-                        line += f"{X[idc[0], idc[1], idc[2], dim]: .4e}\t"
-                        if len(line) + 11 > 80:
-                            f.write(line + "\n")
-                            line = ""
-            if len(line) > 0:
-                f.write(line + "\n")
-
-    f.close()
+        # Reorder the axes into the plot3d i, j, k directions
+        blocks.append(X.transpose((axes.index("i"), axes.index("j"), axes.index("k"), 3)))
+
+    writePlot3DFile(fileName, blocks, fmt="% .4e")
 
 
 def createFittedWingFFD(surf, surfFormat, outFile, leList, teList, nSpan, nChord, absMargins, relMargins, liftIndex):
@@ -231,8 +209,6 @@ def createFittedWingFFD(surf, surfFormat, outFile, leList, teList, nSpan, nChord
     # Get the surface intersections; surfCoords has dimensions [nSpanTotal, nChord, 2, 3]
     surfCoords = DVCon._generateIntersections(leList, teList, nSpan, nChord, surfaceName="default")
 
-    nSpanTotal = np.sum(nSpan)
-
     # Initialize FFD coordinates to the surface coordinates
     FFDCoords = surfCoords.copy()
 
@@ -242,12 +218,11 @@ def createFittedWingFFD(surf, surfFormat, outFile, leList, teList, nSpan, nChord
         # Swap axes again so that z is the spanwise direction instead of y
         FFDCoords = np.swapaxes(FFDCoords, 1, 2)  # [nChord, 2, nSpanTotal, 3]
 
-    # Assign coordinates and dimensions in each direction
+    # Assign coordinates in each direction
 
     # x is always the chordwise direction
     leadingEdge = FFDCoords[0, :, :, 0]
     trailingEdge = FFDCoords[-1, :, :, 0]
-    Nx = nChord
 
     # y and z depend on the liftIndex
     if liftIndex == 2:
@@ -256,18 +231,12 @@ def createFittedWingFFD(surf, surfFormat, outFile, leList, teList, nSpan, nChord
 
         upperSurface = FFDCoords[:, 0, :, 1]
         lowerSurface = FFDCoords[:, 1, :, 1]
-
-        Ny = 2
-        Nz = nSpanTotal
     elif liftIndex == 3:
         root = FFDCoords[:, 0, :, 1]
         tip = FFDCoords[:, -1, :, 1]
 
         upperSurface = FFDCoords[:, :, 1, 2]
         lowerSurface = FFDCoords[:, :, 0, 2]
-
-        Ny = nSpanTotal
-        Nz = 2
     else:
         raise ValueError("liftIndex must be 2 (for y-axis) or 3 (for z-axis)")
 
@@ -285,13 +254,4 @@ def createFittedWingFFD(surf, surfFormat, outFile, leList, teList, nSpan, nChord
     lowerSurface -= thickness * relMargins[2] + absMargins[2]
 
     # Write FFD file
-    f = open(outFile, "w")
-    f.write("1\n")
-    f.write(f"{Nx} {Ny} {Nz}\n")
-    for ell in range(3):
-        for k in range(Nz):
-            for j in range(Ny):
-                for i in range(Nx):
-                    f.write("%.15f " % (FFDCoords[i, j, k, ell]))
-                f.write("\n")
-    f.close()
+    writePlot3DFile(outFile, [FFDCoords], fmt="%.15f")
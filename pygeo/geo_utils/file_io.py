@@ -7,9 +7,14 @@ import numpy as np
 
 
 def readNValues(handle, N, dtype, binary=False, sep=" "):
-    """Read N values of dtype 'float' or 'int' from file handle"""
+    """Read N values of dtype 'float' or 'int' from file handle. In
+    binary mode, the integers are 4-byte and the floats 8-byte native
+    endian values, as in plot3d files."""
     if binary:
-        sep = ""
+        if dtype == "int":
+            return np.fromfile(handle, dtype="intc", count=N)
+        else:
+            return np.fromfile(handle, dtype="float64", count=N)
 
     if dtype == "int":
         values = np.fromfile(handle, dtype="int", count=N, sep=sep)
@@ -18,6 +23,171 @@ def readNValues(handle, N, dtype, binary=False, sep=" "):
     return values
 
 
+def readPlot3DFile(fileName, order="f", fileType=None):
+    """
+    Read the blocks of a 3D multi-block plot3d file.
+
+    Parameters
+    ----------
+    fileName : str
+        The file to read
+    order : {'f','c'}
+        Internal ordering of the coordinates of each block
+    fileType : {None, 'ascii', 'binary', 'fortran', 'npz'}
+        The format of the file. 'binary' is a native endian C-stream
+        file, 'fortran' a native endian Fortran unformatted file and
+        'npz' a numpy archive with the arrays 'sizes' and 'coords',
+        where 'coords' holds the values in the same order as a plot3d
+        file. If None, the format is detected from the extension and
+        the contents of the file.
+
+    Returns
+    -------
+    sizes : array of size (nBlock, 3)
+        The sizes of the blocks
+    blocks : list of arrays of size (ni, nj, nk, 3)
+        The coordinates of each block
+    """
+    if fileType is None:
+        fileType = _getPlot3DFileType(fileName)
+
+    if fileType == "ascii":
+        with open(fileName) as f:
+            nBlock = readNValues(f, 1, "int")[0]
+            sizes = readNValues(f, nBlock * 3, "int").reshape((nBlock, 3))
+            values = readNValues(f, 3 * np.sum(np.prod(sizes, axis=1)), "float")
+
+    elif fileType == "npz":
+        with np.load(fileName) as data:
+            sizes = data["sizes"].astype("int").reshape((-1, 3))
+            values = data["coords"].flatten()
+
+    elif fileType in ["binary", "fortran"]:
+        raw = np.memmap(fileName, dtype="uint8", mode="r")
+        if fileType == "fortran":
+            records = []
+            offset = 0
+            while offset < len(raw):
+                nBytes = int(raw[offset : offset + 4].view("intc")[0])
+                records.append(raw[offset + 4 : offset + 4 + nBytes])
+                offset += nBytes + 8
+            nBlock = int(records[0].view("intc")[0])
+            sizes = records[1].view("intc").astype("int").reshape((nBlock, 3))
+            data = np.concatenate(records[2:])
+        else:
+            nBlock = int(raw[0:4].view("intc")[0])
+            sizes = raw[4 : 4 + 12 * nBlock].view("intc").astype("int").reshape((nBlock, 3))
+            data = raw[4 + 12 * nBlock :]
+
+        # Figure out the precision from the number of bytes
+        nValues = 3 * np.sum(np.prod(sizes, axis=1))
+        if len(data) == 8 * nValues:
+            values = data.view("float64")
+        elif len(data) == 4 * nValues:
+            values = data.view("float32").astype("float64")
+        else:
+            raise ValueError(f"The size of the binary plot3d file {fileName} does not match the block sizes")
+
+    else:
+        raise ValueError(f"Unknown plot3d file type {fileType}")
+
+    # Split the values into the blocks
+    blocks = []
+    offset = 0
+    for iBlock in range(len(sizes)):
+        shape = tuple(sizes[iBlock])
+        nPts = np.prod(shape)
+        block = np.zeros(shape + (3,))
+        for idim in range(3):
+            block[:, :, :, idim] = values[offset : offset + nPts].reshape(shape, order=order)
+            offset += nPts
+        blocks.append(block)
+
+    return sizes, blocks
+
+
+def writePlot3DFile(fileName, blocks, fileType="ascii", fmt=None):
+    """
+    Write the blocks of a 3D multi-block plot3d file. The file can be
+    read back with :func:`readPlot3DFile`.
+
+    Parameters
+    ----------
+    fileName : str
+        The file to write
+    blocks : list of arrays of size (ni, nj, nk, 3)
+        The coordinates of each block
+    fileType : {'ascii', 'binary', 'fortran', 'npz'}
+        The format of the file, see :func:`readPlot3DFile`. The binary
+        formats use 4-byte integers and 8-byte floats.
+    fmt : str
+        Format of the values in ascii files. By default the values are
+        written with full precision.
+    """
+    sizes = np.array([block.shape[:3] for block in blocks], "intc")
+
+    # Each block is written as all x, then all y, then all z values,
+    # with the i index running fastest
+    values = np.concatenate([np.asarray(block, "float64").transpose((3, 2, 1, 0)).ravel() for block in blocks])
+
+    if fileType == "ascii":
+        with open(fileName, "w") as f:
+            f.write(f"{len(blocks)}\n")
+            for size in sizes:
+                f.write("%d %d %d\n" % tuple(size))
+            if fmt is None:
+                values.tofile(f, sep="\n")
+            else:
+                values.tofile(f, sep="\n", format=fmt)
+            f.write("\n")
+
+    elif fileType == "npz":
+        # Pass a file handle so that numpy does not append a .npz extension
+        with open(fileName, "wb") as f:
+            np.savez(f, sizes=sizes, coords=values)
+
+    elif fileType == "binary":
+        with open(fileName, "wb") as f:
+            np.array([len(blocks)], "intc").tofile(f)
+            sizes.tofile(f)
+            values.tofile(f)
+
+    elif fileType == "fortran":
+        # One record for the block count, one for the sizes and one per block
+        nValues = 3 * np.prod(sizes, axis=1)
+        records = [np.array([len(blocks)], "intc"), sizes] + np.split(values, np.cumsum(nValues)[:-1])
+        with open(fileName, "wb") as f:
+            for record in records:
+                marker = np.array([record.nbytes], "intc")
+                marker.tofile(f)
+                record.tofile(f)
+                marker.tofile(f)
+
+    else:
+        raise ValueError(f"Unknown plot3d file type {fileType}")
+
+
+def _getPlot3DFileType(fileName):
+    """Detect the format of a plot3d file from its extension and its first bytes"""
+    if fileName.endswith(".npz"):
+        return "npz"
+
+    with open(fileName, "rb") as f:
+        head = f.read(64)
+
+    # ASCII files only contain numbers and white space
+    if all(c in b"0123456789+-.eEdD \t\r\n" for c in head):
+        return "ascii"
+
+    # Fortran unformatted files start with the 4-byte record marker
+    # of the block count, which is repeated after the record
+    ints = np.frombuffer(head[: len(head) // 4 * 4], dtype="intc")
+    if len(ints) >= 4 and ints[0] == 4 and ints[2] == 4 and ints[3] == 12 * ints[1]:
+        return "fortran"
+
+    return "binary"
+
+
 def writeValues(handle, values, dtype, binary=False):
     """Read N values of type 'float' or 'int' from file handle"""
     if binary:
@@ -115,6 +285,104 @@ def readAirfoilFile(fileName, bluntTe=False, bluntTaperRange=0.1, bluntThickness
     return x, y
 
 
+def writeTecplot3DZone(handle, name, data, solutionTime=None):
+    """
+    Write a structured 3D zone in point format to an open tecplot
+    file. This writes the same zone as pyspline's writeTecplot3D, but
+    formats all the values in one call.
+
+    Parameters
+    ----------
+    handle : file or list
+        Tecplot file opened with openTecplot. If a list is given, the
+        zone is appended to it instead, to be written to a binary file
+        with :func:`writeTecplotBinaryFile`.
+    name : str
+        Name of the zone
+    data : array of size (ni, nj, nk, nDim)
+        The values of the zone
+    solutionTime : float
+        Solution time of the zone
+    """
+    if isinstance(handle, list):
+        handle.append((name, np.array(data, "float64"), solutionTime))
+        return
+
+    nx, ny, nz, nDim = data.shape
+    handle.write('Zone T="%s" I=%d J=%d K=%d\n' % (name, nx, ny, nz))
+    if solutionTime is not None:
+        handle.write("SOLUTIONTIME=%f\n" % (solutionTime))
+    handle.write("DATAPACKING=POINT\n")
+
+    # Tecplot point ordering has the i index running fastest
+    np.savetxt(handle, data.transpose((2, 1, 0, 3)).reshape((-1, nDim)), fmt="%f")
+
+
+def writeTecplotBinaryFile(fileName, zones, title="", varNames=("CoordinateX", "CoordinateY", "CoordinateZ")):
+    """
+    Write structured 3D zones to a binary tecplot (.plt) file in the
+    version 112 format. The values are written in double precision with
+    one tofile call per zone, so this is much faster than formatting an
+    ascii file for large zones.
+
+    Parameters
+    ----------
+    fileName : str
+        The file to write. Should have a .plt extension
+    zones : list of tuples
+        The (name, data, solutionTime) tuple of each zone, where data is
+        an array of size (ni, nj, nk, nDim) and solutionTime is a float
+        or None. This is the list filled by :func:`writeTecplot3DZone`.
+    title : str
+        Title of the dataset
+    varNames : list of str
+        Names of the nDim variables
+    """
+
+    def tecString(string):
+        # Strings are written as one 4-byte integer per character with a null terminator
+        return np.array([ord(c) for c in string] + [0], "int32")
+
+    zoneMarker = np.array([299.0], "float32")
+
+    with open(fileName, "wb") as f:
+        # Header section: magic number, byte order, file type, title and variables
+        f.write(b"#!TDV112")
+        np.array([1, 0], "int32").tofile(f)
+        tecString(title).tofile(f)
+        np.array([len(varNames)], "int32").tofile(f)
+        for varName in varNames:
+            tecString(varName).tofile(f)
+
+        for name, data, solutionTime in zones:
+            zoneMarker.tofile(f)
+            tecString(name).tofile(f)
+            # Zones with a solution time get a strand ID assigned by tecplot
+            strandID = -1 if solutionTime is None else -2
+            np.array([-1, strandID], "int32").tofile(f)
+            np.array([0.0 if solutionTime is None else solutionTime], "float64").tofile(f)
+            # Unused value, ordered zone, nodal values and no face neighbors
+            np.array([-1, 0, 0, 0, 0], "int32").tofile(f)
+            np.array(data.shape[:3], "int32").tofile(f)
+            # No auxiliary data
+            np.array([0], "int32").tofile(f)
+
+        # End of the header
+        np.array([357.0], "float32").tofile(f)
+
+        # Data section, in block format with the i index running fastest
+        for _, data, _ in zones:
+            nDim = data.shape[3]
+            values = np.asarray(data, "float64").transpose((3, 2, 1, 0)).reshape((nDim, -1))
+
+            zoneMarker.tofile(f)
+            # Double precision values, no passive or shared variables and no shared connectivity
+            np.full(nDim, 2, "int32").tofile(f)
+            np.array([0, 0, -1], "int32").tofile(f)
+            np.column_stack((values.min(axis=1), values.max(axis=1))).astype("float64").tofile(f)
+            values.tofile(f)
+
+
 def writeAirfoilFile(fileName, name, x, y):
     """write an airfoil file"""
     f = open(fileName, "w")
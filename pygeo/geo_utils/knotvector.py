@@ -40,3 +40,142 @@ def blendKnotVectors(knotVectors, sym):
 
     newKnotVec = newKnotVec / nVec
     return newKnotVec
+
+
+# --------------------------------------------------------------
+#                  B-spline Basis Functions
+# --------------------------------------------------------------
+
+
+def findSpan(t, k, u):
+    """
+    Find the knot span of each parametric value. This is a vectorized
+    version of the span search used by pySpline.
+
+    Parameters
+    ----------
+    t : array
+        The knot vector
+    k : int
+        The order of the spline
+    u : array
+        The parametric values
+
+    Returns
+    -------
+    span : array of int
+        The zero-based index such that t[span] <= u < t[span + 1]
+    """
+    nCtl = len(t) - k
+    span = np.searchsorted(t, u, side="right") - 1
+
+    return np.clip(span, k - 1, nCtl - 1)
+
+
+def basisFunctions(t, k, u):
+    """
+    Evaluate the non-zero B-spline basis functions at an array of
+    parametric values. This is a vectorized version of the basis
+    function evaluation in pySpline and gives identical results.
+
+    Parameters
+    ----------
+    t : array
+        The knot vector
+    k : int
+        The order of the spline
+    u : array
+        The parametric values
+
+    Returns
+    -------
+    start : array of int
+        Index of the first control point with a non-zero basis function
+        for each parametric value
+    B : array of size (N, k)
+        The non-zero basis function values
+    """
+    u = np.atleast_1d(u)
+    span = findSpan(t, k, u)
+
+    B = np.zeros((len(u), k), dtype=u.dtype if np.iscomplexobj(u) else float)
+    B[:, 0] = 1.0
+    left = np.zeros((len(u), k), dtype=B.dtype)
+    right = np.zeros((len(u), k), dtype=B.dtype)
+
+    for j in range(1, k):
+        left[:, j] = u - t[span + 1 - j]
+        right[:, j] = t[span + j] - u
+        saved = np.zeros(len(u), dtype=B.dtype)
+        for r in range(j):
+            temp = B[:, r] / (right[:, r + 1] + left[:, j - r])
+            B[:, r] = saved + right[:, r + 1] * temp
+            saved = left[:, j - r] * temp
+        B[:, j] = saved
+
+    return span - k + 1, B
+
+
+def curveValues(t, k, coef, s):
+    """
+    Evaluate a B-spline curve at an array of parametric values.
+
+    Parameters
+    ----------
+    t : array
+        The knot vector
+    k : int
+        The order of the spline
+    coef : array of size (nCtl, nDim)
+        The control points of the curve
+    s : array
+        The parametric values
+
+    Returns
+    -------
+    values : array of size (N, nDim)
+        The curve values
+    """
+    start, B = basisFunctions(t, k, s)
+    ind = start[:, None] + np.arange(k)
+
+    return np.einsum("ij,ijk->ik", B, coef[ind])
+
+
+def derivativeCurve(t, k, coef):
+    """
+    Compute the knot vector, order and control points of the
+    derivative of a B-spline curve. The derivative of a curve of
+    order k is a curve of order k - 1 defined on the knot vector
+    without its first and last knots.
+
+    Parameters
+    ----------
+    t : array
+        The knot vector
+    k : int
+        The order of the spline
+    coef : array of size (nCtl, nDim)
+        The control points of the curve
+
+    Returns
+    -------
+    tDeriv : array
+        The knot vector of the derivative curve
+    kDeriv : int
+        The order of the derivative curve
+    coefDeriv : array of size (nCtl - 1, nDim)
+        The control points of the derivative curve
+    """
+    nCtl = len(coef)
+    if k == 1:
+        # The derivative of a piecewise constant curve is zero
+        return t, k, np.zeros_like(coef)
+
+    denom = t[k : k + nCtl - 1] - t[1:nCtl]
+    # Repeated knots give zero length spans that do not contribute
+    safeDenom = np.where(denom > 0.0, denom, 1.0)
+    coefDeriv = (k - 1) * (coef[1:] - coef[:-1]) / safeDenom[:, None]
+    coefDeriv[denom <= 0.0] = 0.0
+
+    return t[1:-1], k - 1, coefDeriv
@@ -125,20 +125,27 @@ class PointSelect:
 
     def getPoints(self, points):
         """Take in a list of points and return the ones that statify
-        the point select class."""
-        ptList = []
-        indList = []
+        the point select class.
+
+        Returns
+        -------
+        ptList : array of size (N,3)
+            The selected points
+        indList : array of ints
+            The indices of the selected points
+        """
+        points = np.atleast_2d(np.asarray(points))
         if self.type == "box":
-            for i in range(len(points)):
-                u0, v0, _ = self.box.projectPoint(points[i])
-                if 0 < u0 < 1 and 0 < v0 < 1:  # Its Inside
-                    ptList.append(points[i])
-                    indList.append(i)
+            # Project all the points onto the box at once
+            inside = np.zeros(len(points), dtype=bool)
+            if len(points) > 0:
+                u0, v0, _ = self.box.projectPoint(points)
+                u0 = np.atleast_1d(u0)
+                v0 = np.atleast_1d(v0)
+                inside = (u0 > 0) & (u0 < 1) & (v0 > 0) & (v0 < 1)
+            indList = np.where(inside)[0]
 
         elif self.type == "list":
-            for i in range(len(self.indices)):
-                ptList.append(points[self.indices[i]])
-
             indList = self.indices.copy()
 
         elif self.type == "ijkBounds":
@@ -146,7 +153,7 @@ class PointSelect:
                 "Use PointSelect.getPoints_ijk() to return indices of an object initialized with ijkBounds."
             )
 
-        return ptList, indList
+        return points[indList], indList
 
     def getPoints_ijk(self, DVGeo):
         """Receives a DVGeo object (with an embedded FFD) and uses the ijk bounds specified in the initialization to extract
@@ -156,10 +163,8 @@ class PointSelect:
 
         DVGeo : DVGeo object"""
 
-        # Initialize list to hold indices in the DVGeo ordering
-        indList = []
-
         # Loop over every dictionary entry to get cooresponding indices
+        indList = [np.zeros(0, "intc")]
         for iVol in self.ijkBounds:
             # Get current bounds
             ilow = self.ijkBounds[iVol][0][0]
@@ -170,9 +175,10 @@ class PointSelect:
             khigh = self.ijkBounds[iVol][2][1]
 
             # Retrieve current points
-            indList.extend(DVGeo.FFD.topo.lIndex[iVol][ilow:ihigh, jlow:jhigh, klow:khigh].flatten())
+            indList.append(DVGeo.FFD.topo.lIndex[iVol][ilow:ihigh, jlow:jhigh, klow:khigh].flatten())
+        indList = np.concatenate(indList)
 
         # Now get the corresponding coordinates
-        ptList = [DVGeo.FFD.coef[ii] for ii in indList]
+        ptList = DVGeo.FFD.coef[indList]
 
         return ptList, indList
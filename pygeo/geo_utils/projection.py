@@ -266,3 +266,68 @@ def projectNodePosOnly(pt, upVec, p0, v1, v2):
 
     fail = 1
     return None, fail
+
+
+def closestPointsSegments(p0, p1, q0, q1, eps=1e-30):
+    """
+    Compute the closest points between two sets of line segments. The
+    segments are p(a) = p0 + a * (p1 - p0) and q(b) = q0 + b * (q1 - q0)
+    with a and b in [0, 1]. All inputs are broadcast against each other.
+
+    Parameters
+    ----------
+    p0, p1 : array of size (..., 3)
+        The end points of the first set of segments
+    q0, q1 : array of size (..., 3)
+        The end points of the second set of segments
+    eps : float
+        Tolerance used to detect degenerate segments
+
+    Returns
+    -------
+    a : array
+        The parameters of the closest points on the first segments
+    b : array
+        The parameters of the closest points on the second segments
+    D : array of size (..., 3)
+        The vector from the closest point on the first segment to
+        the closest point on the second segment
+    """
+    u = p1 - p0
+    v = q1 - q0
+    r = p0 - q0
+
+    uu = np.sum(u * u, axis=-1)
+    vv = np.sum(v * v, axis=-1)
+    uv = np.sum(u * v, axis=-1)
+    ur = np.sum(u * r, axis=-1)
+    vr = np.sum(v * r, axis=-1)
+
+    pDegen = uu <= eps
+    qDegen = vv <= eps
+    safeUU = np.where(pDegen, 1.0, uu)
+    safeVV = np.where(qDegen, 1.0, vv)
+
+    # Parameter on the first segment for non-parallel segments.
+    # Parallel segments use the start of the first segment.
+    denom = uu * vv - uv * uv
+    parallel = denom <= eps * uu * vv
+    a = np.clip((uv * vr - ur * vv) / np.where(parallel, 1.0, denom), 0.0, 1.0)
+    a = np.where(parallel, 0.0, a)
+
+    # Closest parameter on the second segment, then clamp and recompute the first
+    b = (uv * a + vr) / safeVV
+    aLow = np.clip(-ur / safeUU, 0.0, 1.0)
+    aHigh = np.clip((uv - ur) / safeUU, 0.0, 1.0)
+    a = np.where(b < 0.0, aLow, np.where(b > 1.0, aHigh, a))
+    b = np.clip(b, 0.0, 1.0)
+
+    # Degenerate segments reduce to point-segment distances
+    a = np.where(qDegen, aLow, a)
+    b = np.where(qDegen, 0.0, b)
+    a = np.where(pDegen, 0.0, a)
+    b = np.where(pDegen, np.clip(vr / safeVV, 0.0, 1.0), b)
+
+    D = (q0 + b[..., None] * v) - (p0 + a[..., None] * u)
+
+    return a, b, D
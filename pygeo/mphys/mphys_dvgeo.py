@@ -25,12 +25,21 @@ class OM_DVGEOCOMP(om.ExplicitComponent):
         >>> }
 
         The two setup methods cannot currently be used together.
+
+        If ``use_partials`` is True, the component is not matrix-free and all derivatives are declared as partials
+        and provided through ``compute_partials`` so that OpenMDAO can assemble them with matrix operations.
+        Linear constraints are declared with their constant sparse Jacobians.
+        The point set partials of FFD-based DVGeos are taken from the total Jacobian.
+        The local design variables are declared with the sparsity of the FFD embedding, and the global ones are dense.
+        The point sets must be added before setup, and coordinate transfers are not supported.
+        Otherwise, all derivatives are computed with ``compute_jacvec_product``.
         """
 
         self.options.declare("file", default=None)
         self.options.declare("type", default=None)
         self.options.declare("options", default=None)
         self.options.declare("DVGeoInfo", default=None)
+        self.options.declare("use_partials", default=False, types=bool)
 
     def setup(self):
         # create a constraints object to go with this DVGeo(s)
@@ -88,6 +97,116 @@ class OM_DVGEOCOMP(om.ExplicitComponent):
                 self.DVCon.setDVGeo(DVGeo, name=DVConName)
 
         self.omPtSetList = []
+        self.conPartials = []
+
+        # names of the dv inputs, constraint outputs, and point set outputs added to this component
+        self.omDVList = []
+        self.omConList = []
+        self.omPtSetOutputList = []
+        self.ptSetPartials = {}
+
+        # OpenMDAO ignores the declared partials of matrix-free components
+        self.matrix_free = not self.options["use_partials"]
+
+    def setup_partials(self):
+        if not self.options["use_partials"]:
+            return
+
+        # evaluate the constraint jacobians once to get the dvs each constraint depends on
+        funcsSens = {}
+        self.DVCon.evalFunctionsSens(funcsSens, includeLinear=True)
+
+        for constraintname in funcsSens:
+            if constraintname not in self.omConList:
+                continue
+
+            for dvname in funcsSens[constraintname]:
+                if dvname not in self.omDVList:
+                    continue
+
+                if constraintname in self.DVCon.linearCon:
+                    # linear constraint jacobians are constant, so we only declare the nonzero entries
+                    jac = np.atleast_2d(funcsSens[constraintname][dvname])
+                    rows, cols = np.nonzero(jac)
+                    self.declare_partials(constraintname, dvname, rows=rows, cols=cols, val=jac[rows, cols])
+                else:
+                    self.declare_partials(constraintname, dvname)
+                    self.conPartials.append((constraintname, dvname))
+
+        # the point set partials are taken from the jacobians wrt the DVGeo dvs, which do not include composite dvs
+        if len(self.omPtSetOutputList) > 0:
+            dvGeoNames = set()
+            for _, DVGeo in self.DVGeos.items():
+                dvGeoNames.update(DVGeo.getVarNames())
+
+            missing = [dvname for dvname in self.omDVList if dvname not in dvGeoNames]
+            if len(missing) > 0:
+                raise RuntimeError(f"Point set partials are not supported for composite DVs: {missing}")
+
+        # the point set partials are declared with the dvs of the DVGeo that owns each point set
+        self.ptSetPartials = {}
+        for ptSetName in self.omPtSetOutputList:
+            owners = [DVGeo for _, DVGeo in self.DVGeos.items() if ptSetName in DVGeo.ptSetNames]
+            if len(owners) == 0:
+                raise RuntimeError(
+                    f"The points of {ptSetName} must be added before setup to use partials. "
+                    "Pass the points to nom_add_discipline_coords or use nom_addPointSet."
+                )
+
+            self.ptSetPartials[ptSetName] = self._declarePtSetPartials(owners[0], ptSetName)
+
+    def _declarePtSetPartials(self, DVGeo, ptSetName):
+        dvNames = [dvname for dvname in DVGeo.getVarNames() if dvname in self.omDVList]
+        ptSetPartials = []
+
+        # the jacobians of the sketch-based DVGeos are dense finite difference jacobians
+        if not isinstance(DVGeo, DVGeometry):
+            for dvname in dvNames:
+                self.declare_partials(ptSetName, dvname)
+                ptSetPartials.append((dvname, None, None, None))
+            return ptSetPartials
+
+        if ptSetName in DVGeo.coordXfer:
+            raise RuntimeError(f"Partials are not supported for point sets with a coordinate transfer: {ptSetName}")
+
+        # the rows of the total jacobian that belong to each dv
+        nDV = DVGeo.getNDV()
+        dvRows = DVGeo.convertSensitivityToDict(np.arange(nDV).reshape(1, nDV), out1D=True)
+
+        globalNames = set()
+        for geo in DVGeo.getFlattenedChildren():
+            globalNames.update(geo.DV_listGlobal.keys())
+
+        # the jacobian at the initial design gives the sparsity
+        DVGeo.update(ptSetName)
+        DVGeo.computeTotalJacobian(ptSetName)
+        JT = DVGeo.JT[ptSetName]
+        if JT is not None:
+            JT = JT.tocsr()
+
+        for dvname in dvNames:
+            jtRows = dvRows[dvname].astype(int)
+
+            if dvname in globalNames:
+                # global dvs generally move all the points
+                self.declare_partials(ptSetName, dvname)
+                ptSetPartials.append((dvname, jtRows, None, None))
+                continue
+
+            # the other dvs only move the points embedded in the support of their control points.
+            # the moving points do not change with the design, but their direction does,
+            # so we declare all three coordinates of every point that moves
+            if JT is None:
+                pts = np.zeros((0, 2), int)
+            else:
+                jac = JT[jtRows].tocoo()
+                pts = np.unique(np.column_stack((jac.col // 3, jac.row)), axis=0)
+            rows = (3 * pts[:, 0][:, None] + np.arange(3)).flatten()
+            cols = np.repeat(pts[:, 1], 3)
+            self.declare_partials(ptSetName, dvname, rows=rows, cols=cols)
+            ptSetPartials.append((dvname, jtRows, rows, cols))
+
+        return ptSetPartials
 
     def compute(self, inputs, outputs):
         # check for inputs that have been added but the points have not been added to dvgeo
@@ -150,13 +269,13 @@ class OM_DVGEOCOMP(om.ExplicitComponent):
         if points is None:
             # no pointset info is provided, just do a generic i/o. We will add these points during the first compute
             self.add_input("x_%s_in" % discipline, distributed=True, shape_by_conn=True)
-            self.add_output("x_%s0" % discipline, distributed=True, copy_shape="x_%s_in" % discipline)
+            self._addPtSetOutput("x_%s0" % discipline, distributed=True, copy_shape="x_%s_in" % discipline)
 
         else:
             # we are provided with points. we can do the full initialization now
             self.nom_addPointSet(points, "x_%s0" % discipline, add_output=False, DVGeoName=DVGeoName)
             self.add_input("x_%s_in" % discipline, distributed=True, val=points.flatten())
-            self.add_output("x_%s0" % discipline, distributed=True, val=points.flatten())
+            self._addPtSetOutput("x_%s0" % discipline, distributed=True, val=points.flatten())
 
     def nom_addPointSet(self, points, ptName, add_output=True, DVGeoName=None, **kwargs):
         # if we have multiple DVGeos use the one specified by name
@@ -175,13 +294,28 @@ class OM_DVGEOCOMP(om.ExplicitComponent):
 
         if add_output:
             # add an output to the om component
-            self.add_output(ptName, distributed=True, val=points.flatten())
+            self._addPtSetOutput(ptName, distributed=True, val=points.flatten())
 
     def nom_add_point_dict(self, point_dict):
         # add every pointset in the dict, and set the ptset name as the key
         for k, v in point_dict.items():
             self.nom_addPointSet(v, k)
 
+    def _addDVInput(self, name, **kwargs):
+        # add a dv input and keep track of it to declare the partials
+        self.add_input(name, **kwargs)
+        self.omDVList.append(name)
+
+    def _addConOutput(self, name, **kwargs):
+        # add a constraint output and keep track of it to declare the partials
+        self.add_output(name, **kwargs)
+        self.omConList.append(name)
+
+    def _addPtSetOutput(self, name, **kwargs):
+        # add a point set output and keep track of it to declare the partials
+        self.add_output(name, **kwargs)
+        self.omPtSetOutputList.append(name)
+
     def nom_getDVGeo(self, childName=None, DVGeoName=None):
         """
         Gets the DVGeometry object held in the geometry component so DVGeo methods can be called directly on it
@@ -279,7 +413,7 @@ class OM_DVGEOCOMP(om.ExplicitComponent):
         # When composite DVs are used, input is not required for the default DVs. Now the composite DVs are
         # the actual DVs. So OpenMDAO don't need the default DVs as inputs.
         if not isComposite:
-            self.add_input(dvName, distributed=False, shape=len(np.atleast_1d(value)))
+            self._addDVInput(dvName, distributed=False, shape=len(np.atleast_1d(value)))
 
     def nom_addLocalDV(
         self, dvName, axis="y", pointSelect=None, childName=None, isComposite=False, DVGeoName=None, prependName=False
@@ -303,7 +437,7 @@ class OM_DVGEOCOMP(om.ExplicitComponent):
         # When composite DVs are used, input is not required for the default DVs. Now the composite DVs are
         # the actual DVs. So OpenMDAO don't need the default DVs as inputs.
         if not isComposite:
-            self.add_input(dvName, distributed=False, shape=nVal)
+            self._addDVInput(dvName, distributed=False, shape=nVal)
         return nVal
 
     def nom_addLocalSectionDV(
@@ -388,7 +522,7 @@ class OM_DVGEOCOMP(om.ExplicitComponent):
         )
 
         # define the input
-        self.add_input(dvName, distributed=False, shape=nVal)
+        self._addDVInput(dvName, distributed=False, shape=nVal)
         return nVal
 
     def nom_addShapeFunctionDV(self, dvName, shapes, childName=None, config=None, DVGeoName=None, prependName=False):
@@ -443,7 +577,7 @@ class OM_DVGEOCOMP(om.ExplicitComponent):
         nVal = DVGeo.addShapeFunctionDV(dvName, shapes, config, prependName=False)
 
         # define the input
-        self.add_input(dvName, distributed=False, shape=nVal)
+        self._addDVInput(dvName, distributed=False, shape=nVal)
         return nVal
 
     def nom_addGeoCompositeDV(
@@ -462,7 +596,7 @@ class OM_DVGEOCOMP(om.ExplicitComponent):
         val = DVGeo.getValues()
 
         # define the input
-        self.add_input(dvName, distributed=False, shape=DVGeo.getNDV(), val=val[dvName][0])
+        self._addDVInput(dvName, distributed=False, shape=DVGeo.getNDV(), val=val[dvName][0])
 
     def nom_addVSPVariable(self, component, group, parm, isComposite=False, DVGeoName=None, **kwargs):
         # if we have multiple DVGeos use the one specified by name
@@ -485,7 +619,7 @@ class OM_DVGEOCOMP(om.ExplicitComponent):
         # When composite DVs are used, input is not required for the default DVs. Now the composite DVs are
         # the actual DVs. So OpenMDAO don't need the default DVs as inputs.
         if not isComposite:
-            self.add_input(dvName, distributed=False, shape=1, val=val)
+            self._addDVInput(dvName, distributed=False, shape=1, val=val)
 
     def nom_addESPVariable(self, desmptr_name, isComposite=False, DVGeoName=None, **kwargs):
         # if we have multiple DVGeos use the one specified by name
@@ -505,7 +639,7 @@ class OM_DVGEOCOMP(om.ExplicitComponent):
         # When composite DVs are used, input is not required for the default DVs. Now the composite DVs are
         # the actual DVs. So OpenMDAO don't need the default DVs as inputs.
         if not isComposite:
-            self.add_input(desmptr_name, distributed=False, shape=val.shape, val=val)
+            self._addDVInput(desmptr_name, distributed=False, shape=val.shape, val=val)
 
     def nom_addRefAxis(self, childName=None, DVGeoName=None, **kwargs):
         # if we have multiple DVGeos use the one specified by name
@@ -548,7 +682,7 @@ class OM_DVGEOCOMP(om.ExplicitComponent):
             compNames=compNames,
             projected=projected,
         )
-        self.add_output(name, distributed=False, val=np.ones((nSpan * nChord,)), shape=nSpan * nChord)
+        self._addConOutput(name, distributed=False, val=np.ones((nSpan * nChord,)), shape=nSpan * nChord)
 
     def nom_addThicknessConstraints1D(
         self,
@@ -573,7 +707,7 @@ class OM_DVGEOCOMP(om.ExplicitComponent):
             compNames=compNames,
             projected=projected,
         )
-        self.add_output(name, distributed=False, val=np.ones(nCon), shape=nCon)
+        self._addConOutput(name, distributed=False, val=np.ones(nCon), shape=nCon)
 
     def nom_addVolumeConstraint(
         self,
@@ -625,7 +759,7 @@ class OM_DVGEOCOMP(om.ExplicitComponent):
             DVGeoName=DVGeoName,
             compNames=compNames,
         )
-        self.add_output(name, distributed=False, val=1.0)
+        self._addConOutput(name, distributed=False, val=1.0)
 
     def nom_addSurfaceAreaConstraint(
         self, name, scaled=True, surfaceName="default", DVGeoName="default", compNames=None
@@ -652,7 +786,7 @@ class OM_DVGEOCOMP(om.ExplicitComponent):
         self.DVCon.addSurfaceAreaConstraint(
             name=name, scaled=scaled, surfaceName=surfaceName, DVGeoName=DVGeoName, compNames=compNames
         )
-        self.add_output(name, distributed=False, val=1.0)
+        self._addConOutput(name, distributed=False, val=1.0)
 
     def nom_addProjectedAreaConstraint(
         self, name, axis, scaled=True, surface_name="default", DVGeoName="default", compNames=None
@@ -681,23 +815,23 @@ class OM_DVGEOCOMP(om.ExplicitComponent):
         self.DVCon.addProjectedAreaConstraint(
             axis, name=name, scaled=scaled, surfaceName=surface_name, DVGeoName=DVGeoName, compNames=compNames
         )
-        self.add_output(name, distributed=False, val=1.0)
+        self._addConOutput(name, distributed=False, val=1.0)
 
     def nom_add_LETEConstraint(self, name, volID, faceID, topID=None, childName=None):
         self.DVCon.addLeTeConstraints(volID, faceID, name=name, topID=topID, childName=childName)
         # how many are there?
         conobj = self.DVCon.linearCon[name]
         nCon = len(conobj.indSetA)
-        self.add_output(name, distributed=False, val=np.zeros((nCon,)), shape=nCon)
+        self._addConOutput(name, distributed=False, val=np.zeros((nCon,)), shape=nCon)
         return nCon
 
     def nom_addLERadiusConstraints(self, name, leList, nSpan, axis, chordDir):
         self.DVCon.addLERadiusConstraints(leList=leList, nSpan=nSpan, axis=axis, chordDir=chordDir, name=name)
-        self.add_output(name, distributed=False, val=np.ones(nSpan), shape=nSpan)
+        self._addConOutput(name, distributed=False, val=np.ones(nSpan), shape=nSpan)
 
     def nom_addCurvatureConstraint1D(self, name, start, end, nPts, axis, **kwargs):
         self.DVCon.addCurvatureConstraint1D(start=start, end=end, nPts=nPts, axis=axis, name=name, **kwargs)
-        self.add_output(name, distributed=False, val=1.0)
+        self._addConOutput(name, distributed=False, val=1.0)
 
     def nom_addLinearConstraintsShape(
         self, name, indSetA, indSetB, factorA, factorB, childName=None, DVGeoName="default"
@@ -712,7 +846,7 @@ class OM_DVGEOCOMP(om.ExplicitComponent):
             DVGeoName=DVGeoName,
         )
         lSize = len(indSetA)
-        self.add_output(name, distributed=False, val=np.zeros(lSize), shape=lSize)
+        self._addConOutput(name, distributed=False, val=np.zeros(lSize), shape=lSize)
 
     def nom_addTriangulatedSurfaceConstraint(
         self,
@@ -737,8 +871,8 @@ class OM_DVGEOCOMP(om.ExplicitComponent):
             name=name,
         )
 
-        self.add_output(f"{name}_KS", distributed=False, val=0)
-        self.add_output(f"{name}_perim", distributed=False, val=0)
+        self._addConOutput(f"{name}_KS", distributed=False, val=0)
+        self._addConOutput(f"{name}_perim", distributed=False, val=0)
 
     def nom_setConstraintSurface(
         self, surface, name="default", addToDVGeo=False, DVGeoName="default", surfFormat="point-vector"
@@ -746,21 +880,65 @@ class OM_DVGEOCOMP(om.ExplicitComponent):
         # constraint needs a triangulated reference surface at initialization
         self.DVCon.setSurface(surface, name=name, addToDVGeo=addToDVGeo, DVGeoName=DVGeoName, surfFormat=surfFormat)
 
+    def compute_partials(self, inputs, partials):
+        if not self.options["use_partials"]:
+            return
+
+        self._updateConstraintSens()
+
+        for constraintname, dvname in self.conPartials:
+            partials[constraintname, dvname] = self.constraintfuncsens[constraintname][dvname]
+
+        for _, DVGeo in self.DVGeos.items():
+            for ptSetName in DVGeo.ptSetNames:
+                if ptSetName in self.ptSetPartials:
+                    self._computePtSetPartials(DVGeo, ptSetName, inputs, partials)
+
+    def _computePtSetPartials(self, DVGeo, ptSetName, inputs, partials):
+        if not isinstance(DVGeo, DVGeometry):
+            # the forward products only multiply the stored finite difference jacobian
+            for dvname, _, _, _ in self.ptSetPartials[ptSetName]:
+                seed = np.zeros(inputs[dvname].size)
+                cols = []
+                for i in range(seed.size):
+                    seed[:] = 0.0
+                    seed[i] = 1.0
+                    cols.append(np.ravel(DVGeo.totalSensitivityProd({dvname: seed}, ptSetName)))
+                partials[ptSetName, dvname] = np.column_stack(cols)
+            return
+
+        DVGeo.computeTotalJacobian(ptSetName)
+        JT = DVGeo.JT[ptSetName]
+
+        # no points on this proc
+        if JT is None:
+            return
+
+        JT = JT.tocsr()
+        for dvname, jtRows, rows, cols in self.ptSetPartials[ptSetName]:
+            jac = JT[jtRows]
+            if rows is None:
+                partials[ptSetName, dvname] = jac.toarray().T
+            else:
+                partials[ptSetName, dvname] = np.asarray(jac[cols, rows]).flatten()
+
+    def _updateConstraintSens(self):
+        # this flag will be set to True after every compute call.
+        # if it is true, we assume the design has changed so we re-run the sensitivity update
+        # there can be hundreds of calls to compute_jacvec_product due to thickness constraints,
+        # as a result, we only run the actual sensitivity comp once and save the jacobians
+        if self.update_jac:
+            self.constraintfuncsens = dict()
+            self.DVCon.evalFunctionsSens(self.constraintfuncsens, includeLinear=True)
+            # set the flag to False so we dont run the update again if this is called w/o a compute in between
+            self.update_jac = False
+
     def compute_jacvec_product(self, inputs, d_inputs, d_outputs, mode):
         # only do the computations when we have more than zero entries in d_inputs in the reverse mode
         ni = len(list(d_inputs.keys()))
 
         if mode == "rev" and ni > 0:
-            # this flag will be set to True after every compute call.
-            # if it is true, we assume the design has changed so we re-run the sensitivity update
-            # there can be hundreds of calls to this routine due to thickness constraints,
-            # as a result, we only run the actual sensitivity comp once and save the jacobians
-            # this might be better suited with the matrix-based API
-            if self.update_jac:
-                self.constraintfuncsens = dict()
-                self.DVCon.evalFunctionsSens(self.constraintfuncsens, includeLinear=True)
-                # set the flag to False so we dont run the update again if this is called w/o a compute in between
-                self.update_jac = False
+            self._updateConstraintSens()
 
             for constraintname in self.constraintfuncsens:
                 for dvname in self.constraintfuncsens[constraintname]:
@@ -770,37 +948,68 @@ class OM_DVGEOCOMP(om.ExplicitComponent):
                         jvtmp = np.dot(np.transpose(dcdx), dout)
                         d_inputs[dvname] += jvtmp
 
+            # gather the seeds for all point sets so that we can check them with a single reduction
+            ptSetSeeds = []
             for _, DVGeo in self.DVGeos.items():
                 for ptSetName in DVGeo.ptSetNames:
                     if ptSetName in self.omPtSetList:
                         dout = d_outputs[ptSetName].reshape(len(d_outputs[ptSetName]) // 3, 3)
-
-                        # only do the calc. if d_output is not zero on ANY proc
-                        local_all_zeros = np.all(dout == 0)
-                        global_all_zeros = np.zeros(1, dtype=bool)
-                        # we need to communicate for this check otherwise we may hang
-                        self.comm.Allreduce([local_all_zeros, MPI.BOOL], [global_all_zeros, MPI.BOOL], MPI.LAND)
-
-                        # global_all_zeros is a numpy array of size 1
-                        if not global_all_zeros[0]:
-                            # TODO totalSensitivityTransProd is broken. does not work with zero surface nodes on a proc
-                            # xdot = DVGeo.totalSensitivityTransProd(dout, ptSetName)
-                            xdot = DVGeo.totalSensitivity(dout, ptSetName)
-
-                            # loop over dvs and accumulate
-                            xdotg = {}
-                            for k in xdot:
-                                # check if this dv is present
-                                if k in d_inputs:
-                                    # do the allreduce
-                                    # TODO reove the allreduce when this is fixed in openmdao
-                                    # reduce the result ourselves for now. ideally, openmdao will do the reduction itself when this is fixed. this is because the bcast is also done by openmdao (pyoptsparse, but regardless, it is not done here, so reduce should also not be done here)
-                                    xdotg[k] = self.comm.allreduce(xdot[k], op=MPI.SUM)
-
-                                    # accumulate in the dict
-                                    # TODO
-                                    # because we only do one point set at a time, we always want the 0th
-                                    # entry of this array since dvgeo always behaves like we are passing
-                                    # in multiple objective seeds with totalSensitivity. we can remove the [0]
-                                    # once we move back to totalSensitivityTransProd
-                                    d_inputs[k] += xdotg[k][0]
+                        ptSetSeeds.append((DVGeo, ptSetName, dout))
+
+            if len(ptSetSeeds) == 0:
+                return
+
+            # only do the calc. if d_output is not zero on ANY proc
+            # we need to communicate for this check otherwise we may hang
+            local_nonzero = np.array([np.any(dout != 0) for _, _, dout in ptSetSeeds], dtype=bool)
+            global_nonzero = np.zeros_like(local_nonzero)
+            self.comm.Allreduce([local_nonzero, MPI.BOOL], [global_nonzero, MPI.BOOL], MPI.LOR)
+
+            # accumulate the local contributions of all point sets for each dv
+            xdot_local = {}
+            for (DVGeo, ptSetName, dout), nonzero in zip(ptSetSeeds, global_nonzero):
+                if nonzero:
+                    # TODO totalSensitivityTransProd is broken. does not work with zero surface nodes on a proc
+                    # xdot = DVGeo.totalSensitivityTransProd(dout, ptSetName)
+                    xdot = DVGeo.totalSensitivity(dout, ptSetName)
+
+                    for k in xdot:
+                        # check if this dv is present
+                        if k in d_inputs:
+                            # dvgeo always behaves like we are passing in multiple objective seeds with
+                            # totalSensitivity, so we always want the 0th entry of this array.
+                            # we can remove the [0] once we move back to totalSensitivityTransProd
+                            if k in xdot_local:
+                                xdot_local[k] = xdot_local[k] + xdot[k][0]
+                            else:
+                                xdot_local[k] = np.array(xdot[k][0], dtype=float)
+
+            if len(xdot_local) == 0:
+                return
+
+            # TODO remove the allreduce when this is fixed in openmdao
+            # reduce the result ourselves for now. ideally, openmdao will do the reduction itself when this is fixed.
+            # this is because the bcast is also done by openmdao (pyoptsparse, but regardless,
+            # it is not done here, so reduce should also not be done here)
+            xdot_global = self._reduceSensitivities(xdot_local)
+
+            # accumulate in the dict
+            for k in xdot_global:
+                d_inputs[k] += xdot_global[k]
+
+    def _reduceSensitivities(self, xdot_local):
+        # all dvs are reduced together in a single concatenated buffer.
+        # the keys are sorted so the buffer layout is identical on all procs
+        keys = sorted(xdot_local.keys())
+        sizes = [np.size(xdot_local[k]) for k in keys]
+        xdot_local_flat = np.concatenate([np.atleast_1d(xdot_local[k]).flatten() for k in keys])
+        xdot_global_flat = np.zeros_like(xdot_local_flat)
+        self.comm.Allreduce(xdot_local_flat, xdot_global_flat, op=MPI.SUM)
+
+        # split the buffer back into the dvs
+        offsets = np.cumsum([0] + sizes)
+        xdot_global = {}
+        for i, k in enumerate(keys):
+            xdot_global[k] = xdot_global_flat[offsets[i] : offsets[i + 1]].reshape(np.shape(xdot_local[k]))
+
+        return xdot_global
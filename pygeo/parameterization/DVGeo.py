@@ -1,6 +1,7 @@
 # Standard Python modules
 from collections import OrderedDict
 import copy
+import multiprocessing
 import os
 import warnings
 
@@ -9,7 +10,7 @@ from baseclasses.utils import Error
 from mpi4py import MPI
 import numpy as np
 from pyspline import Curve
-from pyspline.utils import closeTecplot, openTecplot, writeTecplot1D, writeTecplot3D
+from pyspline.utils import closeTecplot, openTecplot, writeTecplot1D
 from scipy import sparse
 from scipy.spatial import cKDTree
 
@@ -17,6 +18,7 @@ from scipy.spatial import cKDTree
 from .. import geo_utils, pyBlock, pyNetwork
 from .BaseDVGeo import BaseDVGeometry
 from .designVars import geoDVComposite, geoDVGlobal, geoDVLocal, geoDVSectionLocal, geoDVShapeFunc, geoDVSpanwiseLocal
+from .totalJacobian import TotalJacobian
 
 
 class DVGeometry(BaseDVGeometry):
@@ -265,12 +267,7 @@ class DVGeometry(BaseDVGeometry):
         # coef type:
         tmp = np.zeros(len(self.FFD.coef), dtype=bool)
         for iVol in range(self.FFD.nVol):
-            for i in range(coefMask[iVol].shape[0]):
-                for j in range(coefMask[iVol].shape[1]):
-                    for k in range(coefMask[iVol].shape[2]):
-                        ind = self.FFD.topo.lIndex[iVol][i, j, k]
-                        if coefMask[iVol][i, j, k]:
-                            tmp[ind] = True
+            tmp[self.FFD.topo.lIndex[iVol][coefMask[iVol]]] = True
         self.masks = tmp
 
     def addRefAxis(
@@ -667,11 +664,12 @@ class DVGeometry(BaseDVGeometry):
             indSetA, indSetB = self.getSymmetricCoefList(getSymmPlane=True)
 
             # loop over the inds_to_ignore list and find the corresponding symmetries
+            symmMap = dict(zip(indSetA, indSetB))
             ignoreIndSymm = []
             for ind in ignoreInd:
                 try:
-                    tmp = indSetA.index(ind)
-                except ValueError:
+                    ind_mirror = symmMap[ind]
+                except KeyError:
                     raise Error(
                         f"""The index {ind} is not in indSetA. This is likely due to a weird
                         issue caused by the point reduction routines during initialization.
@@ -679,7 +677,6 @@ class DVGeometry(BaseDVGeometry):
                         to avoid it. The max deviation from the symmetry plane needs to be
                         less than around 1e-5 if rest of the default tolerances in pygeo is used."""
                     )
-                ind_mirror = indSetB[tmp]
                 ignoreIndSymm.append(ind_mirror)
 
             self.axis[name + "Symm"]["ignoreInd"] = ignoreIndSymm
@@ -1518,7 +1515,7 @@ class DVGeometry(BaseDVGeometry):
             if ptSetName is None:
                 raise ValueError("If u and s need to be computed, you must specify the ptSetName")
             self.computeTotalJacobian(ptSetName)
-            J_full = self.JT[ptSetName].toarray()  # this is in CSR format but we convert it to a dense matrix
+            J_full = self.JT[ptSetName].toarray()  # convert the stored Jacobian to a dense matrix
             u, s, _ = np.linalg.svd(J_full, full_matrices=False)
             scale = np.sqrt(s)
             # normalize the scaling
@@ -1664,17 +1661,17 @@ class DVGeometry(BaseDVGeometry):
 
         Returns
         -------
-        indSetA : list of ints
+        indSetA : array of ints
                   One half of the coefs to be constrained
 
-        indSetB : list of ints
+        indSetB : array of ints
                   Other half of the coefs to be constrained
         """
 
         if self.FFD.symmPlane is None:
             # nothing to be done
-            indSetA = []
-            indSetB = []
+            indSetA = np.zeros(0, "int")
+            indSetB = np.zeros(0, "int")
         else:
             # get the direction of the symmetry plane
             if self.FFD.symmPlane.lower() == "x":
@@ -1717,36 +1714,31 @@ class DVGeometry(BaseDVGeometry):
             tree = cKDTree(baseCoords)
 
             # Now search through the +ve half of the points, ignoring anything within
-            # tol of the symmetry plane to find pairs
-            indSetA = []
-            indSetB = []
-            for pt in pts:
-                if pt[index] > tol:
-                    # Now find any matching nodes within tol. there should be 2 and
-                    # only 2 if the mesh is symmetric
-                    Ind = tree.query_ball_point(pt, tol)  # should this be a separate tol
-                    if len(Ind) == 2:
-                        # check which point is on which side
-                        if pts[Ind[0], index] > 0:
-                            # first one is on the primary side
-                            indSetA.append(Ind[0])
-                            indSetB.append(Ind[1])
-                        else:
-                            # flip the order
-                            indSetA.append(Ind[1])
-                            indSetB.append(Ind[0])
-                    else:
-                        raise Error("more than 2 coefs found that match pt")
-
-                elif (abs(pt[index]) < tol) and getSymmPlane:
-                    # this point is on the symmetry plane
-                    # if everything went right so far, this should return only one point
-                    Ind = tree.query_ball_point(pt, tol)
-                    if len(Ind) == 1:
-                        indSetA.append(Ind[0])
-                        indSetB.append(Ind[0])
-                    else:
-                        raise Error("more than 1 coefs found that match pt on symmetry plane")
+            # tol of the symmetry plane to find pairs. The points on the symmetry
+            # plane are only included if requested.
+            onPlane = np.abs(pts[:, index]) < tol
+            sel = np.where((pts[:, index] > tol) | (onPlane & getSymmPlane))[0]
+            onPlane = onPlane[sel]
+
+            if len(sel) == 0:
+                return np.zeros(0, "int"), np.zeros(0, "int")
+
+            # Find all matching nodes within tol. there should be 2 and
+            # only 2 if the mesh is symmetric, and only 1 on the symmetry plane
+            nMatch = tree.query_ball_point(pts[sel], tol, return_length=True)
+            if np.any(nMatch[~onPlane] != 2):
+                raise Error("more than 2 coefs found that match pt")
+            if np.any(nMatch[onPlane] != 1):
+                raise Error("more than 1 coefs found that match pt on symmetry plane")
+
+            # The matches are then the nearest neighbours
+            _, Ind = tree.query(pts[sel], k=2)
+
+            # check which point is on which side
+            first = (pts[Ind[:, 0], index] > 0) | onPlane
+            indSetA = np.where(first, Ind[:, 0], Ind[:, 1])
+            indSetB = np.where(first, Ind[:, 1], Ind[:, 0])
+            indSetB[onPlane] = indSetA[onPlane]
 
         return indSetA, indSetB
 
@@ -2435,21 +2427,33 @@ class DVGeometry(BaseDVGeometry):
 
         # apply the coordinate transformation on dIdpt if this pointset has it.
         if ptSetName in self.coordXfer:
-            # loop over functions
-            for ifunc in range(N):
-                # its important to remember that dIdpt are vector-like values,
-                # so we don't apply the transformations and only the rotations!
-                dIdpt[ifunc] = self.coordXfer[ptSetName](dIdpt[ifunc], mode="bwd", applyDisplacement=False)
+            # its important to remember that dIdpt are vector-like values,
+            # so we don't apply the transformations and only the rotations!
+            if N > 3:
+                # The rotations are linear, so we get the 3x3 map of every point
+                # from the three unit vectors and apply it to all functions at once
+                nPts = dIdpt.shape[1]
+                rotM = np.zeros((nPts, 3, 3))
+                for idim in range(3):
+                    unitVec = np.zeros((nPts, 3))
+                    unitVec[:, idim] = 1.0
+                    rotM[:, idim, :] = self.coordXfer[ptSetName](unitVec, mode="bwd", applyDisplacement=False)
+                dIdpt = np.einsum("fpi,pij->fpj", dIdpt, rotM)
+            else:
+                # loop over functions
+                for ifunc in range(N):
+                    dIdpt[ifunc] = self.coordXfer[ptSetName](dIdpt[ifunc], mode="bwd", applyDisplacement=False)
 
         # generate the total Jacobian self.JT
         self.computeTotalJacobian(ptSetName, config=config)
 
         # now that we have self.JT compute the Mat-Mat multiplication
+        # with all the functions at once
         nDV = self._getNDV()
-        dIdx_local = np.zeros((N, nDV), "d")
-        for i in range(N):
-            if self.JT[ptSetName] is not None:
-                dIdx_local[i, :] = self.JT[ptSetName].dot(dIdpt[i, :, :].flatten())
+        if self.JT[ptSetName] is not None:
+            dIdx_local = self.JT[ptSetName].dot(dIdpt.reshape(N, -1).T).T
+        else:
+            dIdx_local = np.zeros((N, nDV), "d")
 
         if comm:  # If we have a comm, globaly reduce with sum
             dIdx = comm.allreduce(dIdx_local, op=MPI.SUM)
@@ -2539,7 +2543,7 @@ class DVGeometry(BaseDVGeometry):
         if self.JT[ptSetName] is None:
             xsdot = np.zeros((0, 3))
         else:
-            xsdot = self.JT[ptSetName].T.dot(newvec)
+            xsdot = self.JT[ptSetName].transDot(newvec)
             xsdot.reshape(len(xsdot) // 3, 3)
 
             # check if we have a coordinate transformation on this ptset
@@ -2693,8 +2697,12 @@ class DVGeometry(BaseDVGeometry):
         return dCoefdDV
 
     def computeTotalJacobian(self, ptSetName, config=None):
-        """Return the total point jacobian in CSR format since we
-        need this for TACS"""
+        """Compute the total point jacobian and store its transpose in
+        ``self.JT[ptSetName]``. At the top FFD level this is a
+        :class:`TotalJacobian`, with the global DVs in a dense block and
+        the local DVs in a sparse block. Use ``JT.tocsr()`` to get a CSR
+        matrix, e.g. for TACS, or ``JT.toarray()`` for a dense array.
+        """
 
         # Finalize the object, if not done yet
         self._finalize()
@@ -2709,33 +2717,7 @@ class DVGeometry(BaseDVGeometry):
 
         # now get the derivative of the points for this level wrt the coefficients(dPtdCoef)
         if self.FFD.embeddedVolumes[ptSetName].dPtdCoef is not None:
-            dPtdCoef = self.FFD.embeddedVolumes[ptSetName].dPtdCoef.tocoo()
-            # We have a slight problem...dPtdCoef only has the shape
-            # functions, so it size Npt x Coef. We need a matrix of
-            # size 3*Npt x 3*nCoef, where each non-zero entry of
-            # dPtdCoef is replaced by value * 3x3 Identity matrix.
-
-            # Extract IJV Triplet from dPtdCoef
-            row = dPtdCoef.row
-            col = dPtdCoef.col
-            data = dPtdCoef.data
-
-            new_row = np.zeros(3 * len(row), "int")
-            new_col = np.zeros(3 * len(row), "int")
-            new_data = np.zeros(3 * len(row))
-
-            # Loop over each entry and expand:
-            for j in range(3):
-                new_data[j::3] = data
-                new_row[j::3] = row * 3 + j
-                new_col[j::3] = col * 3 + j
-
-            # Size of New Matrix:
-            Nrow = dPtdCoef.shape[0] * 3
-            Ncol = dPtdCoef.shape[1] * 3
-
-            # Create new matrix in coo-dinate format and convert to csr
-            new_dPtdCoef = sparse.coo_matrix((new_data, (new_row, new_col)), shape=(Nrow, Ncol)).tocsr()
+            new_dPtdCoef = self._getExpandeddPtdCoef(ptSetName)
 
             # Do Sparse Mat-Mat multiplication and resort indices
             if dCoefdDV is not None:
@@ -2757,9 +2739,93 @@ class DVGeometry(BaseDVGeometry):
         else:
             self.JT[ptSetName] = None
 
-    def computeTotalJacobianCS(self, ptSetName, config=None):
-        """Return the total point jacobian in CSR format since we
-        need this for TACS"""
+        self._storeTotalJacobian(ptSetName)
+
+    def _storeTotalJacobian(self, ptSetName):
+        """
+        Store the total Jacobian of the top level FFD as a TotalJacobian,
+        with a dense block for the global DVs and a sparse block for the
+        local DVs. Children keep the raw matrix so that it can be added
+        to the parent Jacobian.
+        """
+        if not self.isChild and self.JT[ptSetName] is not None:
+            self.JT[ptSetName] = TotalJacobian(self.JT[ptSetName], self._getNDVGlobal())
+
+    def getJacobianMemory(self):
+        """
+        Return the memory used by the stored total Jacobians
+
+        Returns
+        -------
+        memory : dict
+            Dictionary with the number of bytes used by the Jacobian of
+            each point set. Point sets with no up-to-date Jacobian are
+            not included.
+        """
+        memory = {}
+        for ptSetName, JT in self.JT.items():
+            if JT is not None:
+                memory[ptSetName] = JT.nbytes
+        return memory
+
+    def _getExpandeddPtdCoef(self, ptSetName):
+        """
+        Return dPtdCoef for the point set expanded to the three
+        coordinate directions, in CSR format.
+        """
+        dPtdCoef = self.FFD.embeddedVolumes[ptSetName].dPtdCoef.tocoo()
+        # We have a slight problem...dPtdCoef only has the shape
+        # functions, so it size Npt x Coef. We need a matrix of
+        # size 3*Npt x 3*nCoef, where each non-zero entry of
+        # dPtdCoef is replaced by value * 3x3 Identity matrix.
+
+        # Extract IJV Triplet from dPtdCoef
+        row = dPtdCoef.row
+        col = dPtdCoef.col
+        data = dPtdCoef.data
+
+        new_row = np.zeros(3 * len(row), "int")
+        new_col = np.zeros(3 * len(row), "int")
+        new_data = np.zeros(3 * len(row))
+
+        # Loop over each entry and expand:
+        for j in range(3):
+            new_data[j::3] = data
+            new_row[j::3] = row * 3 + j
+            new_col[j::3] = col * 3 + j
+
+        # Size of New Matrix:
+        Nrow = dPtdCoef.shape[0] * 3
+        Ncol = dPtdCoef.shape[1] * 3
+
+        # Create new matrix in coo-dinate format and convert to csr
+        return sparse.coo_matrix((new_data, (new_row, new_col)), shape=(Nrow, Ncol)).tocsr()
+
+    def computeTotalJacobianCS(self, ptSetName, config=None, comm=None, nProcs=1):
+        """Compute the total point jacobian with complex step and store
+        its transpose in ``self.JT[ptSetName]``. At the top FFD level
+        this is a :class:`TotalJacobian`; use ``JT.tocsr()`` to get a CSR
+        matrix, e.g. for TACS, or ``JT.toarray()`` for a dense array.
+
+        Parameters
+        ----------
+        ptSetName : str
+            The name of the point set
+        config : str or list
+            The configuration to use
+        comm : MPI.IntraComm
+            If given, the design variable columns are split across the
+            ranks of this communicator and the perturbed FFD
+            coefficients are exchanged, so each rank only evaluates its
+            own points.
+        nProcs : int
+            Number of forked worker processes the design variable
+            columns are split across when running in serial. Only used
+            if comm is None or has a single rank. Forking a process that
+            runs MPI is unsafe with many MPI builds, so nProcs > 1 is only
+            allowed if MPI is not initialized or MPI.COMM_WORLD has a
+            single rank.
+        """
 
         self._finalize()
         self.curPtSet = ptSetName
@@ -2767,6 +2833,10 @@ class DVGeometry(BaseDVGeometry):
         if self.JT[ptSetName] is not None:
             return
 
+        if self._useDistributedJacobian(comm, nProcs):
+            self._computeTotalJacobianDistributed(ptSetName, "cs", config, comm, nProcs)
+            return
+
         if self.isChild:
             refFFDCoef = copy.copy(self.FFD.coef)
             refCoef = copy.copy(self.coef)
@@ -2802,59 +2872,70 @@ class DVGeometry(BaseDVGeometry):
                 self.DV_listGlobal[key].value[j] = refVal
 
         self._unComplexifyCoef()
-        for key in self.DV_listSpanwiseLocal:
-            for j in range(self.DV_listSpanwiseLocal[key].nVal):
-                if self.isChild:
-                    self.FFD.coef = refFFDCoef.copy()
-                    self.coef = refCoef.copy()
-                    self.refAxis.coef = refCoef.copy()
-                    self.refAxis._updateCurveCoef()
-
-                refVal = self.DV_listSpanwiseLocal[key].value[j]
-
-                self.DV_listSpanwiseLocal[key].value[j] += h
-                deriv = np.imag(self._update_deriv_cs(ptSetName, config=config).flatten()) / np.imag(h)
-
-                self.JT[ptSetName][DVSpanLocCount, :] = deriv
-
-                DVSpanLocCount += 1
-                self.DV_listSpanwiseLocal[key].value[j] = refVal
 
-        for key in self.DV_listSectionLocal:
-            for j in range(self.DV_listSectionLocal[key].nVal):
-                if self.isChild:
-                    self.FFD.coef = refFFDCoef.copy()
-                    self.coef = refCoef.copy()
-                    self.refAxis.coef = refCoef.copy()
-                    self.refAxis._updateCurveCoef()
-
-                refVal = self.DV_listSectionLocal[key].value[j]
+        # The spanwise, section and local variables are simply added to the
+        # coefficients, so each column only touches the points in the support of
+        # the coefficients it perturbs. We complex step the coefficient update
+        # and only map the non-zero coefficients through dPtdCoef. With child
+        # FFDs, the points also move through the children, so the full update is
+        # complex stepped instead.
+        dPtdCoef = self.FFD.embeddedVolumes[ptSetName].dPtdCoef
+        if len(self.children) == 0 and dPtdCoef is not None:
+            dPtdCoef = dPtdCoef.tocsc()
+            nCoef = dPtdCoef.shape[1]
+            coefRotM = {coef: np.real(rotM) for coef, rotM in self.coefRotM.items()}
+
+            for DVList, iDV in [
+                (self.DV_listSpanwiseLocal, DVSpanLocCount),
+                (self.DV_listSectionLocal, DVSecLocCount),
+                (self.DV_listLocal, DVLocalCount),
+            ]:
+                for key in DVList:
+                    for j in range(DVList[key].nVal):
+                        refVal = DVList[key].value[j]
+                        DVList[key].value[j] += h
+
+                        dCoef = np.zeros((nCoef, 3), "D")
+                        if DVList is self.DV_listSectionLocal:
+                            DVList[key].updateComplex(dCoef, coefRotM, config)
+                        else:
+                            DVList[key].updateComplex(dCoef, config)
+                        dCoef = np.imag(dCoef) / np.imag(h)
 
-                self.DV_listSectionLocal[key].value[j] += h
-                deriv = np.imag(self._update_deriv_cs(ptSetName, config=config).flatten()) / np.imag(h)
+                        DVList[key].value[j] = refVal
 
-                self.JT[ptSetName][DVSecLocCount, :] = deriv
+                        # Only the points in the support of the perturbed coefficients
+                        coefInd = np.where(np.any(dCoef != 0.0, axis=1))[0]
+                        support = dPtdCoef[:, coefInd].tocoo()
+                        ptInd = 3 * support.row[:, None] + np.arange(3)
+                        deriv = support.data[:, None] * dCoef[coefInd[support.col]]
+                        np.add.at(self.JT[ptSetName][iDV], ptInd.ravel(), deriv.ravel())
 
-                DVSecLocCount += 1
-                self.DV_listSectionLocal[key].value[j] = refVal
+                        iDV += 1
 
-        for key in self.DV_listLocal:
-            for j in range(self.DV_listLocal[key].nVal):
-                if self.isChild:
-                    self.FFD.coef = refFFDCoef.copy()
-                    self.coef = refCoef.copy()
-                    self.refAxis.coef = refCoef.copy()
-                    self.refAxis._updateCurveCoef()
+        elif len(self.children) > 0:
+            for DVList, iDV in [
+                (self.DV_listSpanwiseLocal, DVSpanLocCount),
+                (self.DV_listSectionLocal, DVSecLocCount),
+                (self.DV_listLocal, DVLocalCount),
+            ]:
+                for key in DVList:
+                    for j in range(DVList[key].nVal):
+                        if self.isChild:
+                            self.FFD.coef = refFFDCoef.copy()
+                            self.coef = refCoef.copy()
+                            self.refAxis.coef = refCoef.copy()
+                            self.refAxis._updateCurveCoef()
 
-                refVal = self.DV_listLocal[key].value[j]
+                        refVal = DVList[key].value[j]
 
-                self.DV_listLocal[key].value[j] += h
-                deriv = np.imag(self._update_deriv_cs(ptSetName, config=config).flatten()) / np.imag(h)
+                        DVList[key].value[j] += h
+                        deriv = np.imag(self._update_deriv_cs(ptSetName, config=config).flatten()) / np.imag(h)
 
-                self.JT[ptSetName][DVLocalCount, :] = deriv
+                        self.JT[ptSetName][iDV, :] = deriv
 
-                DVLocalCount += 1
-                self.DV_listLocal[key].value[j] = refVal
+                        iDV += 1
+                        DVList[key].value[j] = refVal
 
         for childName, child in self.children.items():
             child._finalize()
@@ -2869,6 +2950,8 @@ class DVGeometry(BaseDVGeometry):
             child.computeTotalJacobianCS(ptSetName, config=config)
             self.JT[ptSetName] = self.JT[ptSetName] + child.JT[ptSetName]
 
+        self._storeTotalJacobian(ptSetName)
+
     def addVariablesPyOpt(
         self,
         optProb,
@@ -3001,31 +3084,46 @@ class DVGeometry(BaseDVGeometry):
                 optProb, globalVars, localVars, sectionlocalVars, spanwiselocalVars, ignoreVars, freezeVars
             )
 
-    def writeTecplot(self, fileName, solutionTime=None):
+    def writeTecplot(self, fileName, solutionTime=None, fileType="ascii"):
         """Write the (deformed) current state of the FFD's to a tecplot file,
         including the children
 
         Parameters
         ----------
         fileName : str
-           Filename for tecplot file. Should have a .dat extension
+           Filename for tecplot file. Should have a .dat extension, or a .plt
+           extension for binary files
         SolutionTime : float
             Solution time to write to the file. This could be a fictitious time to
             make visualization easier in tecplot.
+        fileType : {'ascii', 'binary'}
+            The format of the tecplot file. Binary files are written with
+            :func:`geo_utils.writeTecplotBinaryFile` and are much faster to write
+            for large FFDs, so they are better suited to files written at every
+            iteration.
         """
+        if fileType not in ["ascii", "binary"]:
+            raise ValueError(f"Unknown tecplot file type {fileType}")
 
         # Name here doesn't matter, just take the first one
         if len(self.points) > 0:
             keyToUpdate = list(self.points.keys())[0]
             self.update(keyToUpdate, childDelta=False)
 
-        f = openTecplot(fileName, 3)
+        # The zones of binary files are collected and written at once
+        if fileType == "binary":
+            f = []
+        else:
+            f = openTecplot(fileName, 3)
         vol_counter = 0
 
         # Write master volumes:
         vol_counter += self._writeVols(f, vol_counter, solutionTime)
 
-        closeTecplot(f)
+        if fileType == "binary":
+            geo_utils.writeTecplotBinaryFile(fileName, f)
+        else:
+            closeTecplot(f)
         if len(self.points) > 0:
             self.update(keyToUpdate, childDelta=True)
 
@@ -3098,7 +3196,7 @@ class DVGeometry(BaseDVGeometry):
             writeTecplot1D(f, name, coords, solutionTime)
             closeTecplot(f)
 
-    def writePlot3d(self, fileName):
+    def writePlot3d(self, fileName, fileType="ascii"):
         """Write the (deformed) current state of the FFD object into a
         plot3D file. This file could then be used as the base-line FFD
         for a subsequent optimization. This function is not typically
@@ -3110,8 +3208,10 @@ class DVGeometry(BaseDVGeometry):
         fileName : str
             Filename of the plot3D file to write. Should have a .fmt
             file extension.
+        fileType : {'ascii', 'binary', 'fortran', 'npz'}
+            Format of the file, see :func:`geo_utils.writePlot3DFile`.
         """
-        self.FFD.writePlot3dCoef(fileName)
+        self.FFD.writePlot3dCoef(fileName, fileType=fileType)
 
     def updatePyGeo(self, geo, outputType, fileName, nRefU=0, nRefV=0):
         """Deform a pyGeo object and write to a file of specified type
@@ -3462,17 +3562,11 @@ class DVGeometry(BaseDVGeometry):
         # Loop over the axis we have:
         for key in self.axis:
             vol_list = np.atleast_1d(self.axis[key]["volumes"]).astype("intc")
-            temp = []
-            for iVol in vol_list:
-                for i in range(self.FFD.vols[iVol].nCtlu):
-                    for j in range(self.FFD.vols[iVol].nCtlv):
-                        for k in range(self.FFD.vols[iVol].nCtlw):
-                            ind = self.FFD.topo.lIndex[iVol][i, j, k]
-                            if (not coefMask[ind]) and (ind not in self.axis[key]["ignoreInd"]):
-                                temp.append(ind)
+            temp = np.concatenate([self.FFD.topo.lIndex[iVol].flatten() for iVol in vol_list])
+            keep = ~coefMask[temp] & ~np.isin(temp, np.array(self.axis[key]["ignoreInd"], dtype="intc"))
 
             # Unique the values and append to the master list
-            curPtAttach = geo_utils.unique(temp)
+            curPtAttach = np.unique(temp[keep])
             self.ptAttachInd.extend(curPtAttach)
 
             curPts = self.FFD.coef.take(curPtAttach, axis=0).real
@@ -3524,18 +3618,23 @@ class DVGeometry(BaseDVGeometry):
             self.curveIDNames.append(axisKeys[self.curveIDs[i]])
 
         self.links_s = np.array(s)
-        self.links_x = []
-        self.links_n = []
+        self.links_x = np.zeros((self.nPtAttach, 3))
+        self.links_n = np.zeros((self.nPtAttach, 3))
+
+        # Evaluate the curve values and derivatives for all the points attached to each curve at once
+        curveIDs = np.array(curveIDs, dtype="intc")
+        ptAttach = np.array(self.ptAttach).reshape((-1, 3))
+        for icurve in np.unique(curveIDs):
+            ind = np.where(curveIDs == icurve)[0]
+            curve = self.refAxis.curves[icurve]
+            curS = self.links_s[ind]
+
+            self.links_x[ind] = ptAttach[ind] - geo_utils.curveValues(curve.t, curve.k, curve.coef.real, curS)
+            tDeriv, kDeriv, coefDeriv = geo_utils.derivativeCurve(curve.t, curve.k, curve.coef.real)
+            deriv = geo_utils.curveValues(tDeriv, kDeriv, coefDeriv, curS)
+            deriv /= np.sqrt(np.sum(deriv * deriv, axis=1))[:, None]  # Normalize
+            self.links_n[ind] = np.cross(deriv, self.links_x[ind])
 
-        for i in range(self.nPtAttach):
-            self.links_x.append(self.ptAttach[i] - self.refAxis.curves[self.curveIDs[i]](s[i]))
-            deriv = self.refAxis.curves[self.curveIDs[i]].getDerivative(self.links_s[i])
-            deriv /= geo_utils.euclideanNorm(deriv)  # Normalize
-            self.links_n.append(np.cross(deriv, self.links_x[-1]))  # using the element just appended to self.links_x
-
-        self.links_x = np.array(self.links_x)
-        self.links_s = np.array(self.links_s)
-        self.links_n = np.array(self.links_n)
         self.finalized = True
 
     def _setInitialValues(self):
@@ -3850,8 +3949,8 @@ class DVGeometry(BaseDVGeometry):
 
         # Apply the real and complex parts separately
         for key in self.DV_listSpanwiseLocal:
-            self.DV_listSpanwiseLocal[key](self.FFD.coef, self.coefRotM, config)
-            self.DV_listSpanwiseLocal[key].updateComplex(self.FFD.coef, self.coefRotM, config)
+            self.DV_listSpanwiseLocal[key](self.FFD.coef, config)
+            self.DV_listSpanwiseLocal[key].updateComplex(self.FFD.coef, config)
 
         for key in self.DV_listSectionLocal:
             self.DV_listSectionLocal[key](self.FFD.coef, self.coefRotM, config)
@@ -3946,12 +4045,15 @@ class DVGeometry(BaseDVGeometry):
 
             self.coef = self.coef.real.astype("d")
 
-    def computeTotalJacobianFD(self, ptSetName, config=None):
+    def computeTotalJacobianFD(self, ptSetName, config=None, comm=None, nProcs=1):
         """This function takes the total derivative of an objective,
         I, with respect the points controlled on this processor using FD.
         We take the transpose prodducts and mpi_allreduce them to get the
         resulting value on each processor. Note that this function is slow
         and should eventually be replaced by an analytic version.
+
+        The comm and nProcs arguments distribute the design variable
+        columns in the same way as :func:`computeTotalJacobianCS`.
         """
 
         self._finalize()
@@ -3960,6 +4062,10 @@ class DVGeometry(BaseDVGeometry):
         if self.JT[ptSetName] is not None:
             return
 
+        if self._useDistributedJacobian(comm, nProcs):
+            self._computeTotalJacobianDistributed(ptSetName, "fd", config, comm, nProcs)
+            return
+
         if self.isChild:
             refFFDCoef = copy.copy(self.FFD.coef)
             refCoef = copy.copy(self.coef)
@@ -4071,6 +4177,145 @@ class DVGeometry(BaseDVGeometry):
             child.computeTotalJacobianFD(ptSetName, config=config)
             self.JT[ptSetName] = self.JT[ptSetName] + child.JT[ptSetName]
 
+        self._storeTotalJacobian(ptSetName)
+
+    def _useDistributedJacobian(self, comm, nProcs):
+        """
+        Check if the CS/FD Jacobian should be computed with the design
+        variable columns distributed. This is only supported for a
+        single FFD level, otherwise the serial path is used.
+        The process pool is only allowed if MPI runs on a single rank.
+        """
+        if self.isChild or len(self.children) > 0:
+            return False
+        if comm is not None and comm.size > 1:
+            return True
+        if nProcs > 1 and MPI.Is_initialized() and MPI.COMM_WORLD.size > 1:
+            raise Error(
+                "nProcs > 1 forks worker processes, which is not supported when running with several MPI ranks. "
+                "Pass comm to distribute the Jacobian columns across the ranks instead."
+            )
+        return nProcs > 1
+
+    def _getDVColumns(self):
+        """
+        Return a list of (DV dictionary, key, index) tuples for all the
+        design variables of this level, ordered by their global index.
+        """
+        DVGlobalCount, DVLocalCount, DVSecLocCount, DVSpanLocCount = self._getDVOffsets()
+
+        columns = [None] * self.nDV_T
+        for DVList, iDV in [
+            (self.DV_listGlobal, DVGlobalCount),
+            (self.DV_listSpanwiseLocal, DVSpanLocCount),
+            (self.DV_listSectionLocal, DVSecLocCount),
+            (self.DV_listLocal, DVLocalCount),
+        ]:
+            for key in DVList:
+                for j in range(DVList[key].nVal):
+                    columns[iDV] = (DVList, key, j)
+                    iDV += 1
+
+        return columns
+
+    def _getCoefComplex(self, config=None):
+        """
+        Apply all the design variables to the FFD coefficients with the
+        complex parts propagated, without evaluating any point set.
+        """
+        self._complexifyCoef()
+        self.FFD.coef = self.origFFDCoef.astype("D")
+        self._setInitialValues()
+
+        if len(self.axis) > 0:
+            new_pts = np.zeros((self.nPtAttach, 3), "D")
+            self.updateCalculations(new_pts, isComplex=True, config=config)
+
+            # Put the update FFD points in their proper place
+            np.put(self.FFD.coef[:, 0], self.ptAttachInd, new_pts[:, 0])
+            np.put(self.FFD.coef[:, 1], self.ptAttachInd, new_pts[:, 1])
+            np.put(self.FFD.coef[:, 2], self.ptAttachInd, new_pts[:, 2])
+
+        # Apply the real and complex parts separately
+        for key in self.DV_listSpanwiseLocal:
+            self.DV_listSpanwiseLocal[key](self.FFD.coef, config)
+            self.DV_listSpanwiseLocal[key].updateComplex(self.FFD.coef, config)
+
+        for key in self.DV_listSectionLocal:
+            self.DV_listSectionLocal[key](self.FFD.coef, self.coefRotM, config)
+            self.DV_listSectionLocal[key].updateComplex(self.FFD.coef, self.coefRotM, config)
+
+        for key in self.DV_listLocal:
+            self.DV_listLocal[key](self.FFD.coef, config)
+            self.DV_listLocal[key].updateComplex(self.FFD.coef, config)
+
+        return self.FFD.coef.copy()
+
+    def _computeCoefJacobianColumns(self, iDVs, mode, config=None):
+        """
+        Compute the columns iDVs of the FFD coefficient Jacobian with
+        complex step (mode="cs") or finite differences (mode="fd").
+        Returns an array of size len(iDVs) x 3*nCoef.
+        """
+        columns = self._getDVColumns()
+
+        if mode == "cs":
+            h = 1e-40j
+        else:
+            h = 1e-6
+            coef0 = self._getCoefComplex(config).real.flatten()
+
+        dCoefdDV = np.zeros((len(iDVs), 3 * self.FFD.coef.shape[0]))
+        for i, iDV in enumerate(iDVs):
+            DVList, key, j = columns[iDV]
+            refVal = DVList[key].value[j]
+            DVList[key].value[j] += h
+
+            coef = self._getCoefComplex(config).flatten()
+            if mode == "cs":
+                dCoefdDV[i] = np.imag(coef) / np.imag(h)
+            else:
+                dCoefdDV[i] = (coef.real - coef0) / h
+
+            DVList[key].value[j] = refVal
+
+        return dCoefdDV
+
+    def _computeTotalJacobianDistributed(self, ptSetName, mode, config, comm, nProcs):
+        """
+        Compute the CS or FD total Jacobian with the design variable
+        columns distributed across the ranks of comm, or across a pool
+        of nProcs forked processes in serial. Only the FFD coefficient
+        derivatives are perturbed per column; each rank then maps them
+        to its own points with dPtdCoef.
+        """
+        self._getDVOffsets()
+        iDVs = np.arange(self.nDV_T)
+
+        if comm is not None and comm.size > 1:
+            myDVs = np.array_split(iDVs, comm.size)[comm.rank]
+            dCoefdDV = np.vstack(comm.allgather(self._computeCoefJacobianColumns(myDVs, mode, config)))
+        else:
+            chunks = [chunk for chunk in np.array_split(iDVs, nProcs) if len(chunk) > 0]
+            # fork so the workers inherit this object instead of pickling it
+            ctx = multiprocessing.get_context("fork")
+            with ctx.Pool(len(chunks), initializer=_initJacobianWorker, initargs=(self, mode, config)) as pool:
+                dCoefdDV = np.vstack(pool.map(_computeJacobianWorker, chunks))
+
+        # Restore the unperturbed, real coefficients
+        self.FFD.coef = self._getCoefComplex(config).real
+        self._unComplexifyCoef()
+        self.FFD._updateVolumeCoef()
+
+        if self.FFD.embeddedVolumes[ptSetName].dPtdCoef is not None:
+            new_dPtdCoef = self._getExpandeddPtdCoef(ptSetName)
+            self.JT[ptSetName] = (sparse.csr_matrix(dCoefdDV) * new_dPtdCoef.T).tocsr()
+            self.nPts[ptSetName] = self.JT[ptSetName].shape[1]
+        else:
+            self.JT[ptSetName] = None
+
+        self._storeTotalJacobian(ptSetName)
+
     def _attachedPtJacobian(self, config):
         """
         Compute the derivative of the the attached points
@@ -4562,9 +4807,9 @@ class DVGeometry(BaseDVGeometry):
 
     def _writeVols(self, handle, vol_counter, solutionTime):
         for i in range(len(self.FFD.vols)):
-            writeTecplot3D(handle, "FFD_vol%d" % i, self.FFD.vols[i].coef, solutionTime)
+            geo_utils.writeTecplot3DZone(handle, "FFD_vol%d" % i, self.FFD.vols[i].coef, solutionTime)
             self.FFD.vols[i].computeData(recompute=True)
-            writeTecplot3D(handle, "embedding_vol", self.FFD.vols[i].data, solutionTime)
+            geo_utils.writeTecplot3DZone(handle, "embedding_vol", self.FFD.vols[i].data, solutionTime)
             vol_counter += 1
 
         # Write children volumes:
@@ -4573,30 +4818,54 @@ class DVGeometry(BaseDVGeometry):
 
         return vol_counter
 
-    def checkDerivatives(self, ptSetName):
+    def checkDerivatives(self, ptSetName, mode="fd", h=None, tol=1e-6, nSample=None, seed=0, verbose=True):
         """
-        Run a brute force FD check on ALL design variables
+        Run a brute force FD or CS check on ALL design variables
 
         Parameters
         ----------
         ptSetName : str
             name of the point set to check
+        mode : str
+            "fd" to compare against forward differences or "cs" to
+            compare against the complex step
+        h : float
+            Step size. Defaults to 1e-6 for FD and 1e-40 for CS.
+        tol : float
+            An entry is flagged when both its absolute and relative
+            errors exceed tol. Global variables use 10*tol.
+        nSample : int
+            If given, only check a random subset of nSample point
+            coordinates, which is useful for large point sets
+        seed : int
+            Seed for the random subset
+        verbose : bool
+            Print a summary line for every design variable
+
+        Returns
+        -------
+        report : dict
+            Dictionary keyed by design variable name. Each entry holds
+            arrays of length nVal with the maximum absolute error
+            ("maxAbsErr"), the maximum relative error ("maxRelErr") and
+            the relative 2-norm of the error ("relNormErr"), and a list
+            with the flagged coordinate indices of each value
+            ("indices").
         """
 
-        print("Computing Analytic Jacobian...")
+        if verbose:
+            print("Computing Analytic Jacobian...")
         self.zeroJacobians(ptSetName)
         for child in self.children.values():
             child.zeroJacobians(ptSetName)
 
         self.computeTotalJacobian(ptSetName)
-        # self.computeTotalJacobian_fast(ptSetName)
-
-        Jac = copy.deepcopy(self.JT[ptSetName])
 
-        # Global Variables
-        print("========================================")
-        print("             Global Variables           ")
-        print("========================================")
+        Jac = self.JT[ptSetName]
+        if isinstance(Jac, TotalJacobian):
+            Jac = Jac.tocsr()
+        elif Jac is not None and not sparse.issparse(Jac):
+            Jac = sparse.csr_matrix(Jac)
 
         if self.isChild:
             refFFDCoef = copy.copy(self.FFD.coef)
@@ -4604,130 +4873,100 @@ class DVGeometry(BaseDVGeometry):
 
         coords0 = self.update(ptSetName).flatten()
 
-        h = 1e-6
+        # Pick the coordinates to check
+        if nSample is not None and nSample < len(coords0):
+            rng = np.random.default_rng(seed)
+            sample = np.sort(rng.choice(len(coords0), nSample, replace=False))
+        else:
+            sample = np.arange(len(coords0))
+        coords0 = coords0[sample]
+
+        if mode == "cs":
+            if h is None:
+                h = 1e-40
+            step = h * 1j
+        else:
+            if h is None:
+                h = 1e-6
+            step = h
 
         # figure out the split between local and global Variables
         DVCountGlob, DVCountLoc, DVCountSecLoc, DVCountSpanLoc = self._getDVOffsets()
 
-        for key in self.DV_listGlobal:
-            for j in range(self.DV_listGlobal[key].nVal):
-                print("========================================")
-                print("      GlobalVar(%s), Value(%d)" % (key, j))
-                print("========================================")
-
-                if self.isChild:
-                    self.FFD.coef = refFFDCoef.copy()
-                    self.coef = refCoef.copy()
-                    self.refAxis.coef = self.coef.copy()
-                    self.refAxis._updateCurveCoef()
-
-                refVal = self.DV_listGlobal[key].value[j]
-
-                self.DV_listGlobal[key].value[j] += h
-
-                coordsph = self.update(ptSetName).flatten()
-
-                deriv = (coordsph - coords0) / h
-
-                for ii in range(len(deriv)):
-                    relErr = (deriv[ii] - Jac[DVCountGlob, ii]) / (1e-16 + Jac[DVCountGlob, ii])
-                    absErr = deriv[ii] - Jac[DVCountGlob, ii]
-
-                    if abs(relErr) > h * 10 and abs(absErr) > h * 10:
-                        print(ii, deriv[ii], Jac[DVCountGlob, ii], relErr, absErr)
-
-                DVCountGlob += 1
-                self.DV_listGlobal[key].value[j] = refVal
-
-        for key in self.DV_listLocal:
-            for j in range(self.DV_listLocal[key].nVal):
-                print("========================================")
-                print("      LocalVar(%s), Value(%d)           " % (key, j))
-                print("========================================")
-
-                if self.isChild:
-                    self.FFD.coef = refFFDCoef.copy()
-                    self.coef = refCoef.copy()
-                    self.refAxis.coef = self.coef.copy()
-                    self.refAxis._updateCurveCoef()
-
-                refVal = self.DV_listLocal[key].value[j]
-
-                self.DV_listLocal[key].value[j] += h
-                coordsph = self.update(ptSetName).flatten()
-
-                deriv = (coordsph - coords0) / h
-
-                for ii in range(len(deriv)):
-                    relErr = (deriv[ii] - Jac[DVCountLoc, ii]) / (1e-16 + Jac[DVCountLoc, ii])
-                    absErr = deriv[ii] - Jac[DVCountLoc, ii]
-
-                    if abs(relErr) > h and abs(absErr) > h:
-                        print(ii, deriv[ii], Jac[DVCountLoc, ii], relErr, absErr)
-
-                DVCountLoc += 1
-                self.DV_listLocal[key].value[j] = refVal
-
-        for key in self.DV_listSectionLocal:
-            for j in range(self.DV_listSectionLocal[key].nVal):
-                print("========================================")
-                print("   SectionLocalVar(%s), Value(%d)       " % (key, j))
-                print("========================================")
-
-                if self.isChild:
-                    self.FFD.coef = refFFDCoef.copy()
-                    self.coef = refCoef.copy()
-                    self.refAxis.coef = self.coef.copy()
-                    self.refAxis._updateCurveCoef()
-
-                refVal = self.DV_listSectionLocal[key].value[j]
-
-                self.DV_listSectionLocal[key].value[j] += h
-                coordsph = self.update(ptSetName).flatten()
-
-                deriv = (coordsph - coords0) / h
-
-                for ii in range(len(deriv)):
-                    relErr = (deriv[ii] - Jac[DVCountSecLoc, ii]) / (1e-16 + Jac[DVCountSecLoc, ii])
-                    absErr = deriv[ii] - Jac[DVCountSecLoc, ii]
-
-                    if abs(relErr) > h and abs(absErr) > h:
-                        print(ii, deriv[ii], Jac[DVCountSecLoc, ii], relErr, absErr)
-
-                DVCountSecLoc += 1
-                self.DV_listSectionLocal[key].value[j] = refVal
-
-        for key in self.DV_listSpanwiseLocal:
-            for j in range(self.DV_listSpanwiseLocal[key].nVal):
-                print("========================================")
-                print("   SpanwiseLocalVar(%s), Value(%d)       " % (key, j))
-                print("========================================")
-
-                if self.isChild:
-                    self.FFD.coef = refFFDCoef.copy()
-                    self.coef = refCoef.copy()
-                    self.refAxis.coef = self.coef.copy()
-                    self.refAxis._updateCurveCoef()
+        report = {}
+        for label, DVList, iDV, dvTol in [
+            ("GlobalVar", self.DV_listGlobal, DVCountGlob, 10 * tol),
+            ("LocalVar", self.DV_listLocal, DVCountLoc, tol),
+            ("SectionLocalVar", self.DV_listSectionLocal, DVCountSecLoc, tol),
+            ("SpanwiseLocalVar", self.DV_listSpanwiseLocal, DVCountSpanLoc, tol),
+        ]:
+            for key in DVList:
+                nVal = DVList[key].nVal
+                report[key] = {
+                    "maxAbsErr": np.zeros(nVal),
+                    "maxRelErr": np.zeros(nVal),
+                    "relNormErr": np.zeros(nVal),
+                    "indices": [],
+                }
+                for j in range(nVal):
+                    if self.isChild:
+                        self.FFD.coef = refFFDCoef.copy()
+                        self.coef = refCoef.copy()
+                        self.refAxis.coef = self.coef.copy()
+                        self.refAxis._updateCurveCoef()
 
-                refVal = self.DV_listSpanwiseLocal[key].value[j]
+                    refVal = DVList[key].value[j]
+                    DVList[key].value[j] += step
 
-                self.DV_listSpanwiseLocal[key].value[j] += h
-                coordsph = self.update(ptSetName).flatten()
+                    if mode == "cs":
+                        if not self.isChild:
+                            self.FFD.coef = self.origFFDCoef.copy()
+                        deriv = np.imag(self._update_deriv_cs(ptSetName).flatten()[sample]) / h
+                    else:
+                        deriv = (self.update(ptSetName).flatten()[sample] - coords0) / h
 
-                deriv = (coordsph - coords0) / h
+                    DVList[key].value[j] = refVal
 
-                for ii in range(len(deriv)):
-                    relErr = (deriv[ii] - Jac[DVCountSpanLoc, ii]) / (1e-16 + Jac[DVCountSpanLoc, ii])
-                    absErr = deriv[ii] - Jac[DVCountSpanLoc, ii]
+                    if Jac is not None:
+                        jacCol = Jac[iDV].toarray().flatten()[sample]
+                    else:
+                        jacCol = np.zeros_like(deriv)
+
+                    absErr = np.abs(deriv - jacCol)
+                    relErr = absErr / (1e-16 + np.abs(jacCol))
+                    bad = np.where((relErr > dvTol) & (absErr > dvTol))[0]
+
+                    report[key]["maxAbsErr"][j] = np.max(absErr, initial=0.0)
+                    report[key]["maxRelErr"][j] = np.max(relErr, initial=0.0)
+                    report[key]["relNormErr"][j] = np.linalg.norm(deriv - jacCol) / (1e-16 + np.linalg.norm(jacCol))
+                    report[key]["indices"].append(sample[bad])
+
+                    if verbose:
+                        print(
+                            "%s(%s), Value(%d): maxAbsErr %.3e, maxRelErr %.3e, relNormErr %.3e, %d flagged"
+                            % (
+                                label,
+                                key,
+                                j,
+                                report[key]["maxAbsErr"][j],
+                                report[key]["maxRelErr"][j],
+                                report[key]["relNormErr"][j],
+                                len(bad),
+                            )
+                        )
 
-                    if abs(relErr) > h and abs(absErr) > h:
-                        print(ii, deriv[ii], Jac[DVCountSpanLoc, ii], relErr, absErr)
+                    iDV += 1
 
-                DVCountSpanLoc += 1
-                self.DV_listSpanwiseLocal[key].value[j] = refVal
+        if mode == "cs":
+            self._unComplexifyCoef()
+            self.update(ptSetName)
 
         for child in self.children.values():
-            child.checkDerivatives(ptSetName)
+            report.update(
+                child.checkDerivatives(ptSetName, mode=mode, h=h, tol=tol, nSample=nSample, seed=seed, verbose=verbose)
+            )
+
+        return report
 
     def printDesignVariables(self):
         """
@@ -4838,70 +5077,75 @@ class DVGeometry(BaseDVGeometry):
         # Length of sectionTransform
         Tcount = len(sectionTransform)
 
-        for i in range(nSections):
-            # Compute singular value decomposition of points in section (the
-            # U matrix should provide us with a pretty good approximation
-            # of the transformation matrix)
-            pts = self.FFD.coef[rolledlIndex[i, :, :]]
-            nJ, nI = pts.shape[:-1]
-            X = np.reshape(pts, (nI * nJ, 3))
-            c = np.mean(X, 0)
-            A = X - c
-            U, _, _ = np.linalg.svd(A.T)
-
-            # Choose section plane normal axis
-            if orient2 == "svd":
-                ax2 = U[:, 2]
-            elif orient2 == "ffd":
-                # Use a centered FD approximation (first order at the boundaries)
-                if i == 0:
-                    pt = np.mean(self.FFD.coef[rolledlIndex[i, :, :]].reshape(nI * nJ, 3), 0)
-                    ptp = np.mean(self.FFD.coef[rolledlIndex[i + 1, :, :]].reshape(nI * nJ, 3), 0)
-                    ax2 = ptp - pt
-                elif i == nSections - 1:
-                    pt = np.mean(self.FFD.coef[rolledlIndex[i, :, :]].reshape(nI * nJ, 3), 0)
-                    ptm = np.mean(self.FFD.coef[rolledlIndex[i - 1, :, :]].reshape(nI * nJ, 3), 0)
-                    ax2 = pt - ptm
-                else:
-                    ptp = np.mean(self.FFD.coef[rolledlIndex[i + 1, :, :]].reshape(nI * nJ, 3), 0)
-                    ptm = np.mean(self.FFD.coef[rolledlIndex[i - 1, :, :]].reshape(nI * nJ, 3), 0)
-                    ax2 = ptp - ptm
-                ax2 /= np.linalg.norm(ax2)
-            else:
-                raise Error("orient2 must be 'svd' or 'ffd'")
-
-            # Options for choosing in-plane axes
-            # 1. Align axis '0' with projection of the given vector on section
-            #       plane.
-            # 2. Align axis '0' with the projection of an average
-            #       difference vector between opposing edges of FFD block
-            #       section plane
-            # 3. Use the default SVD decomposition (in general this will work).
-            #       It will choose the chordwise direction as the best fit line
-            #       through the section points.
-            if orient0vec or orient0idx:
-                if orient0vec:
-                    u = orient0 / np.linalg.norm(orient0)
-                else:
-                    u = np.mean((pts[-1, :] - pts[0, :]), axis=0)
-                    u = u / np.linalg.norm(u)
-                ax0 = u - u.dot(ax2) * ax2
-                ax1 = np.cross(ax2, ax0)
+        # Compute singular value decomposition of points in all the sections
+        # at once (the U matrices should provide us with a pretty good
+        # approximation of the transformation matrices)
+        pts = self.FFD.coef[rolledlIndex]
+        X = np.reshape(pts, (nSections, -1, 3))
+        c = np.mean(X, 1)
+        A = X - c[:, np.newaxis, :]
+        U, _, _ = np.linalg.svd(np.transpose(A, (0, 2, 1)))
+
+        # Choose section plane normal axis
+        if orient2 == "svd":
+            ax2 = U[:, :, 2]
+        elif orient2 == "ffd":
+            # Use a centered FD approximation (first order at the boundaries)
+            ax2 = np.zeros((nSections, 3))
+            ax2[0] = c[1] - c[0]
+            ax2[-1] = c[-1] - c[-2]
+            ax2[1:-1] = c[2:] - c[:-2]
+            ax2 /= np.linalg.norm(ax2, axis=1)[:, np.newaxis]
+        else:
+            raise Error("orient2 must be 'svd' or 'ffd'")
+
+        # Options for choosing in-plane axes
+        # 1. Align axis '0' with projection of the given vector on section
+        #       plane.
+        # 2. Align axis '0' with the projection of an average
+        #       difference vector between opposing edges of FFD block
+        #       section plane
+        # 3. Use the default SVD decomposition (in general this will work).
+        #       It will choose the chordwise direction as the best fit line
+        #       through the section points.
+        if orient0vec or orient0idx:
+            if orient0vec:
+                u = np.tile(orient0 / np.linalg.norm(orient0), (nSections, 1))
             else:
-                ax0 = U[:, 0]
-                ax1 = U[:, 1]
-
-            T = np.vstack((ax0, ax1, ax2)).T
-            sectionTransform.append(T)
-            # Designate section transformation matrix for each control point in
-            # section
-            sectionLink[rolledlIndex[i, :, :]] = Tcount
-            Tcount += 1
-
-            # Need to initialize coefRotM to identity matrix for case with no
-            # global design variables
-            for j in rolledlIndex[i, :, :]:
-                for coef in j:
-                    self.coefRotM[coef] = np.eye(3)
+                u = np.mean((pts[:, -1, :] - pts[:, 0, :]), axis=1)
+                u = u / np.linalg.norm(u, axis=1)[:, np.newaxis]
+            ax0 = u - np.sum(u * ax2, axis=1)[:, np.newaxis] * ax2
+            ax1 = np.cross(ax2, ax0)
+        else:
+            ax0 = U[:, :, 0]
+            ax1 = U[:, :, 1]
+
+        T = np.stack((ax0, ax1, ax2), axis=2)
+        sectionTransform.extend(T[i] for i in range(nSections))
+
+        # Designate section transformation matrix for each control point in
+        # section
+        sectionLink[rolledlIndex] = Tcount + np.arange(nSections)[:, np.newaxis, np.newaxis]
+
+        # Need to initialize coefRotM to identity matrix for case with no
+        # global design variables
+        for coef in rolledlIndex.flatten():
+            self.coefRotM[coef] = np.eye(3)
 
         return nSections
+
+
+# ---------------------------------------------------------------------
+#   Process pool workers for the distributed CS/FD Jacobian
+# ---------------------------------------------------------------------
+_jacobianWorkerArgs = None
+
+
+def _initJacobianWorker(DVGeo, mode, config):
+    global _jacobianWorkerArgs
+    _jacobianWorkerArgs = (DVGeo, mode, config)
+
+
+def _computeJacobianWorker(iDVs):
+    DVGeo, mode, config = _jacobianWorkerArgs
+    return DVGeo._computeCoefJacobianColumns(iDVs, mode, config)
@@ -8,6 +8,7 @@ from scipy import sparse
 
 # Local modules
 from .DVGeo import DVGeometry
+from .totalJacobian import TotalJacobian
 
 AXES_2_IDX = {"x": 0, "y": 1, "z": 2}
 AXES = {"x", "y", "z"}
@@ -106,6 +107,10 @@ class _AxiTransform:
         # derivative of the Cartesian points w.r.t the collapsed axi-symmetric points
         self.dPtCdPtA = sparse.coo_matrix((data, (row, col)), shape=(3 * n_pts, 3 * n_pts)).tocsr()
 
+        # derivative of the Cartesian points w.r.t the FFD coefficients.
+        # This is composed once with the embedding and then reused
+        self.dPtdCoef = None
+
         # points collapsed into the prescribed plane
         # self.c_pts_axi = np.vstack((self.alpha, self.radii, np.zeros(self.n_points))).T
         if self.complex:
@@ -258,11 +263,34 @@ class DVGeometryAxi(DVGeometry):
         """compute the total point jacobian in CSR format since we
         need this for TACS"""
 
-        super().computeTotalJacobian(ptSetName, config)
         if self.JT[ptSetName] is not None:
+            return
+
+        super().computeTotalJacobian(ptSetName, config)
+
+        # Without children the transformation is already included in
+        # the cached point operator, see _getExpandeddPtdCoef
+        if self.JT[ptSetName] is not None and len(self.children) > 0:
             xform = self.axiTransforms[ptSetName]
 
-            self.JT[ptSetName] = xform.dPtCdPtA.dot(self.JT[ptSetName].T).T
+            JT = xform.dPtCdPtA.dot(self.JT[ptSetName].tocsr().T).T
+            self.JT[ptSetName] = TotalJacobian(JT, self._getNDVGlobal())
+
+    def _getExpandeddPtdCoef(self, ptSetName):
+        """
+        Return the derivative of the Cartesian points w.r.t. the FFD
+        coefficients. The axisymmetric transformation Jacobian is
+        composed with dPtdCoef once per point set and cached.
+        """
+        if len(self.children) > 0:
+            return super()._getExpandeddPtdCoef(ptSetName)
+
+        xform = self.axiTransforms[ptSetName]
+        if xform.dPtdCoef is None:
+            xform.dPtdCoef = xform.dPtCdPtA.dot(super()._getExpandeddPtdCoef(ptSetName)).tocsr()
+            xform.dPtdCoef.sort_indices()
+
+        return xform.dPtdCoef
 
     # TODO JSG: the computeTotalJacobianFD method is broken in DVGeometry Base class
     # def computeTotalJacobianFD(self, ptSetName, config=None):
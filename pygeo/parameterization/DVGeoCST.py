@@ -312,6 +312,11 @@ class DVGeometryCST(BaseDVGeometry):
         # Determine which points are on the upper and lower surfaces
         self.points[ptName]["upper"], self.points[ptName]["lower"] = self._splitUpperLower(points)
 
+        # The scaled chordwise coordinates do not change with the DVs, so the CST basis
+        # of the points can be cached until the class shape parameters change
+        self.points[ptName]["scaledX"] = (points[:, self.xIdx] - self.xMin) / (self.xMax - self.xMin)
+        self.points[ptName]["basis"] = {"upper": None, "lower": None}
+
         # If debug mode is on, plot the upper and lower surface points
         if self.debug:
             # Gather all the plotting data on the root proc
@@ -571,11 +576,9 @@ class DVGeometryCST(BaseDVGeometry):
         # Unpack some useful variables
         desVars = self._unpackDVs()
         ptsX = self.points[ptSetName]["points"][:, self.xIdx]
-        xMax = self.points[ptSetName]["xMax"]
         xMin = self.points[ptSetName]["xMin"]
-        scaledX = (ptsX - xMin) / (xMax - xMin)
-        idxUpper = self.points[ptSetName]["upper"]
-        idxLower = self.points[ptSetName]["lower"]
+        idx = {"upper": self.points[ptSetName]["upper"], "lower": self.points[ptSetName]["lower"]}
+        basis = {surface: self._getCSTBasis(ptSetName, surface, desVars) for surface in ["upper", "lower"]}
         funcSens_local = {}
 
         # If dIdpt is a group of vectors, reorder the axes so it
@@ -584,87 +587,29 @@ class DVGeometryCST(BaseDVGeometry):
         if len(dim) == 3:
             dIdpt = np.moveaxis(dIdpt, 0, -1)
 
+        # Compute the sensitivities with respect to the CST coefficients and both class
+        # shape parameters of a surface, for all the seeds, with one product
+        surfSens = {}
+        for surface in ["upper", "lower"]:
+            dydDV = self._computeCSTJacobian(basis[surface], desVars[surface])
+            surfSens[surface] = dydDV @ dIdpt[idx[surface], self.yIdx] * desVars["chord"]
+
         for dvName, DV in self.DVs.items():
             dvType = DV.type
 
-            if dvType == "upper":
-                dydUpperCST = self.computeCSTdydw(
-                    scaledX[idxUpper], desVars["n1_upper"], desVars["n2_upper"], desVars["upper"], dtype=self.dtype
-                )
-                dydUpperCST *= desVars["chord"]
-                funcSens_local[dvName] = dydUpperCST @ dIdpt[idxUpper, self.yIdx]
-            elif dvType == "lower":
-                dydLowerCST = self.computeCSTdydw(
-                    scaledX[idxLower], desVars["n1_lower"], desVars["n2_lower"], desVars["lower"], dtype=self.dtype
-                )
-                dydLowerCST *= desVars["chord"]
-                funcSens_local[dvName] = dydLowerCST @ dIdpt[idxLower, self.yIdx]
-            elif dvType == "n1_upper":
-                funcSens_local[dvName] = (
-                    desVars["chord"]
-                    * self.computeCSTdydN1(
-                        scaledX[idxUpper], desVars["n1_upper"], desVars["n2_upper"], desVars["upper"], dtype=self.dtype
-                    )
-                    @ dIdpt[idxUpper, self.yIdx]
-                )
-            elif dvType == "n2_upper":
-                funcSens_local[dvName] = (
-                    desVars["chord"]
-                    * self.computeCSTdydN2(
-                        scaledX[idxUpper], desVars["n1_upper"], desVars["n2_upper"], desVars["upper"], dtype=self.dtype
-                    )
-                    @ dIdpt[idxUpper, self.yIdx]
-                )
-            elif dvType == "n1_lower":
-                funcSens_local[dvName] = (
-                    desVars["chord"]
-                    * self.computeCSTdydN1(
-                        scaledX[idxLower], desVars["n1_lower"], desVars["n2_lower"], desVars["lower"], dtype=self.dtype
-                    )
-                    @ dIdpt[idxLower, self.yIdx]
-                )
-            elif dvType == "n2_lower":
-                funcSens_local[dvName] = (
-                    desVars["chord"]
-                    * self.computeCSTdydN2(
-                        scaledX[idxLower], desVars["n1_lower"], desVars["n2_lower"], desVars["lower"], dtype=self.dtype
-                    )
-                    @ dIdpt[idxLower, self.yIdx]
-                )
-            elif dvType == "n1":
-                funcSens_local[dvName] = (
-                    desVars["chord"]
-                    * self.computeCSTdydN1(
-                        scaledX[idxUpper], desVars["n1_upper"], desVars["n2_upper"], desVars["upper"], dtype=self.dtype
-                    )
-                    @ dIdpt[idxUpper, self.yIdx]
-                )
-                funcSens_local[dvName] += (
-                    desVars["chord"]
-                    * self.computeCSTdydN1(
-                        scaledX[idxLower], desVars["n1_lower"], desVars["n2_lower"], desVars["lower"], dtype=self.dtype
-                    )
-                    @ dIdpt[idxLower, self.yIdx]
-                )
-            elif dvType == "n2":
-                funcSens_local[dvName] = (
-                    desVars["chord"]
-                    * self.computeCSTdydN2(
-                        scaledX[idxUpper], desVars["n1_upper"], desVars["n2_upper"], desVars["upper"], dtype=self.dtype
-                    )
-                    @ dIdpt[idxUpper, self.yIdx]
-                )
-                funcSens_local[dvName] += (
-                    desVars["chord"]
-                    * self.computeCSTdydN2(
-                        scaledX[idxLower], desVars["n1_lower"], desVars["n2_lower"], desVars["lower"], dtype=self.dtype
-                    )
-                    @ dIdpt[idxLower, self.yIdx]
-                )
-            else:  # chord
+            if dvType in ["upper", "lower"]:
+                funcSens_local[dvName] = surfSens[dvType][:-2]
+            elif dvType == "chord":
                 dydchord = self.points[ptSetName]["points"][:, self.yIdx] / desVars["chord"]
                 dxdchord = (ptsX - xMin) / desVars["chord"]
                 funcSens_local[dvName] = dxdchord @ dIdpt[:, self.xIdx] + dydchord @ dIdpt[:, self.yIdx]
+            else:
+                # Class shape parameters, either of one surface (e.g. n1_upper) or both (e.g. n1)
+                param, _, surface = dvType.partition("_")
+                row = -2 if param == "n1" else -1
+                funcSens_local[dvName] = 0.0
+                for surface in [surface] if surface else ["upper", "lower"]:
+                    funcSens_local[dvName] += surfSens[surface][row]
 
         # If the axes were reordered to handle a group of dIdpt vectors,
         # switch them back to the expected order for output
@@ -706,68 +651,36 @@ class DVGeometryCST(BaseDVGeometry):
         # Unpack some useful variables
         desVars = self._unpackDVs()
         ptsX = self.points[ptSetName]["points"][:, self.xIdx]
-        xMax = self.points[ptSetName]["xMax"]
         xMin = self.points[ptSetName]["xMin"]
-        scaledX = (ptsX - xMin) / (xMax - xMin)
-        idxUpper = self.points[ptSetName]["upper"]
-        idxLower = self.points[ptSetName]["lower"]
-        idxTE = np.full((self.points[ptSetName]["points"].shape[0],), True, dtype=bool)
-        idxTE[idxUpper] = False
-        idxTE[idxLower] = False
+        idx = {"upper": self.points[ptSetName]["upper"], "lower": self.points[ptSetName]["lower"]}
+        basis = {surface: self._getCSTBasis(ptSetName, surface, desVars) for surface in ["upper", "lower"]}
         xsdot = np.zeros_like(self.points[ptSetName]["points"], dtype=self.dtype)
 
+        # Gather the seeds of the CST coefficients and both class shape parameters
+        # of each surface, so that each surface only needs one product
+        surfSeed = {surface: np.zeros(desVars[surface].size + 2, dtype=self.dtype) for surface in ["upper", "lower"]}
+
         for dvName, dvSeed in vec.items():
             dvType = self.DVs[dvName].type
 
-            if dvType == "upper":
-                dydUpperCST = self.computeCSTdydw(
-                    scaledX[idxUpper], desVars["n1_upper"], desVars["n2_upper"], desVars["upper"], dtype=self.dtype
-                )
-                dydUpperCST *= desVars["chord"]
-                xsdot[idxUpper, self.yIdx] += dydUpperCST.T @ dvSeed
-            if dvType == "lower":
-                dydLowerCST = self.computeCSTdydw(
-                    scaledX[idxLower], desVars["n1_lower"], desVars["n2_lower"], desVars["lower"], dtype=self.dtype
-                )
-                dydLowerCST *= desVars["chord"]
-                xsdot[idxLower, self.yIdx] += dydLowerCST.T @ dvSeed
-            if dvType == "n1_upper" or dvType == "n1":
-                xsdot[idxUpper, self.yIdx] += (
-                    dvSeed
-                    * desVars["chord"]
-                    * self.computeCSTdydN1(
-                        scaledX[idxUpper], desVars["n1_upper"], desVars["n2_upper"], desVars["upper"], dtype=self.dtype
-                    )
-                )
-            if dvType == "n2_upper" or dvType == "n2":
-                xsdot[idxUpper, self.yIdx] += (
-                    dvSeed
-                    * desVars["chord"]
-                    * self.computeCSTdydN2(
-                        scaledX[idxUpper], desVars["n1_upper"], desVars["n2_upper"], desVars["upper"], dtype=self.dtype
-                    )
-                )
-            if dvType == "n1_lower" or dvType == "n1":
-                xsdot[idxLower, self.yIdx] += (
-                    dvSeed
-                    * desVars["chord"]
-                    * self.computeCSTdydN1(
-                        scaledX[idxLower], desVars["n1_lower"], desVars["n2_lower"], desVars["lower"], dtype=self.dtype
-                    )
-                )
-            if dvType == "n2_lower" or dvType == "n2":
-                xsdot[idxLower, self.yIdx] += (
-                    dvSeed
-                    * desVars["chord"]
-                    * self.computeCSTdydN2(
-                        scaledX[idxLower], desVars["n1_lower"], desVars["n2_lower"], desVars["lower"], dtype=self.dtype
-                    )
-                )
-            if dvType == "chord":
+            if dvType in ["upper", "lower"]:
+                surfSeed[dvType][:-2] += dvSeed
+            elif dvType == "chord":
                 dydchord = self.points[ptSetName]["points"][:, self.yIdx] / desVars["chord"]
                 dxdchord = (ptsX - xMin) / desVars["chord"]
                 xsdot[:, self.yIdx] += dvSeed * dydchord
                 xsdot[:, self.xIdx] += dvSeed * dxdchord
+            else:
+                # Class shape parameters, either of one surface (e.g. n1_upper) or both (e.g. n1)
+                param, _, surface = dvType.partition("_")
+                row = -2 if param == "n1" else -1
+                for surface in [surface] if surface else ["upper", "lower"]:
+                    surfSeed[surface][row] += np.sum(dvSeed)
+
+        for surface in ["upper", "lower"]:
+            if np.any(surfSeed[surface]):
+                dydDV = self._computeCSTJacobian(basis[surface], desVars[surface])
+                xsdot[idx[surface], self.yIdx] += desVars["chord"] * surfSeed[surface] @ dydDV
 
         return xsdot
 
@@ -812,6 +725,8 @@ class DVGeometryCST(BaseDVGeometry):
             Updated point set coordinates.
         """
         desVars = self._unpackDVs()
+        basisUpper = self._getCSTBasis(ptSetName, "upper", desVars)
+        basisLower = self._getCSTBasis(ptSetName, "lower", desVars)
 
         # Unpack the points to make variable names more accessible
         idxUpper = self.points[ptSetName]["upper"]
@@ -820,24 +735,18 @@ class DVGeometryCST(BaseDVGeometry):
         idxTE[idxUpper] = False
         idxTE[idxLower] = False
         points = self.points[ptSetName]["points"]
-        ptsX = points[:, self.xIdx]
         ptsY = points[:, self.yIdx]
         xMax = self.points[ptSetName]["xMax"]
         xMin = self.points[ptSetName]["xMin"]
         thicknessTE = self.points[ptSetName]["thicknessTE"]
 
-        # Scale the airfoil to the range 0 to 1 in x direction
+        # The airfoil is scaled to the range 0 to 1 in x direction
         shift = xMin
         chord = xMax - xMin
-        scaledX = (ptsX - shift) / chord
         yTE = thicknessTE / chord / 2  # half the scaled trailing edge thickness
 
-        ptsY[idxUpper] = desVars["chord"] * self.computeCSTCoordinates(
-            scaledX[idxUpper], desVars["n1_upper"], desVars["n2_upper"], desVars["upper"], yTE, dtype=self.dtype
-        )
-        ptsY[idxLower] = desVars["chord"] * self.computeCSTCoordinates(
-            scaledX[idxLower], desVars["n1_lower"], desVars["n2_lower"], desVars["lower"], -yTE, dtype=self.dtype
-        )
+        ptsY[idxUpper] = desVars["chord"] * (desVars["upper"] @ basisUpper["dydw"] + yTE * basisUpper["x"])
+        ptsY[idxLower] = desVars["chord"] * (desVars["lower"] @ basisLower["dydw"] - yTE * basisLower["x"])
         ptsY[idxTE] *= desVars["chord"] / chord
 
         # Scale the chord according to the chord DV
@@ -913,6 +822,83 @@ class DVGeometryCST(BaseDVGeometry):
 
         return desVars
 
+    def _getCSTBasis(self, ptSetName, surface, desVars):
+        """
+        Return the CST basis of the points of a point set on the upper or
+        lower surface. The basis only depends on the scaled chordwise
+        coordinates of the points, which are fixed, and on the class shape
+        parameters. It is cached and only recomputed when they change.
+
+        Parameters
+        ----------
+        ptSetName : str
+            Name of the point set
+        surface : str
+            Either "upper" or "lower"
+        desVars : dict
+            Airfoil shape parameters from :meth:`_unpackDVs`
+
+        Returns
+        -------
+        basis : dict
+            Dictionary containing the following:
+                `"x"`: scaled chordwise coordinates of the points
+                `"dydw"`: derivatives of the point heights with respect to the CST coefficients, (# coeff, # pts)
+                `"dlogCdN1"`: derivative of the log of the class shape with respect to N1
+                `"dlogCdN2"`: derivative of the log of the class shape with respect to N2
+        """
+        N1 = desVars[f"n1_{surface}"]
+        N2 = desVars[f"n2_{surface}"]
+        nCoeff = desVars[surface].size
+
+        basis = self.points[ptSetName]["basis"][surface]
+        if (
+            basis is not None
+            and np.array_equal(basis["N1"], N1)
+            and np.array_equal(basis["N2"], N2)
+            and basis["dydw"].shape[0] == nCoeff
+        ):
+            return basis
+
+        x = self.points[ptSetName]["scaledX"][self.points[ptSetName][surface]]
+        basis = {"N1": N1.copy(), "N2": N2.copy(), "x": x}
+        basis["dydw"] = self.computeCSTdydw(x, N1, N2, np.ones(nCoeff), dtype=self.dtype)
+
+        # The log terms are zero where the class shape is zero
+        basis["dlogCdN1"] = np.zeros_like(x, dtype=self.dtype)
+        basis["dlogCdN1"][x != 0.0] = np.log(x[x != 0.0])
+        basis["dlogCdN2"] = np.zeros_like(x, dtype=self.dtype)
+        basis["dlogCdN2"][x != 1.0] = np.log(1 - x[x != 1.0])
+
+        self.points[ptSetName]["basis"][surface] = basis
+
+        return basis
+
+    @staticmethod
+    def _computeCSTJacobian(basis, w):
+        """
+        Compute the derivatives of the point heights with respect to the CST
+        coefficients and the two class shape parameters of a surface from a
+        cached basis, see :meth:`computeCSTdydw`, :meth:`computeCSTdydN1` and
+        :meth:`computeCSTdydN2`.
+
+        Parameters
+        ----------
+        basis : dict
+            CST basis from :meth:`_getCSTBasis`
+        w : ndarray (# coeff,)
+            CST coefficient array
+
+        Returns
+        -------
+        ndarray (# coeff + 2, # pts)
+            Derivatives of the y coordinates with respect to the CST coefficients,
+            followed by the derivatives with respect to N1 and N2
+        """
+        # The class shape derivatives are the heights without the trailing edge term times the log terms
+        y = w @ basis["dydw"]
+        return np.vstack((basis["dydw"], y * basis["dlogCdN1"], y * basis["dlogCdN2"]))
+
     def _splitUpperLower(self, points):
         """
         Figure out the indices of points on the upper and lower
@@ -94,6 +94,10 @@ class DVGeometryESP(DVGeoSketch):
         Disallow projections to edges in the ESP topology (only allow surfaces).
         This can sometimes fix weird mesh deformation issues near the mesh boundaries.
         Default False.
+    jacReuseTol : float
+        If given, the finite difference Jacobian is reused as long as no design variable
+        moved by more than this value since it was computed.
+        Default None, i.e. the Jacobian is recomputed after every design change.
 
     Examples
     --------
@@ -119,6 +123,7 @@ class DVGeometryESP(DVGeoSketch):
         ulimits=None,
         vlimits=None,
         name=None,
+        jacReuseTol=None,
     ):
         if not ocsmImported:
             raise ImportError("OCSM and pyOCSM must be installed to use DVGeometryESP.")
@@ -126,7 +131,7 @@ class DVGeometryESP(DVGeoSketch):
             print("Initializing DVGeometryESP")
             t0 = time.time()
 
-        super().__init__(fileName=fileName, comm=comm, scale=scale, projTol=projTol, name=name)
+        super().__init__(fileName=fileName, comm=comm, scale=scale, projTol=projTol, name=name, jacReuseTol=jacReuseTol)
 
         self.maxproc = maxproc
         self.esp = True
@@ -1247,7 +1252,10 @@ class DVGeometryESP(DVGeoSketch):
         This routine comptues the jacobian of the ESP surface with respect to the design variables.
         Since our point sets are rigidly linked to the ESP projection points, this is all we need to calculate.
         The input pointSets is a list or dictionary of pointSets to calculate the jacobian for.
+        The DVs are distributed over the procs based on their cost in the last call, see :func:`_getDVOwners()`.
         """
+        if self._reuseSurfJacobian():
+            return
 
         # timing stuff:
         t1 = time.time()
@@ -1333,12 +1341,10 @@ class DVGeometryESP(DVGeoSketch):
 
         # We need to evaluate all the points on respective procs for FD computations
 
-        # determine how many DVs this proc will perturb.
-        n = 0
-        for iDV in range(self.getNDV()):
-            # I have to do this one.
-            if iDV % nproc == rank:
-                n += 1
+        # determine which DVs this proc will perturb.
+        owners = self._getDVOwners(nDV, nproc)
+        n = np.count_nonzero(owners == rank)
+        localCosts = np.zeros(nDV)
         if fd:
             # evaluate all the points
             pts0 = self._evaluatePoints(ug, vg, tg, uvlimitsg, tlimitsg, bodyIDg, faceIDg, edgeIDg, nptsg)
@@ -1350,7 +1356,8 @@ class DVGeometryESP(DVGeoSketch):
 
             for iDV in range(self.getNDV()):
                 # I have to do this one.
-                if iDV % nproc == rank:
+                if owners[iDV] == rank:
+                    tdv = time.time()
                     # Get the DV object for this variable
                     dvName = self.globalDVList[iDV][0]
                     dvLocalIndex = self.globalDVList[iDV][1]
@@ -1381,6 +1388,7 @@ class DVGeometryESP(DVGeoSketch):
 
                     # Reset the DV
                     dvObj.value = dvSave.copy()
+                    localCosts[iDV] = time.time() - tdv
 
                     # increment the counter
                     i += 1
@@ -1407,7 +1415,7 @@ class DVGeometryESP(DVGeoSketch):
             dh = dvObj.dh
 
             t11 = time.time()
-            root_proc = iDV % nproc
+            root_proc = owners[iDV]
             if any_ptset_distributed:
                 # create the send/recv buffers for the scatter
                 if root_proc == rank:
@@ -1449,7 +1457,7 @@ class DVGeometryESP(DVGeoSketch):
 
             # pertrub the local counter on this proc.
             # This loops over the DVs that this proc perturbed
-            if iDV % nproc == rank:
+            if owners[iDV] == rank:
                 ii += 1
 
         t2 = time.time()
@@ -1459,9 +1467,8 @@ class DVGeometryESP(DVGeoSketch):
             print("evaluating the new points took", teval, "seconds")
             print("communication took", tcomm, "seconds")
 
-        # set the update flags
-        for ptSet in self.pointSets:
-            self.updatedJac[ptSet] = True
+        # save the DVs and costs for the next call and set the update flags
+        self._finalizeSurfJacobian(localCosts)
 
 
 class ESPParameter:
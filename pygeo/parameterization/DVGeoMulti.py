@@ -47,9 +47,18 @@ class DVGeometryMulti:
     isComplex : bool, optional
         Flag to use complex variables for complex step verification.
 
+    parallelIntersections : bool, optional
+        Flag to distribute the intersection computations across the processors.
+        If True, the communicator is split into one sub-communicator per intersection
+        (or fewer if there are more intersections than processors),
+        each group computes the seams of the intersections assigned to it,
+        and the results are broadcast to all processors.
+        This is only beneficial with multiple intersections and multiple processors.
+        With a single intersection, all processors form one group and the broadcast is redundant.
+
     """
 
-    def __init__(self, comm=MPI.COMM_WORLD, checkDVs=True, debug=False, isComplex=False):
+    def __init__(self, comm=MPI.COMM_WORLD, checkDVs=True, debug=False, isComplex=False, parallelIntersections=False):
         # Check to make sure pySurf is installed before initializing
         if not pysurfInstalled:
             raise ImportError("pySurf is not installed and is required to use DVGeometryMulti.")
@@ -64,6 +73,13 @@ class DVGeometryMulti:
         self.checkDVs = checkDVs
         self.debug = debug
         self.complex = isComplex
+        self.parallelIntersections = parallelIntersections
+
+        # Sub-communicator and group roots used to distribute the intersections.
+        # These are created the first time the intersections are updated in parallel.
+        self.intersectionComm = None
+        self.intersectionRoots = None
+        self.intersectionColor = None
 
         # Set real or complex Fortran API
         if isComplex:
@@ -516,8 +532,11 @@ class DVGeometryMulti:
 
         # We need to give the updated coordinates to each of the
         # intersectComps (if we have any) so they can update the new intersection curve
-        for IC in self.intersectComps:
-            IC.setSurface(self.comm)
+        if self.parallelIntersections and self.comm.size > 1:
+            self._setSurfacesParallel()
+        else:
+            for IC in self.intersectComps:
+                IC.setSurface(self.comm)
 
         # Flag all the pointSets as not being up to date:
         for pointSet in self.updated:
@@ -895,6 +914,52 @@ class DVGeometryMulti:
 
         return nodes, triConn, triConnStack, barsConn
 
+    def _setupIntersectionComms(self):
+        """
+        Split the communicator into groups that each compute a subset of the intersections.
+        Intersection i is assigned to group i % nGroups.
+        """
+
+        nGroups = min(len(self.intersectComps), self.comm.size)
+
+        # Contiguous blocks of ranks form each group
+        color = self.comm.rank * nGroups // self.comm.size
+        self.intersectionComm = self.comm.Split(color, self.comm.rank)
+
+        # The global rank of the first processor in each group broadcasts the results
+        colors = self.comm.allgather(color)
+        self.intersectionRoots = [colors.index(iGroup) for iGroup in range(nGroups)]
+        self.intersectionColor = color
+
+    def _setSurfacesParallel(self):
+        """
+        Update the intersection seams with each intersection computed by a single processor group.
+        The triangulated surfaces are distributed across all processors,
+        so they are gathered on the full communicator first.
+        """
+
+        if self.intersectionComm is None:
+            self._setupIntersectionComms()
+
+        nGroups = len(self.intersectionRoots)
+
+        # Gathering the updated triangulated surfaces is collective on the full communicator
+        for IC in self.intersectComps:
+            IC._getUpdatedCoords(self.comm)
+
+        # Each group computes the seams for the intersections it owns
+        for i, IC in enumerate(self.intersectComps):
+            if i % nGroups == self.intersectionColor:
+                IC.seam = IC._getIntersectionSeam(self.intersectionComm)
+
+        # Broadcast the seams and the data required for the sensitivities from the owning group
+        for i, IC in enumerate(self.intersectComps):
+            root = self.intersectionRoots[i % nGroups]
+            state = IC.getSeamState() if self.comm.rank == root else None
+            state = self.comm.bcast(state, root=root)
+            if self.comm.rank != root:
+                IC.setSeamState(state)
+
     def _computeTotalJacobian(self, ptSetName):
         """
         This routine computes the total jacobian. It takes the jacobians
@@ -924,7 +989,7 @@ class DVGeometryMulti:
 
             if self.comps[comp].DVGeo.JT[ptSetName] is not None:
                 # Get the component Jacobian
-                compJ = self.comps[comp].DVGeo.JT[ptSetName].T
+                compJ = self.comps[comp].DVGeo.JT[ptSetName].tocsr().T
 
                 # Set the block of the full Jacobian associated with this component
                 jac[ptSet.compMapFlat[comp], dvOffset : dvOffset + nDVComp] = compJ
@@ -1225,6 +1290,26 @@ class CompIntersection:
 
         self.seam = self._getIntersectionSeam(comm)
 
+    def getSeamState(self):
+        """Return the data computed by the seam computation that is needed for the update and sensitivities"""
+
+        return {
+            "seam": self.seam,
+            "seamDict": self.seamDict,
+            "seamConnFull": self.seamConnFull,
+            "seamConnWarp": self.seamConnWarp,
+            "counter": self.counter,
+        }
+
+    def setSeamState(self, state):
+        """Set the seam data computed on another processor"""
+
+        self.seam = state["seam"]
+        self.seamDict = state["seamDict"]
+        self.seamConnFull = state["seamConnFull"]
+        self.seamConnWarp = state["seamConnWarp"]
+        self.counter = state["counter"]
+
     def addPointSet(self, pts, ptSetName, compMap, comm):
         # Figure out which points this intersection object has to deal with
 
@@ -2511,7 +2596,8 @@ class CompIntersection:
         return
 
     def _getIntersectionSeam(self, comm, firstCall=False):
-        # we can parallelize here. each proc gets one intersection, but needs re-structuring of some of the code.
+        # the intersections can be distributed across processor groups with the parallelIntersections option.
+        # in that case, comm is the sub-communicator of the group that owns this intersection.
 
         # this function computes the intersection curve, cleans up the data and splits the curve based on features or curves specified by the user.
 
@@ -62,9 +62,14 @@ class DVGeoSketch(BaseDVGeometry):
        geometry. For example, if the ESP/VSP model is in inches, and the CFD
        in meters, scale=0.0254.
 
+    jacReuseTol : float
+       If given, the surface Jacobian is not recomputed when no design
+       variable moved by more than this value since the last finite
+       difference. The previous Jacobian is used instead.
+
     """
 
-    def __init__(self, fileName, comm=MPI.COMM_WORLD, scale=1.0, projTol=0.01, name=None):
+    def __init__(self, fileName, comm=MPI.COMM_WORLD, scale=1.0, projTol=0.01, name=None, jacReuseTol=None):
         super().__init__(fileName=fileName, name=name)
 
         # this scales coordinates from model to mesh geometry
@@ -76,6 +81,13 @@ class DVGeoSketch(BaseDVGeometry):
         self.updatedJac = {}
         self.comm = comm
 
+        # Jacobian reuse tolerance and the DV values of the last Jacobian
+        self.jacReuseTol = jacReuseTol
+        self.jacDVs = None
+
+        # wall time spent on each DV in the last finite difference, used for load balancing
+        self.dvCosts = None
+
         # Initial list of DVs
         self.DVs = OrderedDict()
 
@@ -334,3 +346,84 @@ class DVGeoSketch(BaseDVGeometry):
         pointSets is a list or dictionary of pointSets to calculate the jacobian for.
         """
         pass
+
+    def _getDVArray(self):
+        """
+        Return the values of all the DVs as a flat array
+        """
+        return np.concatenate([np.atleast_1d(dv.value).flatten() for dv in self.DVs.values()] + [np.zeros(0)])
+
+    def _reuseSurfJacobian(self):
+        """
+        Check if the surface Jacobians from the last finite difference can be reused.
+        This is the case when jacReuseTol is set, all point sets have a Jacobian,
+        and no DV moved by more than jacReuseTol since the Jacobians were computed.
+        If so, the Jacobians are flagged as up to date.
+
+        Returns
+        -------
+        reuse : bool
+            True if the Jacobians were reused
+        """
+        if self.jacReuseTol is None or self.jacDVs is None:
+            return False
+
+        if any(ptSet.jac is None for ptSet in self.pointSets.values()):
+            return False
+
+        dvs = self._getDVArray()
+        if dvs.shape != self.jacDVs.shape or np.max(np.abs(dvs - self.jacDVs), initial=0.0) > self.jacReuseTol:
+            return False
+
+        for ptSet in self.pointSets:
+            self.updatedJac[ptSet] = True
+
+        return True
+
+    def _getDVOwners(self, nDV, nproc):
+        """
+        Assign the DVs to the procs for the parallel finite difference.
+        The DV costs measured in the last finite difference are balanced
+        with a longest processing time first schedule: the most expensive
+        remaining DV goes to the least loaded proc. Without costs, the DVs
+        are assigned round-robin.
+
+        Parameters
+        ----------
+        nDV : int
+            Number of DVs to perturb
+        nproc : int
+            Number of procs to use
+
+        Returns
+        -------
+        owners : array of int, size (nDV)
+            The rank that perturbs each DV
+        """
+        if self.dvCosts is None or len(self.dvCosts) != nDV:
+            return np.arange(nDV) % nproc
+
+        owners = np.zeros(nDV, dtype="intc")
+        load = np.zeros(nproc)
+        for iDV in np.argsort(-self.dvCosts, kind="stable"):
+            owners[iDV] = np.argmin(load)
+            load[owners[iDV]] += self.dvCosts[iDV]
+
+        return owners
+
+    def _finalizeSurfJacobian(self, localCosts):
+        """
+        Store the information from a finite difference needed by the next one:
+        the DV values for the Jacobian reuse and the DV costs for the load balancing.
+        The costs are summed over the procs so that every proc gets the same schedule.
+
+        Parameters
+        ----------
+        localCosts : array, size (nDV)
+            The wall time spent on the DVs perturbed by this proc, zero for the others
+        """
+        self.jacDVs = self._getDVArray()
+        self.dvCosts = self.comm.allreduce(localCosts, op=MPI.SUM)
+
+        for ptSet in self.pointSets:
+            self.updatedJac[ptSet] = True
@@ -1,5 +1,7 @@
 # Standard Python modules
 from collections import OrderedDict
+import hashlib
+import os
 import time
 
 # External modules
@@ -63,6 +65,11 @@ class DVGeometryVSP(DVGeoSketch):
        A list of string defining the subset of the VSP components to use when
        exporting the P3D surface files
 
+    jacReuseTol : float
+       If given, the finite difference Jacobian is reused as long as no design
+       variable moved by more than this value since it was computed. By default,
+       the Jacobian is recomputed after every design change.
+
     Examples
     --------
     The general sequence of operations for using DVGeometry is as follows:
@@ -73,7 +80,7 @@ class DVGeometryVSP(DVGeoSketch):
 
     """
 
-    def __init__(self, fileName, comm=MPI.COMM_WORLD, scale=1.0, comps=[], projTol=0.01, name=None):
+    def __init__(self, fileName, comm=MPI.COMM_WORLD, scale=1.0, comps=[], projTol=0.01, name=None, jacReuseTol=None):
         vspOutOfDate = False
         if vspInstalled:
             vspVersionStr = openvsp.GetVSPVersion()
@@ -104,7 +111,7 @@ class DVGeometryVSP(DVGeoSketch):
             print("Initializing DVGeometryVSP")
             t0 = time.time()
 
-        super().__init__(fileName=fileName, comm=comm, scale=scale, projTol=projTol, name=name)
+        super().__init__(fileName=fileName, comm=comm, scale=scale, projTol=projTol, name=name, jacReuseTol=jacReuseTol)
 
         if hasattr(openvsp, "VSPVehicle"):
             self.vspModel = openvsp.VSPVehicle()
@@ -159,7 +166,7 @@ class DVGeometryVSP(DVGeoSketch):
             t3 = time.time()
             print("Initialized DVGeometry VSP in", (t3 - t0), "seconds.")
 
-    def addPointSet(self, points, ptName, **kwargs):
+    def addPointSet(self, points, ptName, cache_projections=False, **kwargs):
         """
         Add a set of coordinates to DVGeometry
 
@@ -176,6 +183,13 @@ class DVGeometryVSP(DVGeoSketch):
             coordinates. Thisname will need to be provided when
             updating the coordinates or when getting the derivatives
             of the coordinates.
+        cache_projections : bool, None or str
+            The user can optionally cache the point set projections to save initialization time.
+            If a filename is provided, the ``r, s, t`` coordinates of the projections are saved
+            in numpy compressed format ('.npz' extension should be used). None generates the
+            file name from the point set name. The cache is keyed on the VSP file, the scale
+            and the coordinates of the points on every processor, and the points are projected
+            again if any of them changed.
 
         Returns
         -------
@@ -192,144 +206,31 @@ class DVGeometryVSP(DVGeoSketch):
 
         points = np.array(points).real.astype("d")
 
-        # we need to project each of these points onto the VSP geometry,
-        # get geometry and surface IDs, u, v values, and coordinates of the projections.
-        # then calculate the self.offset variable using the projected points.
-
-        # first, to get a good initial guess on the geometry and u,v values,
-        # we can use the adt projections in pyspline
-        if len(points) > 0:
-            # faceID has the index of the corresponding quad element.
-            # uv has the parametric u and v weights of the projected point.
-
-            faceID, uv = searchQuads(self.pts0.T, (self.conn + 1).T, points.T)
-            uv = uv.T
-            faceID -= 1  # Convert back to zero-based indexing.
-            # after this point we should have the projected points.
-
-        else:
-            faceID = np.zeros((0), "intc")
-            uv = np.zeros((0, 2), "intc")
-
-        # now we need to figure out which surfaces the points got projected to
-        # From the faceID we can back out what component each one is
-        # connected to. This way if we have intersecting components we
-        # only change the ones that are apart of the two surfaces.
-        cumFaceSizes = np.zeros(len(self.sizes) + 1, "intc")
-        for i in range(len(self.sizes)):
-            nCellI = self.sizes[i][0] - 1
-            nCellJ = self.sizes[i][1] - 1
-            cumFaceSizes[i + 1] = cumFaceSizes[i] + nCellI * nCellJ
-        compIDs = np.searchsorted(cumFaceSizes, faceID, side="right") - 1
-
-        # coordinates to store the projected points
-        pts = np.zeros(points.shape)
-
-        # npoints * 3 list containing the geomID, u and v values
-        # this can be improved if we can group points that get
-        # projected to the same geometry.
-        npoints = len(points)
-        geom = np.zeros(npoints, dtype="intc")
-        r = np.zeros(npoints)
-        s = np.zeros(npoints)
-        t = np.zeros(npoints)
-
-        # initialize one 3dvec for projections
-        pnt = openvsp.vec3d()
-
-        # Keep track of the largest distance between cfd and vsp surfaces
-        dMax = 1e-16
-
         t1 = time.time()
-        for i in range(points.shape[0]):
-            # this is the geometry our point got projected to in the adt code
-            gind = compIDs[i]  # index
-            gid = self.allComps[gind]  # ID
 
-            # set the coordinates of the point object
-            pnt.set_xyz(points[i, 0] * self.meshScale, points[i, 1] * self.meshScale, points[i, 2] * self.meshScale)
+        # cache_projections=False will disable caching, but None will generate a cachefile name automatically
+        if cache_projections is None:
+            cache_projections = ptName + ".npz"
 
-            # first, we call the fast projection code with the initial guess to find the nearest point on the surface
-
-            # this is the global index of the first node of the projected element
-            nodeInd = self.conn[faceID[i], 0]
-            # get the local index of this node
-            nn = nodeInd - self.cumSizes[gind]
-            # figure out the i and j indices of the first point of the element
-            # we projected this point to
-            ii = np.mod(nn, self.sizes[gind, 0])
-            jj = np.floor_divide(nn, self.sizes[gind, 0])
+        projections = None
+        if cache_projections:
+            cacheKey = self._getProjectionCacheKey(points)
+            projections = self._readProjectionCache(cache_projections, cacheKey)
 
-            # calculate the global u and v change in this element
-            du = self.uv[gind][0][ii + 1] - self.uv[gind][0][ii]
-            dv = self.uv[gind][1][jj + 1] - self.uv[gind][1][jj]
+        if projections is None:
+            # we need to project each of these points onto the VSP geometry,
+            # get geometry and surface IDs, u, v values, and coordinates of the projections.
+            # then calculate the self.offset variable using the projected points.
+            projections = self._projectPoints(points)
+            if cache_projections:
+                self._writeProjectionCache(cache_projections, cacheKey, *projections)
+        geom, r, s, t, d = projections
 
-            # now get this points u,v coordinates on the vsp geometry and add
-            # compute the initial guess using the  tesselation data of the surface
-            ug = uv[i, 0] * du + self.uv[gind][0][ii]
-            vg = uv[i, 1] * dv + self.uv[gind][1][jj]
+        # We need to evaluate the projections to get their coordinates in physical space
+        pts = self._compPntRST(geom, r, s, t) * self.modelScale
 
-            # We now convert the surface parameteric variables (u,v) to their equivalent volume parameterization (r,s,t)
-            # this will serve as our initial guess for the volume projection procedure
-            # In general, the conversion between the surface parametric coordinates (u, v)
-            # and the first two volume parameteric coordinate (r, s)
-            # are given by the equations below:
-            #   u = r
-            #   v_low = s
-            #   v_upper = 1 - s
-            # The 3rd parameteric coordinate interpolates between the the upper and lower surfaces
-            #   X(r,s,t) = t * X_upper(r, s) + (1 - t) * X_lower(r, s)
-            rg = ug
-            if vg < 0.5:
-                # This point is on the lower surface
-                sg = self.SMAX * 2.0 * vg
-            else:
-                # This point is on the upper surface
-                sg = self.SMAX * 2.0 * (1.0 - vg)
-            # tg = 0.5 places the initial guess in the middle of the upper and lower surfaces for the volume
-            # Note: If the point we're looking for actually lies on the surface openvsp's
-            # projection algorithm (FindRSTGuess) will still quickly locate it, since our volume interpolation
-            # is linear through the depth (i.e. in t)
-            tg = 0.5
-            # Now, find the closest volume projection
-            d, r[i], s[i], t[i] = self.vspModel.FindRSTGuess(gid, 0, pnt, rg, sg, tg)
-            geom[i] = gind
-
-            # if we dont have a good projection, try projecting again to surfaces
-            #  with the slow code.
-            if d > self.projTol:
-                # print('Guess code failed with projection distance',d)
-                # for now, we need to check for all geometries separately.
-                # Just pick the one that yields the smallest d
-                gind = 0
-                for gid in self.allComps:
-                    # only project if the point is in the bounding box of the geometry
-                    if (
-                        (self.bbox[gid][0, 0] < points[i, 0] < self.bbox[gid][0, 1])
-                        and (self.bbox[gid][1, 0] < points[i, 1] < self.bbox[gid][1, 1])
-                        and (self.bbox[gid][2, 0] < points[i, 2] < self.bbox[gid][2, 1])
-                    ):
-                        # project the point onto the VSP geometry
-                        dNew, rout, sout, tout = self.vspModel.FindRST(gid, 0, pnt)
-
-                        # check if we are closer
-                        if dNew < d:
-                            # save this info if we found a closer projection
-                            r[i] = rout
-                            s[i] = sout
-                            t[i] = tout
-                            geom[i] = gind
-                            d = dNew
-                    gind += 1
-
-            # check if the final d is larger than our previous largest value
-            dMax = max(d, dMax)
-
-            # We need to evaluate this pnt to get its coordinates in physical space
-            pnt = self.vspModel.CompPntRST(self.allComps[geom[i]], 0, r[i], s[i], t[i])
-            pts[i, 0] = pnt.x() * self.modelScale
-            pts[i, 1] = pnt.y() * self.modelScale
-            pts[i, 2] = pnt.z() * self.modelScale
+        # Keep track of the largest distance between cfd and vsp surfaces
+        dMax = max(1e-16, np.max(d, initial=0.0))
 
         # some debug info
         dMax_global = self.comm.allreduce(dMax, op=MPI.MAX)
@@ -800,32 +701,280 @@ class DVGeometryVSP(DVGeoSketch):
         """
 
         for ptSetName in self.pointSets:
-            # get the current coordinates of projection points
-            n = len(self.pointSets[ptSetName].points)
-            newPts = np.zeros((n, 3))
-
-            # newPts should get the new projected coords
-
             # get the info
             geom = self.pointSets[ptSetName].geom
             r = self.pointSets[ptSetName].r
             s = self.pointSets[ptSetName].s
             t = self.pointSets[ptSetName].t
 
-            # This can all be done with arrays if we group points wrt geometry
-            for i in range(n):
-                # evaluate the new projected point coordinates
-                pnt = self.vspModel.CompPntRST(self.allComps[geom[i]], 0, r[i], s[i], t[i])
-
-                # update the coordinates
-                newPts[i, :] = (pnt.x(), pnt.y(), pnt.z())
-
-            # scale vsp coordinates to mesh coordinates, do it safely above for now
-            newPts *= self.modelScale
+            # evaluate the new projected point coordinates and
+            # scale vsp coordinates to mesh coordinates
+            newPts = self._compPntRST(geom, r, s, t) * self.modelScale
 
             # set the updated coordinates
             self.pointSets[ptSetName].pts = newPts
 
+    def _projectPoints(self, points):
+        """
+        Project points onto the VSP geometry.
+
+        Parameters
+        ----------
+        points : array, size (N,3)
+            The coordinates to project
+
+        Returns
+        -------
+        geom : array, size (N)
+            Index of the component in self.allComps each point is projected to
+        r, s, t : arrays, size (N)
+            Volume parametric coordinates of the projections
+        d : array, size (N)
+            Distance between the points and their projections
+        """
+        npoints = len(points)
+
+        # first, to get a good initial guess on the geometry and u,v values,
+        # we can use the adt projections in pyspline
+        if npoints > 0:
+            # faceID has the index of the corresponding quad element.
+            # uv has the parametric u and v weights of the projected point.
+
+            faceID, uv = searchQuads(self.pts0.T, (self.conn + 1).T, points.T)
+            uv = uv.T
+            faceID -= 1  # Convert back to zero-based indexing.
+            # after this point we should have the projected points.
+
+        else:
+            faceID = np.zeros((0), "intc")
+            uv = np.zeros((0, 2), "intc")
+
+        # now we need to figure out which surfaces the points got projected to
+        # From the faceID we can back out what component each one is
+        # connected to. This way if we have intersecting components we
+        # only change the ones that are apart of the two surfaces.
+        cumFaceSizes = np.zeros(len(self.sizes) + 1, "intc")
+        for i in range(len(self.sizes)):
+            nCellI = self.sizes[i][0] - 1
+            nCellJ = self.sizes[i][1] - 1
+            cumFaceSizes[i + 1] = cumFaceSizes[i] + nCellI * nCellJ
+        compIDs = np.searchsorted(cumFaceSizes, faceID, side="right") - 1
+
+        # Initial guesses of the volume parametric coordinates, computed for all the points
+        # that got projected to the same geometry at once
+        rg = np.zeros(npoints)
+        sg = np.zeros(npoints)
+        for gind in np.unique(compIDs):
+            mask = compIDs == gind
+
+            # this is the global index of the first node of the projected element
+            nodeInd = self.conn[faceID[mask], 0]
+            # get the local index of this node
+            nn = nodeInd - self.cumSizes[gind]
+            # figure out the i and j indices of the first point of the element
+            # we projected this point to
+            ii = np.mod(nn, self.sizes[gind, 0])
+            jj = np.floor_divide(nn, self.sizes[gind, 0])
+
+            # calculate the global u and v change in this element
+            du = self.uv[gind][0][ii + 1] - self.uv[gind][0][ii]
+            dv = self.uv[gind][1][jj + 1] - self.uv[gind][1][jj]
+
+            # now get this points u,v coordinates on the vsp geometry and add
+            # compute the initial guess using the  tesselation data of the surface
+            ug = uv[mask, 0] * du + self.uv[gind][0][ii]
+            vg = uv[mask, 1] * dv + self.uv[gind][1][jj]
+
+            # We now convert the surface parameteric variables (u,v) to their equivalent volume parameterization (r,s,t)
+            # this will serve as our initial guess for the volume projection procedure
+            # In general, the conversion between the surface parametric coordinates (u, v)
+            # and the first two volume parameteric coordinate (r, s)
+            # are given by the equations below:
+            #   u = r
+            #   v_low = s
+            #   v_upper = 1 - s
+            # The 3rd parameteric coordinate interpolates between the the upper and lower surfaces
+            #   X(r,s,t) = t * X_upper(r, s) + (1 - t) * X_lower(r, s)
+            rg[mask] = ug
+            # Points with vg < 0.5 are on the lower surface, the others on the upper surface
+            sg[mask] = np.where(vg < 0.5, self.SMAX * 2.0 * vg, self.SMAX * 2.0 * (1.0 - vg))
+
+        # tg = 0.5 places the initial guess in the middle of the upper and lower surfaces for the volume
+        # Note: If the point we're looking for actually lies on the surface openvsp's
+        # projection algorithm (FindRSTVecGuess) will still quickly locate it, since our volume interpolation
+        # is linear through the depth (i.e. in t)
+        tg = np.full(npoints, 0.5)
+
+        return self._findRST(points, compIDs, rg, sg, tg)
+
+    def _findRST(self, points, compIDs, rg, sg, tg):
+        """
+        Find the volume parametric coordinates of the closest points on the
+        VSP geometry, starting from an initial guess. The points are projected
+        with one call to the vector OpenVSP API per component.
+
+        Parameters
+        ----------
+        points : array, size (N,3)
+            The coordinates to project
+        compIDs : array, size (N)
+            Index of the component in self.allComps of the initial guess
+        rg, sg, tg : arrays, size (N)
+            Initial guess of the volume parametric coordinates
+
+        Returns
+        -------
+        geom : array, size (N)
+            Index of the component in self.allComps each point is projected to
+        r, s, t : arrays, size (N)
+            Volume parametric coordinates of the projections
+        d : array, size (N)
+            Distance between the points and their projections
+        """
+        npoints = len(points)
+        geom = np.array(compIDs, dtype="intc")
+        r = np.zeros(npoints)
+        s = np.zeros(npoints)
+        t = np.zeros(npoints)
+        d = np.zeros(npoints)
+
+        # Now, find the closest volume projection
+        for gind in np.unique(geom):
+            ind = np.where(geom == gind)[0]
+            pntVec = self._getVec3dList(points[ind] * self.meshScale)
+            rOut, sOut, tOut, dOut = self.vspModel.FindRSTVecGuess(
+                self.allComps[gind], 0, pntVec, rg[ind], sg[ind], tg[ind]
+            )
+            r[ind], s[ind], t[ind], d[ind] = rOut, sOut, tOut, dOut
+
+        # if we dont have a good projection, try projecting again to surfaces
+        # with the slow code.
+        # for now, we need to check for all geometries separately.
+        # Just pick the one that yields the smallest d
+        failed = np.where(d > self.projTol)[0]
+        if len(failed) > 0:
+            for gind, gid in enumerate(self.allComps):
+                # only project if the point is in the bounding box of the geometry
+                bbox = self.bbox[gid]
+                inBox = np.all((bbox[:, 0] < points[failed]) & (points[failed] < bbox[:, 1]), axis=1)
+                ind = failed[inBox]
+                if len(ind) == 0:
+                    continue
+
+                # project the points onto the VSP geometry
+                pntVec = self._getVec3dList(points[ind] * self.meshScale)
+                rOut, sOut, tOut, dOut = (np.array(val) for val in self.vspModel.FindRSTVec(gid, 0, pntVec))
+
+                # save this info if we found a closer projection
+                closer = dOut < d[ind]
+                ind = ind[closer]
+                r[ind] = rOut[closer]
+                s[ind] = sOut[closer]
+                t[ind] = tOut[closer]
+                d[ind] = dOut[closer]
+                geom[ind] = gind
+
+        return geom, r, s, t, d
+
+    def _compPntRST(self, geom, r, s, t):
+        """
+        Evaluate points on the VSP geometry from their volume parametric
+        coordinates, with one call to the vector OpenVSP API per component.
+
+        Parameters
+        ----------
+        geom : array, size (N)
+            Index of the component in self.allComps of each point
+        r, s, t : arrays, size (N)
+            Volume parametric coordinates of the points
+
+        Returns
+        -------
+        pts : array, size (N,3)
+            Coordinates of the points in VSP model units
+        """
+        pts = np.zeros((len(geom), 3))
+        for gind in np.unique(geom):
+            ind = np.where(geom == gind)[0]
+            ptVec = self.vspModel.CompVecPntRST(self.allComps[gind], 0, r[ind], s[ind], t[ind])
+            pts[ind] = [(pnt.x(), pnt.y(), pnt.z()) for pnt in ptVec]
+
+        return pts
+
+    @staticmethod
+    def _getVec3dList(points):
+        """Convert an array of points to a list of OpenVSP vec3d objects"""
+        pntVec = []
+        for point in points:
+            pnt = openvsp.vec3d()
+            pnt.set_xyz(point[0], point[1], point[2])
+            pntVec.append(pnt)
+
+        return pntVec
+
+    def _getProjectionCacheKey(self, points):
+        """
+        Compute the key of the projection cache of a point set. It is a hash
+        of the VSP file, the component IDs, the scales, the projection
+        tolerance and the points on every processor. The component IDs are
+        needed because the projections store the index of the component in
+        self.allComps.
+        """
+        pointsHash = hashlib.sha256(np.ascontiguousarray(points).tobytes()).hexdigest()
+        pointsHashes = self.comm.allgather(pointsHash)
+
+        key = None
+        if self.comm.rank == 0:
+            sha = hashlib.sha256()
+            with open(self.fileName, "rb") as f:
+                sha.update(f.read())
+            sha.update("\n".join(self.allComps).encode())
+            sha.update(np.array([self.modelScale, self.meshScale, self.projTol]).tobytes())
+            sha.update("".join(pointsHashes).encode())
+            key = sha.hexdigest()
+
+        return self.comm.bcast(key, root=0)
+
+    def _readProjectionCache(self, fileName, key):
+        """
+        Read the projections of the local points from a cache file written by
+        :meth:`_writeProjectionCache`.
+
+        Returns
+        -------
+        projections : tuple or None
+            The (geom, r, s, t, d) arrays of the local points, see
+            :meth:`_projectPoints`, or None if there is no valid cache.
+        """
+        projections = None
+        if self.comm.rank == 0 and os.path.isfile(fileName):
+            with np.load(fileName) as data:
+                if str(data["key"]) == key:
+                    offsets = np.cumsum(data["sizes"])[:-1]
+                    arrays = [np.split(data[name], offsets) for name in ["geom", "r", "s", "t", "d"]]
+                    projections = list(zip(*arrays))
+
+        cacheLoaded = self.comm.bcast(projections is not None, root=0)
+        if not cacheLoaded:
+            if self.comm.rank == 0 and os.path.isfile(fileName):
+                print(f"DVGeometryVSP note:\nThe cached projections in {fileName} are out of date.")
+            return None
+
+        return self.comm.scatter(projections, root=0)
+
+    def _writeProjectionCache(self, fileName, key, geom, r, s, t, d):
+        """
+        Gather the projections of the points on all processors and write
+        them to a cache file on the root processor.
+        """
+        projections = self.comm.gather((geom, r, s, t, d), root=0)
+        if self.comm.rank == 0:
+            geom, r, s, t, d = (np.concatenate(arrays) for arrays in zip(*projections))
+            sizes = np.array([len(proj[0]) for proj in projections], dtype="intc")
+            # Pass a file handle so that numpy does not change the file name
+            with open(fileName, "wb") as f:
+                np.savez_compressed(f, key=key, sizes=sizes, geom=geom, r=r, s=s, t=t, d=d)
+
     def _getBBox(self, comp):
         """
         This function computes the bounding box of the component. We add some buffer on each
@@ -906,7 +1055,11 @@ class DVGeometryVSP(DVGeoSketch):
         this is slightly slower but avoids this issue. the final gradient has some error still,
         but much more managable and unimportant compared to errors introduced by FD itself.
         See issue https://github.com/mdolab/pygeo/issues/58 for updates.
+
+        The DVs are distributed over the procs based on their cost in the last call, see :func:`_getDVOwners()`.
         """
+        if self._reuseSurfJacobian():
+            return
 
         # timing stuff:
         t1 = time.time()
@@ -965,20 +1118,13 @@ class DVGeometryVSP(DVGeoSketch):
 
         # We need to evaluate all the points on respective procs for FD computations
 
-        # allocate memory
-        pts0 = np.zeros((nptsg, 3))
-
         # evaluate the points
-        for j in range(nptsg):
-            pnt = self.vspModel.CompPntRST(self.allComps[gg[j]], 0, rg[j], sg[j], tg[j])
-            pts0[j, :] = (pnt.x(), pnt.y(), pnt.z())
+        pts0 = self._compPntRST(gg, rg, sg, tg)
 
-        # determine how many DVs this proc will perturb.
-        n = 0
-        for iDV in range(len(dvKeys)):
-            # I have to do this one.
-            if iDV % nproc == rank:
-                n += 1
+        # determine which DVs this proc will perturb.
+        owners = self._getDVOwners(nDV, nproc)
+        n = np.count_nonzero(owners == rank)
+        localCosts = np.zeros(nDV)
 
         # allocate the approriate sized numpy array for the perturbed points
         ptsNew = np.zeros((n, nptsg, 3))
@@ -988,7 +1134,8 @@ class DVGeometryVSP(DVGeoSketch):
 
         for iDV in range(len(dvKeys)):
             # I have to do this one.
-            if iDV % nproc == rank:
+            if owners[iDV] == rank:
+                tdv = time.time()
                 # Step size for this particular DV
                 dh = self.DVs[dvKeys[iDV]].dh
 
@@ -1004,9 +1151,7 @@ class DVGeometryVSP(DVGeoSketch):
 
                 t11 = time.time()
                 # evaluate the points
-                for j in range(nptsg):
-                    pnt = self.vspModel.CompPntRST(self.allComps[gg[j]], 0, rg[j], sg[j], tg[j])
-                    ptsNew[i, j, :] = (pnt.x(), pnt.y(), pnt.z())
+                ptsNew[i, :, :] = self._compPntRST(gg, rg, sg, tg)
                 t12 = time.time()
                 teval += t12 - t11
 
@@ -1015,6 +1160,7 @@ class DVGeometryVSP(DVGeoSketch):
 
                 # Reset the DV
                 self.DVs[dvKeys[iDV]].value = dvSave.copy()
+                localCosts[iDV] = time.time() - tdv
 
                 # increment the counter
                 i += 1
@@ -1038,14 +1184,14 @@ class DVGeometryVSP(DVGeoSketch):
 
             t11 = time.time()
             # create the send/recv buffers for the scatter
-            if iDV % nproc == rank:
+            if owners[iDV] == rank:
                 sendbuf = [ptsNew[ii, :, :].flatten(), sizes * 3, disp * 3, MPI.DOUBLE]
             else:
                 sendbuf = [np.zeros((0, 3)), sizes * 3, disp * 3, MPI.DOUBLE]
             recvbuf = [ptsNewL, MPI.DOUBLE]
 
             # scatter the info from the proc that perturbed this DV to all procs
-            self.comm.Scatterv(sendbuf, recvbuf, root=(iDV % nproc))
+            self.comm.Scatterv(sendbuf, recvbuf, root=owners[iDV])
 
             t12 = time.time()
             tcomm += t12 - t11
@@ -1072,7 +1218,7 @@ class DVGeometryVSP(DVGeoSketch):
 
             # pertrub the local counter on this proc.
             # This loops over the DVs that this proc perturbed
-            if iDV % nproc == rank:
+            if owners[iDV] == rank:
                 ii += 1
 
         t2 = time.time()
@@ -1082,9 +1228,8 @@ class DVGeometryVSP(DVGeoSketch):
             print("evaluating the new points took", teval, "seconds")
             print("communication took", tcomm, "seconds")
 
-        # set the update flags
-        for ptSet in self.pointSets:
-            self.updatedJac[ptSet] = True
+        # save the DVs and costs for the next call and set the update flags
+        self._finalizeSurfJacobian(localCosts)
 
     def _getQuads(self):
         # build the quad mesh using the internal vsp geometry
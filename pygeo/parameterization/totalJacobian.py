@@ -0,0 +1,84 @@
+# External modules
+import numpy as np
+from scipy import sparse
+
+
+class TotalJacobian:
+    """
+    Storage for the transposed total Jacobian of a point set, of size
+    nDV x 3*nPts. The global design variables generally move every
+    point, so their rows are kept in a dense block. The local, section
+    and spanwise design variables only move the points in the support
+    of their control points, so their rows are kept in a CSR block.
+
+    Parameters
+    ----------
+    JT : array or sparse matrix, size (nDV, 3*nPts)
+        The transposed Jacobian
+    nDVGlobal : int
+        Number of global design variables. These are the first nDVGlobal
+        rows of JT.
+    """
+
+    def __init__(self, JT, nDVGlobal):
+        self.shape = JT.shape
+        self.nDVGlobal = nDVGlobal
+
+        if sparse.issparse(JT):
+            JT = JT.tocsr()
+            self.globalJT = JT[:nDVGlobal].toarray()
+        else:
+            self.globalJT = np.array(JT[:nDVGlobal])
+
+        self.localJT = sparse.csr_matrix(JT[nDVGlobal:])
+        self.localJT.eliminate_zeros()
+        self.localJT.sort_indices()
+
+    def dot(self, x):
+        """
+        Compute JT * x
+
+        Parameters
+        ----------
+        x : array, size (3*nPts) or (3*nPts, N)
+            The point vector(s)
+
+        Returns
+        -------
+        y : array, size (nDV) or (nDV, N)
+            The design variable vector(s)
+        """
+        return np.concatenate((self.globalJT.dot(x), self.localJT.dot(x)))
+
+    def transDot(self, y):
+        """
+        Compute J * y, the product with the transpose of the stored matrix
+
+        Parameters
+        ----------
+        y : array, size (nDV) or (nDV, N)
+            The design variable vector(s)
+
+        Returns
+        -------
+        x : array, size (3*nPts) or (3*nPts, N)
+            The point vector(s)
+        """
+        return self.globalJT.T.dot(y[: self.nDVGlobal]) + self.localJT.T.dot(y[self.nDVGlobal :])
+
+    def toarray(self):
+        """Return JT as a dense array"""
+        return np.vstack((self.globalJT, self.localJT.toarray()))
+
+    def tocsr(self):
+        """Return JT as a CSR matrix"""
+        return sparse.vstack((sparse.csr_matrix(self.globalJT), self.localJT), format="csr")
+
+    def __array__(self, dtype=None, copy=None):
+        return self.toarray() if dtype is None else self.toarray().astype(dtype)
+
+    @property
+    def nbytes(self):
+        """The memory used by the Jacobian in bytes"""
+        localJT = self.localJT
+        return self.globalJT.nbytes + localJT.data.nbytes + localJT.indices.nbytes + localJT.indptr.nbytes
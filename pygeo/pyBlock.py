@@ -1,18 +1,19 @@
 # Standard Python modules
 import copy
+import hashlib
 import os
 
 # External modules
 from baseclasses.utils import Error
 import numpy as np
 from pyspline import Volume
-from pyspline.utils import closeTecplot, openTecplot, writeTecplot3D
+from pyspline.utils import closeTecplot, openTecplot
 from scipy import sparse
 from scipy.sparse import linalg
 from scipy.spatial import ConvexHull
 
 # Local modules
-from .geo_utils import blendKnotVectors, readNValues
+from .geo_utils import blendKnotVectors, readPlot3DFile, writePlot3DFile, writeTecplot3DZone, writeTecplotBinaryFile
 from .topology import BlockTopology
 
 
@@ -31,7 +32,9 @@ class pyBlock:
 
     fileName : str
        Filename of the plot3d file to be loaded. Should have a .fmt or
-       .xyz extension. Also must be in ASCII format.
+       .xyz extension. ASCII, native endian binary (C-stream or Fortran
+       unformatted) and .npz files are supported; the format can be
+       given with the fileType keyword argument.
 
     FFD : bool
        Flag to indicate that this object is to be created as an FFD.
@@ -48,6 +51,12 @@ class pyBlock:
         maximum order of the splines used for the underlying formulation.
         Default is a 4th order spline in each direction if the dimensions
         allow.
+
+    topoCache : bool or str
+        Cache the block connectivity and global numbering so that it is
+        not recomputed for the same FFD. If True, the cache is stored
+        next to the plot3d file with a _topo.npz suffix; a string gives
+        the cache file name instead.
     """
 
     def __init__(self, initType, fileName=None, FFD=False, symmPlane=None, kmax=4, volBounds=None, **kwargs):
@@ -75,7 +84,7 @@ class pyBlock:
     #                     Initialization Types
     # ----------------------------------------------------------------------
 
-    def _readPlot3D(self, fileName, order="f", FFD=False, symmTol=0.001, kmax=4):
+    def _readPlot3D(self, fileName, order="f", FFD=False, symmTol=0.001, kmax=4, fileType=None, topoCache=None):
         """Load a plot3D file and create the splines to go with each
         patch. See the pyBlock() docstring for more information.
 
@@ -84,68 +93,40 @@ class pyBlock:
         order : {'f','c'}
             Internal ordering of plot3d file. Generally should be 'f'
             for fortran ordering. But could be 'c'.
+        fileType : {None, 'ascii', 'binary', 'fortran', 'npz'}
+            Format of the plot3d file, see :func:`geo_utils.readPlot3DFile`.
+            By default it is detected from the file.
+        topoCache : bool or str
+            Cache the FFD topology. If True, the cache is written next to
+            the plot3d file with a _topo.npz suffix; a str gives the cache
+            file name. The cache is only reused if the block corners, edge
+            and face midpoints and sizes hash to the same key.
         """
 
-        binary = False  # Binary read no longer supported.
-        f = open(fileName)
-        nVol = readNValues(f, 1, "int", False)[0]
-        sizes = readNValues(f, nVol * 3, "int", False).reshape((nVol, 3))
-        blocks = []
-        for i in range(nVol):
-            cur_size = sizes[i, 0] * sizes[i, 1] * sizes[i, 2]
-            blocks.append(np.zeros([sizes[i, 0], sizes[i, 1], sizes[i, 2], 3]))
-            for idim in range(3):
-                blocks[-1][:, :, :, idim] = readNValues(f, cur_size, "float", binary).reshape(
-                    (sizes[i, 0], sizes[i, 1], sizes[i, 2]), order=order
-                )
-        f.close()
-
-        def flip(axis, coords):
-            """Flip coordinates by plane defined by 'axis'"""
-            if axis.lower() == "x":
-                index = 0
-            elif axis.lower() == "y":
-                index = 1
-            elif axis.lower() == "z":
-                index = 2
-            coords[:, :, :, index] = -coords[:, :, :, index]
+        sizes, blocks = readPlot3DFile(fileName, order=order, fileType=fileType)
+        nVol = len(blocks)
+
+        if self.symmPlane is not None:
+            # duplicate and mirror the blocks. All blocks are mirrored at
+            # once by stacking their coefficients into a single array.
+            index = {"x": 0, "y": 1, "z": 2}[self.symmPlane.lower()]
+            blockSizes = [block.size // 3 for block in blocks]
+            mirrored = np.concatenate([block.reshape((-1, 3)) for block in blocks])
+
+            # set all coords within a certain tolerance of the symm plane
+            # to be exactly 0, then flip them by the plane
+            coord = mirrored[:, index]
+            coord[np.abs(coord) <= symmTol] = 0.0
+            np.negative(coord, out=coord)
 
             # HOWEVER just doing this results in a left-handed block (if
             # the original block was right handed). So we have to also
             # reverse ONE of the indices
-            coords[:, :, :, :] = coords[::-1, :, :, :]
-            # dims = coords.shape
-            # for k in range(dims[2]):
-            #     for j in range(dims[1]):
-            #         for idim in range(3):
-            #             self.coords[:, j, k, idim] = self.coords[::-1, j, k, idim]
-
-        def symmZero(axis, coords, tol):
-            """set all coords within a certain tolerance of the symm plan to be exactly 0"""
-
-            if axis.lower() == "x":
-                index = 0
-            elif axis.lower() == "y":
-                index = 1
-            elif axis.lower() == "z":
-                index = 2
-
-            dims = coords.shape
-            for k in range(dims[2]):
-                for j in range(dims[1]):
-                    for i in range(dims[0]):
-                        error = abs(coords[i, j, k, index])
-                        if error <= tol:
-                            coords[i, j, k, index] = 0
-
-        if self.symmPlane is not None:
-            # duplicate and mirror the blocks.
             newBlocks = []
-            for block in blocks:
-                newBlock = copy.deepcopy(block)
-                symmZero(self.symmPlane, newBlock, symmTol)
-                flip(self.symmPlane, newBlock)
-                newBlocks.append(newBlock)
+            offsets = np.cumsum(blockSizes)[:-1]
+            for block, newBlock in zip(blocks, np.split(mirrored, offsets)):
+                newBlocks.append(newBlock.reshape(block.shape)[::-1])
+
             # now create the appended list with double the blocks
             blocks += newBlocks
             # Extend sizes
@@ -216,7 +197,11 @@ class pyBlock:
             # end for (ivol loop)
 
             self.nVol = len(self.vols)
-            self._calcConnectivity(1e-4, 1e-4)
+            if topoCache is True:
+                topoCache = os.path.splitext(fileName)[0] + "_topo.npz"
+            elif not topoCache:
+                topoCache = None
+            self._calcConnectivity(1e-4, 1e-4, cacheFile=topoCache)
             nCtl = self.topo.nGlobal
             self.coef = np.zeros((nCtl, 3))
             self._setVolumeCoef()
@@ -347,7 +332,7 @@ class pyBlock:
             sizes.append([self.vols[ivol].nClu, self.vols[ivol].nCtlv, self.vols[ivol].nCtlw])
         self.topo.calcGlobalNumbering(sizes, greedyReorder=greedyReorder)
 
-    def _calcConnectivity(self, nodeTol, edgeTol):
+    def _calcConnectivity(self, nodeTol, edgeTol, cacheFile=None):
         """Determine the blocking connectivity
 
         Parameters
@@ -356,6 +341,9 @@ class pyBlock:
             Tolerance for identical nodes
         edgeTol :float
             Tolerance for midpoint of edges to determine if they are the same
+        cacheFile : str
+            If given, read the topology from this file if it was computed
+            from the same data, otherwise compute it and write it there.
         """
         coords = np.zeros((self.nVol, 26, 3))
 
@@ -369,12 +357,27 @@ class pyBlock:
             for iface in range(6):
                 coords[ivol, 20 + iface] = self.vols[ivol].getMidPointFace(iface)
 
-        self.topo = BlockTopology(coords, nodeTol=nodeTol, edgeTol=edgeTol)
         sizes = []
         for ivol in range(self.nVol):
             sizes.append([self.vols[ivol].nCtlu, self.vols[ivol].nCtlv, self.vols[ivol].nCtlw])
+
+        if cacheFile is not None:
+            # The topology only depends on these, so we use them as the cache key
+            sha = hashlib.sha256(coords.tobytes())
+            sha.update(np.array(sizes, "intc").tobytes())
+            sha.update(np.array([nodeTol, edgeTol]).tobytes())
+            key = sha.hexdigest()
+
+            self.topo = BlockTopology()
+            if self.topo.readCache(cacheFile, key):
+                return
+
+        self.topo = BlockTopology(coords, nodeTol=nodeTol, edgeTol=edgeTol)
         self.topo.calcGlobalNumbering(sizes)
 
+        if cacheFile is not None:
+            self.topo.writeCache(cacheFile, key)
+
     def printConnectivity(self):
         """
         Print the connectivity information to the screen
@@ -482,14 +485,23 @@ class pyBlock:
     #                        Output Functions
     # ----------------------------------------------------------------------
     def writeTecplot(
-        self, fileName, vols=True, coef=True, orig=False, volLabels=False, edgeLabels=False, nodeLabels=False
+        self,
+        fileName,
+        vols=True,
+        coef=True,
+        orig=False,
+        volLabels=False,
+        edgeLabels=False,
+        nodeLabels=False,
+        fileType="ascii",
     ):
         """Write a tecplot visualization of the pyBlock object.
 
         Parameters
         ----------
         fileName : str
-            Filename of tecplot file. Should have a .dat extension
+            Filename of tecplot file. Should have a .dat extension, or
+            a .plt extension for binary files
 
         vols : bool. Default is True
             Flag to write interpolated volumes
@@ -511,22 +523,39 @@ class pyBlock:
         nodeLabels: bool. Default is False
             Flag to write node labels in a separate tecplot file; filename
             is derived from the supplied fileName.
+
+        fileType : {'ascii', 'binary'}
+            The format of the tecplot file. Binary files are written with
+            :func:`geo_utils.writeTecplotBinaryFile` and are much faster to
+            write for large volumes, so they are better suited to files
+            written at every iteration. The label files are always ascii.
         """
+        if fileType not in ["ascii", "binary"]:
+            raise ValueError(f"Unknown tecplot file type {fileType}")
 
-        # Open File and output header
-        f = openTecplot(fileName, 3)
+        # Open File and output header. The zones of binary files are
+        # collected and written at once.
+        if fileType == "binary":
+            f = []
+        else:
+            f = openTecplot(fileName, 3)
 
         if vols:
             for ivol in range(self.nVol):
                 self.vols[ivol].computeData()
-                writeTecplot3D(f, "interpolated", self.vols[ivol].data)
+                writeTecplot3DZone(f, "interpolated", self.vols[ivol].data)
         if orig:
             for ivol in range(self.nVol):
-                writeTecplot3D(f, "orig_data", self.vols[ivol].X)
+                writeTecplot3DZone(f, "orig_data", self.vols[ivol].X)
 
         if coef:
             for ivol in range(self.nVol):
-                writeTecplot3D(f, "control_pts", self.vols[ivol].coef)
+                writeTecplot3DZone(f, "control_pts", self.vols[ivol].coef)
+
+        if fileType == "binary":
+            writeTecplotBinaryFile(fileName, f)
+        else:
+            closeTecplot(f)
 
         # ---------------------------------------------
         #    Write out labels:
@@ -569,14 +598,11 @@ class pyBlock:
             nNodes = len(np.unique(self.topo.nodeLink.flatten()))
             nodeCoord = np.zeros((nNodes, 3))
 
-            for i in range(nNodes):
-                # Try to find node i
-                for ivol in range(self.nVol):
-                    for inode in range(8):
-                        if self.topo.nodeLink[ivol][inode] == i:
-                            coordinate = self.vols[ivol].getValueCorner(inode)
-
-                nodeCoord[i] = coordinate
+            # Later volumes overwrite earlier ones, so each node gets the
+            # corner value of the last volume that contains it
+            for ivol in range(self.nVol):
+                for inode in range(8):
+                    nodeCoord[self.topo.nodeLink[ivol][inode]] = self.vols[ivol].getValueCorner(inode)
 
             # Split the filename off
             dirName, fileName = os.path.split(fileName)
@@ -593,39 +619,25 @@ class pyBlock:
                 f2.write("%s" % (textString))
             f2.close()
 
-        closeTecplot(f)
-
-    def writePlot3d(self, fileName):
-        """Write the grid to a plot3d file. This isn't efficient as it
-        used ASCII format. Only useful for quick visualizations
+    def writePlot3d(self, fileName, fileType="ascii"):
+        """Write the grid to a plot3d file.
 
         Parameters
         ----------
         fileName : plot3d file name.
             Should end in .xyz
+        fileType : {'ascii', 'binary', 'fortran', 'npz'}
+            Format of the file, see :func:`geo_utils.writePlot3DFile`.
+            The binary formats are much faster to write and read for
+            large grids.
         """
-
-        sizes = []
-        for ivol in range(self.nVol):
-            sizes.append(self.vols[ivol].Nu)
-            sizes.append(self.vols[ivol].Nv)
-            sizes.append(self.vols[ivol].Nw)
-
-        f = open(fileName, "w")
-        f.write("%d\n" % (self.nVol))
-        np.array(sizes).tofile(f, sep=" ")
-        f.write("\n")
+        blocks = []
         for ivol in range(self.nVol):
-            vals = self.vols[ivol](self.vols[ivol].U, self.vols[ivol].V, self.vols[ivol].W)
-            vals[:, :, :, 0].flatten(order="F").tofile(f, sep="\n")
-            f.write("\n")
-            vals[:, :, :, 1].flatten(order="F").tofile(f, sep="\n")
-            f.write("\n")
-            vals[:, :, :, 2].flatten(order="F").tofile(f, sep="\n")
-            f.write("\n")
-        f.close()
-
-    def writePlot3dCoef(self, fileName):
+            blocks.append(self.vols[ivol](self.vols[ivol].U, self.vols[ivol].V, self.vols[ivol].W))
+
+        writePlot3DFile(fileName, blocks, fileType=fileType)
+
+    def writePlot3dCoef(self, fileName, fileType="ascii"):
         """Write the *coefficients* of the volumes to a plot3d
         file.
 
@@ -633,27 +645,13 @@ class pyBlock:
         ----------
         fileName : plot3d file name.
             Should end in .fmt
+        fileType : {'ascii', 'binary', 'fortran', 'npz'}
+            Format of the file, see :func:`geo_utils.writePlot3DFile`.
+            All formats can be read back to create a pyBlock.
         """
+        blocks = [self.vols[ivol].coef for ivol in range(self.nVol)]
 
-        sizes = []
-        for ivol in range(self.nVol):
-            sizes.append(self.vols[ivol].nCtlu)
-            sizes.append(self.vols[ivol].nCtlv)
-            sizes.append(self.vols[ivol].nCtlw)
-
-        f = open(fileName, "w")
-        f.write("%d\n" % (self.nVol))
-        np.array(sizes).tofile(f, sep=" ")
-        f.write("\n")
-        for ivol in range(self.nVol):
-            vals = self.vols[ivol].coef
-            vals[:, :, :, 0].flatten(order="F").tofile(f, sep="\n")
-            f.write("\n")
-            vals[:, :, :, 1].flatten(order="F").tofile(f, sep="\n")
-            f.write("\n")
-            vals[:, :, :, 2].flatten(order="F").tofile(f, sep="\n")
-            f.write("\n")
-        f.close()
+        writePlot3DFile(fileName, blocks, fileType=fileType)
 
     # ----------------------------------------------------------------------
     #               Update Functions
@@ -8,7 +8,7 @@ import numpy as np
 from pyspline import Curve, Surface
 from pyspline.utils import closeTecplot, openTecplot, writeTecplot2D
 from scipy import sparse
-from scipy.sparse.linalg import factorized
+from scipy.sparse.linalg import splu
 
 # Local modules
 from . import geo_utils
@@ -80,6 +80,8 @@ class pyGeo:
         self.nSurf = None  # The total number of surfaces
         self.coef = None  # The global (reduced) set of control
         # points
+        self._fitNN = None  # The basis matrix and factorization
+        self._fitLU = None  # of the last global fit
 
         if initType == "plot3d":
             self._readPlot3D(*args, **kwargs)
@@ -741,7 +743,8 @@ class pyGeo:
         """
         Perform a global B-spline surface fit to determine the
         coefficients of each patch. This is only used with an plot3D
-        init type
+        init type. The factorization of the normal equations is kept
+        and reused if the same surfaces are refit.
         """
 
         print("Global Fitting")
@@ -758,51 +761,55 @@ class pyGeo:
         origTopo.calcGlobalNumbering(sizes)
         N = origTopo.nGlobal
         print(" -> Creating global point list")
-        pts = np.zeros((N, 3))
-        for ii in range(N):
-            pts[ii] = self.surfs[origTopo.gIndex[ii][0][0]].X[origTopo.gIndex[ii][0][1], origTopo.gIndex[ii][0][2]]
 
-        # Get the maximum k (ku, kv for each surf)
-        kmax = 2
+        # Stack the data of all surfaces. The first occurrence of each
+        # global node in (surface, i, j) order is the one used for the fit
+        gInd = np.concatenate([origTopo.lIndex[isurf].flatten() for isurf in range(self.nSurf)])
+        surfID = np.concatenate([np.full(self.surfs[isurf].X[:, :, 0].size, isurf) for isurf in range(self.nSurf)])
+        X = np.concatenate([self.surfs[isurf].X.reshape((-1, 3)) for isurf in range(self.nSurf)])
+        U = np.concatenate([self.surfs[isurf].U.flatten() for isurf in range(self.nSurf)])
+        V = np.concatenate([self.surfs[isurf].V.flatten() for isurf in range(self.nSurf)])
+
+        _, first = np.unique(gInd, return_index=True)
+        pts = X[first]
+        u = U[first]
+        v = V[first]
+        surfID = surfID[first]
+
+        # Assemble the basis matrix surface by surface
+        rows = []
+        cols = []
+        vals = []
         for isurf in range(self.nSurf):
-            if self.surfs[isurf].ku > kmax:
-                kmax = self.surfs[isurf].ku
-            if self.surfs[isurf].kv > kmax:
-                kmax = self.surfs[isurf].kv
-
-        nnz = N * kmax * kmax
-        vals = np.zeros(nnz)
-        rowPtr = [0]
-        colInd = np.zeros(nnz, "intc")
-
-        for ii in range(N):
-            isurf = origTopo.gIndex[ii][0][0]
-            i = origTopo.gIndex[ii][0][1]
-            j = origTopo.gIndex[ii][0][2]
-
-            u = self.surfs[isurf].U[i, j]
-            v = self.surfs[isurf].V[i, j]
-
-            vals, colInd = self.surfs[isurf].getBasisPt(u, v, vals, rowPtr[ii], colInd, self.topo.lIndex[isurf])
-
-            kinc = self.surfs[isurf].ku * self.surfs[isurf].kv
-            rowPtr.append(rowPtr[-1] + kinc)
-
-        # Now we can crop out any additional values in col_ptr and vals
-        vals = vals[: rowPtr[-1]]
-        colInd = colInd[: rowPtr[-1]]
-        # Now make a sparse matrix
-
-        NN = sparse.csr_matrix((vals, colInd, rowPtr))
-        print(" -> Multiplying N^T * N")
-        NNT = NN.T
-        NTN = NNT * NN
-        print(" -> Factorizing...")
-        solve = factorized(NTN)
+            surf = self.surfs[isurf]
+            nodes = np.where(surfID == isurf)[0]
+            startU, Bu = geo_utils.basisFunctions(surf.tu, surf.ku, u[nodes])
+            startV, Bv = geo_utils.basisFunctions(surf.tv, surf.kv, v[nodes])
+
+            iu = startU[:, None, None] + np.arange(surf.ku)[None, :, None]
+            iv = startV[:, None, None] + np.arange(surf.kv)[None, None, :]
+            cols.append(self.topo.lIndex[isurf][iu, iv].flatten())
+            vals.append((Bu[:, :, None] * Bv[:, None, :]).flatten())
+            rows.append(np.repeat(nodes, surf.ku * surf.kv))
+
+        NN = sparse.csr_matrix(
+            (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(N, nCtl),
+        )
+        NNT = NN.T.tocsr()
+
+        # Reuse the factorization if the basis matrix has not changed
+        if self._fitNN is None or self._fitNN.shape != NN.shape or (self._fitNN != NN).nnz > 0:
+            print(" -> Multiplying N^T * N")
+            NTN = NNT @ NN
+            print(" -> Factorizing...")
+            self._fitLU = splu(NTN.tocsc())
+            self._fitNN = NN
+        else:
+            print(" -> Reusing factorization")
+
         print(" -> Back Solving...")
-        self.coef = np.zeros((nCtl, 3))
-        for idim in range(3):
-            self.coef[:, idim] = solve(NNT * pts[:, idim])
+        self.coef = self._fitLU.solve(NNT @ pts)
 
         print(" -> Setting Surface Coefficients...")
         self._updateSurfaceCoef()
@@ -1266,7 +1273,7 @@ class pyGeo:
 
         return result, patchID
 
-    def projectPoints(self, points, *args, surfs=None, **kwargs):
+    def projectPoints(self, points, *args, surfs=None, boundsFilter=True, **kwargs):
         """Project on or more points onto the nearest surface.
 
         Parameters
@@ -1279,6 +1286,12 @@ class pyGeo:
             Indices of surface defining subset for which to use for
             projection
 
+        boundsFilter : bool
+            If True, each point is only projected onto the surfaces whose
+            bounding box may contain the closest point. A surface is
+            skipped if the distance to its bounding box is larger than
+            the distance to the farthest corner of another bounding box.
+
         Returns
         -------
         u : float or array
@@ -1292,29 +1305,42 @@ class pyGeo:
         if surfs is None:
             surfs = np.arange(self.nSurf)
 
+        points = np.atleast_2d(points)
         N = len(points)
-        U = np.zeros((N, len(surfs)))
-        V = np.zeros((N, len(surfs)))
-        D = np.zeros((N, len(surfs), 3))
-        for i in range(len(surfs)):
-            isurf = surfs[i]
-            U[:, i], V[:, i], D[:, i, :] = self.surfs[isurf].projectPoint(points, *args, **kwargs)
+        nSurf = len(surfs)
+
+        if boundsFilter:
+            xMin = np.zeros((nSurf, 3))
+            xMax = np.zeros((nSurf, 3))
+            for i in range(nSurf):
+                xMin[i], xMax[i] = self.surfs[surfs[i]].getBounds()
+
+            # Lower bound on the distance from each point to each surface
+            # is the distance to its bounding box, and the upper bound is
+            # the distance to the farthest corner of the box
+            pts = points[:, None, :]
+            lower = np.linalg.norm(np.maximum(np.maximum(xMin - pts, pts - xMax), 0.0), axis=2)
+            upper = np.linalg.norm(np.maximum(np.abs(xMin - pts), np.abs(pts - xMax)), axis=2)
+            candidates = lower <= np.min(upper, axis=1)[:, None]
+        else:
+            candidates = np.ones((N, nSurf), dtype=bool)
 
-        u = np.zeros(N)
-        v = np.zeros(N)
-        patchID = np.zeros(N, "intc")
+        U = np.zeros((N, nSurf))
+        V = np.zeros((N, nSurf))
+        dist = np.full((N, nSurf), np.inf)
+        for i in range(nSurf):
+            isurf = surfs[i]
+            ind = np.where(candidates[:, i])[0]
+            if len(ind) == 0:
+                continue
+            U[ind, i], V[ind, i], D = self.surfs[isurf].projectPoint(points[ind], *args, **kwargs)
+            dist[ind, i] = np.linalg.norm(D, axis=-1)
 
         # Now post-process to get the lowest one
-        for i in range(N):
-            d0 = np.linalg.norm(D[i, 0])
-            u[i] = U[i, 0]
-            v[i] = V[i, 0]
-            patchID[i] = surfs[0]
-            for j in range(len(surfs)):
-                if np.linalg.norm(D[i, j]) < d0:
-                    d0 = np.linalg.norm(D[i, j])
-                    u[i] = U[i, j]
-                    v[i] = V[i, j]
-                    patchID[i] = surfs[j]
+        best = np.argmin(dist, axis=1)
+        rows = np.arange(N)
+        u = U[rows, best]
+        v = V[rows, best]
+        patchID = np.array(surfs, "intc")[best]
 
         return u, v, patchID
@@ -7,6 +7,7 @@ from pyspline import Surface
 from pyspline.utils import closeTecplot, line, openTecplot, writeTecplot1D
 
 # Local modules
+from . import geo_utils
 from .topology import CurveTopology
 
 
@@ -205,7 +206,7 @@ class pyNetwork:
 
         return Xmin0, Xmax0
 
-    def projectRays(self, points, axis, curves=None, raySize=1.5, **kwargs):
+    def projectRays(self, points, axis, curves=None, raySize=1.5, batched=True, **kwargs):
         """Given a set of points and a vector defining a direction,
         i.e. a ray, determine the minimum distance between these rays
         and any of the curves this object has.
@@ -232,6 +233,11 @@ class pyNetwork:
             perpendicular to the axis vector. The default of 1.5 works in most
             cases but can cause unexpected behavior sometimes which can be fixed
             by increasing the default.
+        batched : bool
+            If True, all rays are projected onto each curve at once. Linear
+            (k=2) curves are solved in closed form and higher order curves
+            use a vectorized Newton iteration. Otherwise, each ray is
+            projected individually with Curve.projectCurve().
         kwargs : dict
             Keyword arguments passed to Curve.projectCurve() function
 
@@ -244,13 +250,13 @@ class pyNetwork:
             to the point(s).
         """
 
+        points = np.atleast_2d(points)
+
         # Do point project to determine the approximate distance such
         # that we know how large to make the line representing the ray.
         curveID0, s0 = self.projectPoints(points, curves=curves, **kwargs)
-
-        D0 = np.zeros((len(s0), 3), "d")
-        for i in range(len(s0)):
-            D0[i, :] = self.curves[curveID0[i]](s0[i]) - points[i]
+        D0 = self._evalCurves(curveID0, s0) - points
+        rayLength = raySize * np.linalg.norm(D0, axis=1)
 
         if curves is None:
             curves = np.arange(self.nCurve)
@@ -258,38 +264,35 @@ class pyNetwork:
         # Now do the same calc as before
         N = len(points)
         S = np.zeros((N, len(curves)))
+        T = np.zeros((N, len(curves)))
         D = np.zeros((N, len(curves), 3))
 
+        rayBeg = points - axis * rayLength[:, None]
+        rayEnd = points + axis * rayLength[:, None]
+
         for i in range(len(curves)):
             icurve = curves[i]
-            for j in range(N):
-                ray = line(
-                    points[j] - axis * raySize * np.linalg.norm(D0[j]),
-                    points[j] + axis * raySize * np.linalg.norm(D0[j]),
-                )
-
-                S[j, i], t, D[j, i, :] = self.curves[icurve].projectCurve(ray, nIter=2000)
-                if t == 0.0 or t == 1.0:
-                    print(
-                        "Warning: The link for attached point {:d} was drawn"
-                        "from the curve to the end of the ray,"
-                        "indicating that the ray might not have been long"
-                        "enough to intersect the nearest curve.".format(j)
-                    )
-
-        s = np.zeros(N)
-        curveID = np.zeros(N, "intc")
+            if batched:
+                S[:, i], T[:, i], D[:, i, :] = self._projectSegments(self.curves[icurve], rayBeg, rayEnd)
+            else:
+                for j in range(N):
+                    ray = line(rayBeg[j], rayEnd[j])
+                    S[j, i], T[j, i], D[j, i, :] = self.curves[icurve].projectCurve(ray, nIter=2000)
 
         # Now post-process to get the lowest one
-        for i in range(N):
-            d0 = np.linalg.norm(D[i, 0])
-            s[i] = S[i, 0]
-            curveID[i] = curves[0]
-            for j in range(len(curves)):
-                if np.linalg.norm(D[i, j]) < d0:
-                    d0 = np.linalg.norm(D[i, j])
-                    s[i] = S[i, j]
-                    curveID[i] = curves[j]
+        best = np.argmin(np.linalg.norm(D, axis=2), axis=1)
+        rows = np.arange(N)
+        s = S[rows, best]
+        t = T[rows, best]
+        curveID = np.array(curves, "intc")[best]
+
+        for j in np.where((t == 0.0) | (t == 1.0))[0]:
+            print(
+                "Warning: The link for attached point {:d} was drawn"
+                "from the curve to the end of the ray,"
+                "indicating that the ray might not have been long"
+                "enough to intersect the nearest curve.".format(j)
+            )
 
         return curveID, s
 
@@ -327,23 +330,14 @@ class pyNetwork:
             icurve = curves[i]
             S[:, i], D[:, i, :] = self.curves[icurve].projectPoint(points, *args, **kwargs)
 
-        s = np.zeros(N)
-        curveID = np.zeros(N, "intc")
-
         # Now post-process to get the lowest one
-        for i in range(N):
-            d0 = np.linalg.norm(D[i, 0])
-            s[i] = S[i, 0]
-            curveID[i] = curves[0]
-            for j in range(len(curves)):
-                if np.linalg.norm(D[i, j]) < d0:
-                    d0 = np.linalg.norm(D[i, j])
-                    s[i] = S[i, j]
-                    curveID[i] = curves[j]
+        best = np.argmin(np.linalg.norm(D, axis=2), axis=1)
+        s = S[np.arange(N), best]
+        curveID = np.array(curves, "intc")[best]
 
         return curveID, s
 
-    def intersectPlanes(self, points, axis, curves=None, raySize=1.5, **kwargs):
+    def intersectPlanes(self, points, axis, curves=None, raySize=1.5, batched=True, **kwargs):
         """Find the intersection of the curves with the plane defined by the points and
         the normal vector. The ray size is used to define the extent of the plane
         about the points. The closest intersection to the original point is taken.
@@ -363,6 +357,10 @@ class pyNetwork:
         raySize : float
             To define the plane, we use the point coordinates and the normal direction.
             The plane is extended by raySize in all directions.
+        batched : bool
+            If True, the intersections of all planes with each curve are
+            computed at once. Points whose plane does not intersect the
+            curve fall back to the Surface.projectCurve() approach.
         kwargs : dict
             Keyword arguments passed to Surface.projectCurve() function
 
@@ -406,13 +404,26 @@ class pyNetwork:
         if curves is None:
             curves = np.arange(self.nCurve)
 
+        points = np.atleast_2d(points)
         N = len(points)
         S = np.zeros((N, len(curves)))
         D = np.zeros((N, len(curves), 3))
+        # distance from each point to the intersection, used to pick
+        # the closest intersection when several curves cross the plane
+        dist = np.zeros((N, len(curves)))
+        eps = kwargs.get("eps", 1e-10)
 
         for i in range(len(curves)):
             icurve = curves[i]
-            for j in range(N):
+            if batched:
+                found, S[:, i], _ = self._intersectPlanesCurve(
+                    self.curves[icurve], points, axis, dir1 / raySize, dir2 / raySize, raySize
+                )
+                projInd = np.where(~found)[0]
+            else:
+                projInd = np.arange(N)
+
+            for j in projInd:
                 # we need to initialize a pySurface object for this point
                 # the point is perturbed in dir 1 and dir2 to get 4 corners of the plane
                 point = points[j]
@@ -451,18 +462,182 @@ class pyNetwork:
                         "enough to intersect the nearest curve.".format(j)
                     )
 
+            # the distance to the intersection is computed the same way for both approaches
+            X = self.curves[icurve](S[:, i]).reshape((-1, 3))
+            rel = X - points
+            dist[:, i] = np.linalg.norm(rel, axis=1)
+
+            # the projections that hit the plane have no distance to it,
+            # like the intersections found by the batched approach
+            hit = (
+                (np.abs(np.dot(rel[projInd], axis)) <= eps)
+                & (np.abs(np.dot(rel[projInd], dir1 / raySize)) <= raySize)
+                & (np.abs(np.dot(rel[projInd], dir2 / raySize)) <= raySize)
+            )
+            D[projInd[hit], i] = 0.0
+
+        # Now post-process to get the lowest one. Ties in the distance to
+        # the plane are broken by the distance to the original point.
+        best = np.lexsort((dist, np.linalg.norm(D, axis=2)), axis=1)[:, 0]
+        s = S[np.arange(N), best]
+        curveID = np.array(curves, "intc")[best]
+
+        return curveID, s
+
+    # ----------------------------------------------------------------------
+    #               Batched Projection Functions
+    # ----------------------------------------------------------------------
+
+    def _evalCurves(self, curveID, s):
+        """Evaluate the curves given by curveID at the parameters s"""
+        X = np.zeros((len(s), 3))
+        for icurve in np.unique(curveID):
+            mask = curveID == icurve
+            X[mask] = self.curves[icurve](s[mask]).reshape((-1, 3))
+
+        return X
+
+    def _getPolyline(self, curve, nSample=10):
+        """
+        Return a polyline approximation of a curve and the curve parameters
+        of its vertices. Linear curves are represented exactly by their
+        control points.
+        """
+        if curve.k == 2:
+            return curve.coef.real, curve.t[1:-1]
+
+        sv = np.linspace(curve.t[0], curve.t[-1], max(nSample * curve.nCtl, 2))
+
+        return geo_utils.curveValues(curve.t, curve.k, curve.coef.real, sv), sv
+
+    def _projectSegments(self, curve, beg, end, nIter=50, tol=1e-15, chunkSize=1000):
+        """
+        Find the closest points between a curve and a set of line segments.
+        The segments are first projected onto a polyline approximation of the
+        curve in closed form. For higher order curves, the result is refined
+        with a Newton iteration over all segments at once.
+
+        Returns
+        -------
+        s : array
+            The parameters of the closest points on the curve
+        t : array
+            The parameters of the closest points on the segments
+        D : array of size (N, 3)
+            The vector between the closest points
+        """
+        X, sv = self._getPolyline(curve)
+        N = len(beg)
         s = np.zeros(N)
-        curveID = np.zeros(N, "intc")
+        t = np.zeros(N)
+        D = np.zeros((N, 3))
+
+        # Process the points in chunks to limit the size of the (N, nSeg, 3) arrays
+        for i0 in range(0, N, chunkSize):
+            i1 = min(i0 + chunkSize, N)
+            a, b, dSeg = geo_utils.closestPointsSegments(X[None, :-1], X[None, 1:], beg[i0:i1, None], end[i0:i1, None])
+            seg = np.argmin(np.linalg.norm(dSeg, axis=2), axis=1)
+            rows = np.arange(i1 - i0)
+            s[i0:i1] = sv[seg] + a[rows, seg] * (sv[seg + 1] - sv[seg])
+            t[i0:i1] = b[rows, seg]
+            D[i0:i1] = dSeg[rows, seg]
+
+        if curve.k == 2:
+            return s, t, D
+
+        # Newton iteration on the distance between the curve and the segment,
+        # where the segment parameter is eliminated by the closest point condition
+        d = end - beg
+        dd = np.sum(d * d, axis=1)
+        safeDD = np.where(dd > 0.0, dd, 1.0)
+        t1, k1, c1 = geo_utils.derivativeCurve(curve.t, curve.k, curve.coef.real)
+        t2, k2, c2 = geo_utils.derivativeCurve(t1, k1, c1)
+        maxStep = np.max(np.diff(sv))
+
+        for _ in range(nIter):
+            C = geo_utils.curveValues(curve.t, curve.k, curve.coef.real, s)
+            dC = geo_utils.curveValues(t1, k1, c1, s)
+            ddC = geo_utils.curveValues(t2, k2, c2, s)
+
+            t = np.clip(np.sum((C - beg) * d, axis=1) / safeDD, 0.0, 1.0)
+            r = C - (beg + t[:, None] * d)
+
+            # The tangent component along the segment does not change the
+            # distance when the segment parameter is not at a bound
+            free = (t > 0.0) & (t < 1.0)
+            dCp = dC - (free * np.sum(dC * d, axis=1) / safeDD)[:, None] * d
+
+            g = np.sum(r * dC, axis=1)
+            H = np.sum(dCp * dCp, axis=1) + np.sum(r * ddC, axis=1)
+            step = np.where(H > 0.0, -g / np.where(H > 0.0, H, 1.0), -np.sign(g) * maxStep)
+            step = np.clip(step, -maxStep, maxStep)
+
+            sNew = np.clip(s + step, curve.t[0], curve.t[-1])
+            converged = np.max(np.abs(sNew - s)) < tol
+            s = sNew
+            if converged:
+                break
+
+        C = geo_utils.curveValues(curve.t, curve.k, curve.coef.real, s)
+        t = np.clip(np.sum((C - beg) * d, axis=1) / safeDD, 0.0, 1.0)
+        D = (beg + t[:, None] * d) - C
+
+        return s, t, D
+
+    def _intersectPlanesCurve(self, curve, points, axis, dir1, dir2, raySize, nIter=50, tol=1e-15):
+        """
+        Intersect a curve with a set of square planes centered at the points.
+        The planes have the normal axis and extend by raySize along the unit
+        vectors dir1 and dir2. If a curve crosses a plane more than once,
+        the intersection closest to the point is taken.
 
-        # Now post-process to get the lowest one
-        for i in range(N):
-            d0 = np.linalg.norm(D[i, 0])
-            s[i] = S[i, 0]
-            curveID[i] = curves[0]
-            for j in range(len(curves)):
-                if np.linalg.norm(D[i, j]) < d0:
-                    d0 = np.linalg.norm(D[i, j])
-                    s[i] = S[i, j]
-                    curveID[i] = curves[j]
+        Returns
+        -------
+        found : array of bool
+            Flag for each point if an intersection was found within the plane
+        s : array
+            The curve parameters of the intersections
+        X : array of size (N, 3)
+            The intersection coordinates
+        """
+        X, sv = self._getPolyline(curve)
+        N = len(points)
 
-        return curveID, s
+        # Signed distance of the polyline vertices from each plane
+        h = np.dot(X[None, :, :] - points[:, None, :], axis)
+        h0 = h[:, :-1]
+        h1 = h[:, 1:]
+        cross = ((h0 <= 0.0) & (h1 >= 0.0)) | ((h0 >= 0.0) & (h1 <= 0.0))
+        dh = h0 - h1
+        a = np.where(dh != 0.0, h0 / np.where(dh != 0.0, dh, 1.0), 0.0)
+
+        # Check that the crossings lie within the extent of the planes
+        xCross = X[None, :-1] + a[:, :, None] * (X[None, 1:] - X[None, :-1])
+        rel = xCross - points[:, None, :]
+        inPlane = (np.abs(np.dot(rel, dir1)) <= raySize) & (np.abs(np.dot(rel, dir2)) <= raySize)
+        valid = cross & inPlane
+
+        distCross = np.where(valid, np.linalg.norm(rel, axis=2), np.inf)
+        seg = np.argmin(distCross, axis=1)
+        rows = np.arange(N)
+        found = np.isfinite(distCross[rows, seg])
+        s = sv[seg] + a[rows, seg] * (sv[seg + 1] - sv[seg])
+
+        if curve.k > 2:
+            # Refine the crossing within its span with Newton's method
+            t1, k1, c1 = geo_utils.derivativeCurve(curve.t, curve.k, curve.coef.real)
+            sLow = sv[seg]
+            sHigh = sv[seg + 1]
+            for _ in range(nIter):
+                hVal = np.dot(geo_utils.curveValues(curve.t, curve.k, curve.coef.real, s) - points, axis)
+                dhVal = np.dot(geo_utils.curveValues(t1, k1, c1, s), axis)
+                step = np.where(dhVal != 0.0, -hVal / np.where(dhVal != 0.0, dhVal, 1.0), 0.0)
+                sNew = np.clip(s + step, sLow, sHigh)
+                converged = np.max(np.abs(sNew - s)) < tol
+                s = sNew
+                if converged:
+                    break
+
+        X = geo_utils.curveValues(curve.t, curve.k, curve.coef.real, s)
+
+        return found, s, X
@@ -1,4 +1,5 @@
 # Standard Python modules
+import os
 import sys
 
 # External modules
@@ -498,6 +499,10 @@ class SurfaceTopology(Topology):
             self.readConnectivity(fileName)
             return
 
+        # An empty topology, to be filled with readCache()
+        if coords is None:
+            return
+
         self.edges = None
         self.faceIndex = None
         self.simple = False
@@ -858,6 +863,10 @@ class BlockTopology(Topology):
             self.readConnectivity(fileName)
             return
 
+        # An empty topology, to be filled with readCache()
+        if coords is None:
+            return
+
         coords = np.atleast_2d(coords)
         nVol = len(coords)
 
@@ -976,6 +985,86 @@ class BlockTopology(Topology):
         for i in range(self.nEdge):  # Create the edge objects
             self.edges.append(Edge(ue[i][0], ue[i][1], 0, 0, 0, ue[i][2], ue[i][3]))
 
+    def writeCache(self, fileName, key):
+        """Write the connectivity and the global numbering to a numpy
+        archive, together with a hash key of the data it was computed
+        from. The file is written to a temporary file first and then
+        moved, so several processors can write it at the same time.
+
+        Parameters
+        ----------
+        fileName : str
+            The cache file name. Should end in .npz
+        key : str
+            Hash of the data the topology was computed from
+        """
+        edges = np.zeros((self.nEdge, 7), "intc")
+        for iedge, e in enumerate(self.edges):
+            edges[iedge] = [e.n1, e.n2, e.cont, e.degen, e.intersect, e.dg, e.N]
+        gIndexSizes = np.array([len(entries) for entries in self.gIndex], "intc")
+        gIndex = np.array([entry for entries in self.gIndex for entry in entries], "intc").reshape((-1, 4))
+
+        tmpFileName = f"{fileName}.{os.getpid()}.tmp.npz"
+        np.savez(
+            tmpFileName,
+            key=key,
+            counts=np.array([self.nNode, self.nEdge, self.nFace, self.nVol, self.nDG], "intc"),
+            edges=edges,
+            nodeLink=self.nodeLink,
+            edgeLink=self.edgeLink,
+            edgeDir=self.edgeDir,
+            faceLink=self.faceLink,
+            faceDir=self.faceDir,
+            faceDirRev=self.faceDirRev,
+            lIndexSizes=np.array([lIndex.shape for lIndex in self.lIndex], "intc").reshape((-1, 3)),
+            lIndex=np.concatenate([lIndex.flatten() for lIndex in self.lIndex]),
+            gIndexSizes=gIndexSizes,
+            gIndex=gIndex,
+        )
+        os.replace(tmpFileName, fileName)
+
+    def readCache(self, fileName, key):
+        """Read the connectivity and the global numbering written by
+        :meth:`writeCache`.
+
+        Parameters
+        ----------
+        fileName : str
+            The cache file name
+        key : str
+            Hash of the data the topology is computed from
+
+        Returns
+        -------
+        loaded : bool
+            False if the file does not exist or was written for
+            different data, in which case nothing is read.
+        """
+        if not os.path.isfile(fileName):
+            return False
+
+        with np.load(fileName) as data:
+            if str(data["key"]) != key:
+                return False
+
+            self.nNode, self.nEdge, self.nFace, self.nVol, self.nDG = (int(n) for n in data["counts"])
+            self.nEnt = self.nVol
+            self.edges = [Edge(*(int(val) for val in edge)) for edge in data["edges"]]
+            self.nodeLink = data["nodeLink"]
+            self.edgeLink = data["edgeLink"]
+            self.edgeDir = data["edgeDir"]
+            self.faceLink = data["faceLink"]
+            self.faceDir = data["faceDir"]
+            self.faceDirRev = data["faceDirRev"]
+
+            lIndexSizes = data["lIndexSizes"]
+            lIndex = np.split(data["lIndex"], np.cumsum(np.prod(lIndexSizes, axis=1))[:-1])
+            self.lIndex = [lIndex[ivol].reshape(lIndexSizes[ivol]) for ivol in range(len(lIndexSizes))]
+            self.gIndex = np.split(data["gIndex"], np.cumsum(data["gIndexSizes"])[:-1])
+            self.nGlobal = len(self.gIndex)
+
+        return True
+
     def calcGlobalNumbering(self, sizes=None, volumeList=None, greedyReorder=False, gIndex=True):
         """Internal function to calculate the global/local numbering for each volume"""
 
@@ -1,6 +1,8 @@
 # Standard Python modules
 import os
+import tempfile
 import unittest
+from unittest.mock import patch
 
 # External modules
 from baseclasses import BaseRegTest
@@ -8,7 +10,8 @@ import commonUtils
 import numpy as np
 
 # First party modules
-from pygeo import DVGeometry, geo_utils
+from pygeo import DVGeometry, geo_utils, pyBlock
+from pygeo.topology import BlockTopology
 
 
 class RegTestPyGeo(unittest.TestCase):
@@ -96,12 +99,12 @@ class RegTestPyGeo(unittest.TestCase):
         DVGeo.setDesignVars(x)
         DVGeo.update("X")
         DVGeo.computeTotalJacobianCS("X")
-        JacCS = DVGeo.JT["X"]
+        JacCS = DVGeo.JT["X"].toarray()
 
         DVGeo.setDesignVars(x)
         DVGeo.update("X")
         DVGeo.computeTotalJacobianFD("X")
-        JacFD = DVGeo.JT["X"]
+        JacFD = DVGeo.JT["X"].toarray()
 
         if refDeriv:
             handler.root_add_val("jacobian", JacCS, rtol=1e-12, atol=1e-12, msg="Check jacobian")
@@ -330,5 +333,86 @@ def f_rotate_theta(val, geo):
     geo.rot_theta["ref"].coef[:] = val[0]
 
 
+class TestTopologyCache(unittest.TestCase):
+    N_PROCS = 1
+
+    def setUp(self):
+        self.tmpDir = tempfile.TemporaryDirectory()
+        self.ffdFile = os.path.join(self.tmpDir.name, "wing.xyz")
+        self.cacheFile = os.path.join(self.tmpDir.name, "wing_topo.npz")
+        self.writeFFD(1.0)
+
+    def tearDown(self):
+        self.tmpDir.cleanup()
+
+    def writeFFD(self, span):
+        # Two connected volumes along z
+        slices = np.array(
+            [[[[0, 0, z], [1, 0, z]], [[0, 0.2, z], [1, 0.2, z]]] for z in [0.0, span, 2 * span]],
+            dtype="d",
+        )
+        geo_utils.write_wing_FFD_file(self.ffdFile, slices, [3, 4], 2, 3)
+
+    def assertTopologyEqual(self, topo, topoRef):
+        for attr in ["nNode", "nEdge", "nFace", "nVol", "nDG", "nGlobal"]:
+            self.assertEqual(getattr(topo, attr), getattr(topoRef, attr), msg=attr)
+        for attr in ["nodeLink", "edgeLink", "edgeDir", "faceLink", "faceDir", "faceDirRev"]:
+            np.testing.assert_array_equal(getattr(topo, attr), getattr(topoRef, attr), err_msg=attr)
+        for edge, edgeRef in zip(topo.edges, topoRef.edges):
+            self.assertEqual(
+                [edge.n1, edge.n2, edge.cont, edge.degen, edge.intersect, edge.dg, edge.N],
+                [edgeRef.n1, edgeRef.n2, edgeRef.cont, edgeRef.degen, edgeRef.intersect, edgeRef.dg, edgeRef.N],
+            )
+        self.assertEqual(len(topo.lIndex), len(topoRef.lIndex))
+        for lIndex, lIndexRef in zip(topo.lIndex, topoRef.lIndex):
+            np.testing.assert_array_equal(lIndex, lIndexRef)
+        self.assertEqual(len(topo.gIndex), len(topoRef.gIndex))
+        for gIndex, gIndexRef in zip(topo.gIndex, topoRef.gIndex):
+            np.testing.assert_array_equal(np.reshape(gIndex, (-1, 4)), np.reshape(gIndexRef, (-1, 4)))
+
+    def test_writeReadCache(self):
+        topoRef = pyBlock("plot3d", fileName=self.ffdFile, FFD=True).topo
+        topoRef.writeCache(self.cacheFile, "key")
+
+        # A round trip gives the same connectivity and global numbering
+        topo = BlockTopology()
+        self.assertTrue(topo.readCache(self.cacheFile, "key"))
+        self.assertTopologyEqual(topo, topoRef)
+
+        # A cache for different data or a missing cache is not read
+        self.assertFalse(BlockTopology().readCache(self.cacheFile, "otherKey"))
+        self.assertFalse(BlockTopology().readCache(os.path.join(self.tmpDir.name, "missing.npz"), "key"))
+
+    def test_topoCache(self):
+        blockRef = pyBlock("plot3d", fileName=self.ffdFile, FFD=True)
+
+        # The first FFD writes the cache and the second one reads it
+        block = pyBlock("plot3d", fileName=self.ffdFile, FFD=True, topoCache=True)
+        self.assertTrue(os.path.isfile(self.cacheFile))
+        with patch.object(BlockTopology, "calcGlobalNumbering") as calcGlobalNumbering:
+            blockCached = pyBlock("plot3d", fileName=self.ffdFile, FFD=True, topoCache=True)
+            calcGlobalNumbering.assert_not_called()
+
+        for b in [block, blockCached]:
+            self.assertTopologyEqual(b.topo, blockRef.topo)
+            np.testing.assert_allclose(b.coef, blockRef.coef, rtol=1e-14)
+
+        # A changed FFD does not use the stale cache, and overwrites it
+        self.writeFFD(2.0)
+        blockRef = pyBlock("plot3d", fileName=self.ffdFile, FFD=True)
+        with patch.object(
+            BlockTopology, "calcGlobalNumbering", autospec=True, side_effect=BlockTopology.calcGlobalNumbering
+        ) as calcGlobalNumbering:
+            block = pyBlock("plot3d", fileName=self.ffdFile, FFD=True, topoCache=self.cacheFile)
+            calcGlobalNumbering.assert_called_once()
+
+        self.assertTopologyEqual(block.topo, blockRef.topo)
+        np.testing.assert_allclose(block.coef, blockRef.coef, rtol=1e-14)
+
+        with patch.object(BlockTopology, "calcGlobalNumbering") as calcGlobalNumbering:
+            pyBlock("plot3d", fileName=self.ffdFile, FFD=True, topoCache=self.cacheFile)
+            calcGlobalNumbering.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
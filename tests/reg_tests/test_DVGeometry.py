@@ -7,7 +7,9 @@ import unittest
 
 # External modules
 from baseclasses import BaseRegTest
+from baseclasses.utils import Error
 import commonUtils
+from mpi4py import MPI
 import numpy as np
 from stl import mesh
 
@@ -1528,6 +1530,153 @@ class RegTestPyGeo(unittest.TestCase):
 
                 handler.root_add_val(f"new_coords_{ptName}", new_pts, rtol=1e-10, atol=1e-10)
 
+    def test_totalJacobianCS_child(self):
+        """
+        Test the CS total Jacobian against the analytic one for local and spanwise
+        DVs on a parent FFD whose child has nonzero DVs
+        """
+        DVGeo, DVGeoChild = commonUtils.setupDVGeo(self.base_path)
+
+        DVGeo.addGlobalDV("mainX", -1.0, commonUtils.mainAxisPoints, lower=-1.0, upper=0.0, scale=1.0)
+        DVGeo.addLocalDV("xdir", lower=-1.0, upper=1.0, axis="x", scale=1.0)
+        DVGeo.addSpanwiseLocalDV("shape", "i", lower=-0.5, upper=0.5, axis="y", scale=1.0)
+        DVGeoChild.addGlobalDV("nestedX", -0.5, commonUtils.childAxisPoints, lower=-1.0, upper=0.0, scale=1.0)
+        DVGeoChild.addLocalDV("childxdir", lower=-1.1, upper=1.1, axis="x", scale=1.0)
+        DVGeoChild.addLocalDV("childydir", lower=-1.1, upper=1.1, axis="y", scale=1.0)
+        DVGeo.addChild(DVGeoChild)
+
+        points = np.array([[0.25, 0.0, 0.0], [-0.25, 0.0, 0.0]])
+        ptName = "testPoints"
+        DVGeo.addPointSet(points, ptName)
+
+        # move both the parent and the child away from the baseline
+        rng = np.random.default_rng(0)
+        xDV = DVGeo.getValues()
+        for key in xDV:
+            xDV[key] = xDV[key] + 0.1 * rng.random(len(xDV[key]))
+        DVGeo.setDesignVars(xDV)
+        DVGeo.update(ptName)
+
+        DVGeo.computeTotalJacobian(ptName)
+        JT = DVGeo.JT[ptName].toarray()
+
+        # setting the DVs again clears the Jacobians on all levels
+        DVGeo.setDesignVars(xDV)
+        DVGeo.computeTotalJacobianCS(ptName)
+
+        np.testing.assert_allclose(DVGeo.JT[ptName].toarray(), JT, rtol=1e-10, atol=1e-10)
+
+    def test_checkDerivatives(self):
+        """
+        Test the report returned by checkDerivatives
+        """
+        DVGeo, _ = commonUtils.setupDVGeo(self.base_path)
+        DVGeo.addGlobalDV("mainX", -1.0, commonUtils.mainAxisPoints, lower=-1.0, upper=0.0, scale=1.0)
+        DVGeo.addLocalDV("xdir", lower=-1.0, upper=1.0, axis="x", scale=1.0)
+        DVGeo.addSpanwiseLocalDV("shape", "i", lower=-0.5, upper=0.5, axis="y", scale=1.0)
+
+        points = np.array([[0.25, 0.0, 0.0], [-0.25, 0.0, 0.0], [0.5, 0.2, 0.1]])
+        ptName = "testPoints"
+        DVGeo.addPointSet(points, ptName)
+
+        report = DVGeo.checkDerivatives(ptName, verbose=False)
+        self.assertEqual(set(report), {"mainX", "xdir", "shape"})
+        for key, dvReport in report.items():
+            nVal = DVGeo.getValues()[key].size
+            for err in ["maxAbsErr", "maxRelErr", "relNormErr"]:
+                self.assertEqual(dvReport[err].shape, (nVal,))
+            self.assertEqual(len(dvReport["indices"]), nVal)
+
+            # The analytic derivatives agree with FD so nothing is flagged
+            np.testing.assert_array_less(dvReport["maxAbsErr"], 1e-5)
+            self.assertTrue(all(len(indices) == 0 for indices in dvReport["indices"]))
+
+        # Any FD error is flagged with a zero tolerance, and only sampled coordinates are checked
+        report = DVGeo.checkDerivatives(ptName, tol=0.0, nSample=4, verbose=False)
+        indices = np.concatenate([np.concatenate(dvReport["indices"]) for dvReport in report.values()])
+        self.assertGreater(len(indices), 0)
+        self.assertLessEqual(len(np.unique(indices)), 4)
+
+    def test_checkDerivatives_spanwiseCS(self):
+        """
+        Test the CS derivative check with spanwise local DVs, which go through _update_deriv_cs
+        """
+        DVGeo, _ = commonUtils.setupDVGeo(self.base_path)
+        DVGeo.addSpanwiseLocalDV("shape", "i", lower=-0.5, upper=0.5, axis="y", scale=1.0)
+
+        points = np.array([[0.25, 0.0, 0.0], [-0.25, 0.0, 0.0], [0.5, 0.2, 0.1]])
+        ptName = "testPoints"
+        DVGeo.addPointSet(points, ptName)
+
+        rng = np.random.default_rng(0)
+        xDV = DVGeo.getValues()
+        xDV["shape"] = 0.1 * rng.random(len(xDV["shape"]))
+        DVGeo.setDesignVars(xDV)
+        coords = DVGeo.update(ptName)
+
+        report = DVGeo.checkDerivatives(ptName, mode="cs", verbose=False)
+        np.testing.assert_array_less(report["shape"]["maxAbsErr"], 1e-10)
+
+        # The coefficients are real again after the check
+        np.testing.assert_allclose(DVGeo.update(ptName), coords, rtol=1e-14, atol=1e-14)
+
+
+def setupJacobianDVGeo(base_path):
+    DVGeo, _ = commonUtils.setupDVGeo(base_path)
+    DVGeo.addGlobalDV("mainX", -1.0, commonUtils.mainAxisPoints, lower=-1.0, upper=0.0, scale=1.0)
+    DVGeo.addLocalDV("xdir", lower=-1.0, upper=1.0, axis="x", scale=1.0)
+    DVGeo.addLocalDV("ydir", lower=-1.0, upper=1.0, axis="y", scale=1.0)
+
+    ptName = "testPoints"
+    DVGeo.addPointSet(np.array([[0.25, 0.0, 0.0], [-0.25, 0.0, 0.0]]), ptName)
+
+    # evaluate away from the baseline
+    xDV = DVGeo.getValues()
+    xDV["xdir"] += 0.1
+    DVGeo.setDesignVars(xDV)
+    DVGeo.update(ptName)
+
+    return DVGeo, ptName
+
+
+def checkDistributedJacobian(DVGeo, ptName, **kwargs):
+    """Compare the CS and FD Jacobians with the DV columns distributed against the serial ones"""
+    for method, tol in [(DVGeo.computeTotalJacobianCS, 1e-12), (DVGeo.computeTotalJacobianFD, 1e-8)]:
+        DVGeo.zeroJacobians([ptName])
+        method(ptName)
+        JT = DVGeo.JT[ptName].toarray()
+
+        DVGeo.zeroJacobians([ptName])
+        method(ptName, **kwargs)
+        np.testing.assert_allclose(DVGeo.JT[ptName].toarray(), JT, rtol=tol, atol=tol)
+
+
+class TestDistributedJacobian(unittest.TestCase):
+    N_PROCS = 2
+
+    def setUp(self):
+        self.base_path = os.path.dirname(os.path.abspath(__file__))
+
+    def test_comm(self):
+        DVGeo, ptName = setupJacobianDVGeo(self.base_path)
+        checkDistributedJacobian(DVGeo, ptName, comm=MPI.COMM_WORLD)
+
+    def test_pool_with_mpi(self):
+        DVGeo, ptName = setupJacobianDVGeo(self.base_path)
+        with self.assertRaises(Error):
+            DVGeo.computeTotalJacobianCS(ptName, nProcs=2)
+
+
+class TestJacobianPool(unittest.TestCase):
+    N_PROCS = 1
+
+    def setUp(self):
+        self.base_path = os.path.dirname(os.path.abspath(__file__))
+
+    def test_pool(self):
+        DVGeo, ptName = setupJacobianDVGeo(self.base_path)
+        checkDistributedJacobian(DVGeo, ptName, nProcs=2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,173 @@
+# Standard Python modules
+import os
+import unittest
+
+# External modules
+from mpi4py import MPI
+import numpy as np
+from parameterized import parameterized_class
+from stl import mesh
+
+try:
+    # External modules
+    import openmdao.api as om
+    from openmdao.utils.assert_utils import assert_check_partials
+
+    omInstalled = True
+except ImportError:
+    omInstalled = False
+
+if omInstalled:
+    # First party modules
+    from pygeo.mphys import OM_DVGEOCOMP
+
+    class GeometryGroup(om.Group):
+        """
+        Box geometry with global and local DVs and a distributed point set.
+        With a single DVGeo, nonlinear and linear constraints are added too.
+        With two DVGeos, each one has its own DVs and point set.
+        """
+
+        def initialize(self):
+            self.options.declare("use_partials", default=False, types=bool)
+            self.options.declare("multi", default=False, types=bool)
+
+        def setup(self):
+            basePath = os.path.dirname(os.path.abspath(__file__))
+            ffdFile = os.path.join(basePath, "../../input_files/2x1x8_rectangle.xyz")
+            self.meshFile = os.path.join(basePath, "../../input_files/2x1x8_rectangle.stl")
+
+            if self.options["multi"]:
+                DVGeoInfo = {name: {"file": ffdFile, "type": "ffd"} for name in ["box1", "box2"]}
+                geometry = OM_DVGEOCOMP(DVGeoInfo=DVGeoInfo, use_partials=self.options["use_partials"])
+            else:
+                geometry = OM_DVGEOCOMP(file=ffdFile, type="ffd", use_partials=self.options["use_partials"])
+
+            self.add_subsystem("dvs", om.IndepVarComp(), promotes=["*"])
+            self.add_subsystem("geometry", geometry, promotes=["*"])
+
+        def configure(self):
+            if self.options["multi"]:
+                self.addDVGeo("box1", seed=0)
+                self.addDVGeo("box2", seed=1)
+                return
+
+            self.addDVGeo(None, seed=0)
+
+            geometry = self.geometry
+            testMesh = mesh.Mesh.from_file(self.meshFile)
+            p0 = testMesh.vectors[:, 0, :]
+            v1 = testMesh.vectors[:, 1, :] - p0
+            v2 = testMesh.vectors[:, 2, :] - p0
+            geometry.nom_setConstraintSurface([p0, v1, v2])
+
+            leList = [[-0.25, 0.0, 0.1], [-0.25, 0.0, 7.9]]
+            teList = [[0.75, 0.0, 0.1], [0.75, 0.0, 7.9]]
+            geometry.nom_addThicknessConstraints2D("thickness", leList, teList, 2, 2)
+            geometry.nom_add_LETEConstraint("lete", 0, "iLow")
+
+        def addDVGeo(self, DVGeoName, seed):
+            geometry = self.geometry
+            prefix = "" if DVGeoName is None else f"{DVGeoName}_"
+            rng = np.random.default_rng(seed)
+
+            nRefAxPts = geometry.nom_addRefAxis(DVGeoName=DVGeoName, name="wing", xFraction=0.5, alignIndex="k")
+
+            def twist(val, geo, nRefAxPts=nRefAxPts):
+                for i in range(1, nRefAxPts):
+                    geo.rot_z["wing"].coef[i] = val[i - 1]
+
+            geometry.nom_addGlobalDV("twist", [0] * (nRefAxPts - 1), twist, DVGeoName=DVGeoName, prependName=True)
+            self.dvs.add_output(f"{prefix}twist", val=rng.random(nRefAxPts - 1))
+
+            nLocal = geometry.nom_addLocalDV("local", axis="y", DVGeoName=DVGeoName, prependName=True)
+            self.dvs.add_output(f"{prefix}local", val=0.1 * (rng.random(nLocal) - 0.5))
+
+            # Split the points across the procs
+            points = np.array([[0.0, 0.2, 1.0], [0.5, -0.3, 4.0], [-0.5, 0.1, 7.0], [0.2, 0.0, 2.5], [-0.3, -0.1, 5.5]])
+            localPoints = np.array_split(points, self.comm.size)[self.comm.rank]
+            geometry.nom_addPointSet(localPoints.flatten(), f"{prefix}pts", DVGeoName=DVGeoName)
+
+
+test_params = [
+    {"N_PROCS": 1, "name": "serial"},
+    {"N_PROCS": 2, "name": "parallel_2procs"},
+]
+
+
+@unittest.skipUnless(omInstalled, "requires openmdao")
+@parameterized_class(test_params)
+class TestMPhysPartials(unittest.TestCase):
+    N_PROCS = 1
+
+    def setupProblem(self, use_partials, multi=False):
+        prob = om.Problem()
+        prob.model = GeometryGroup(use_partials=use_partials, multi=multi)
+        prob.setup(mode="rev")
+        prob.run_model()
+        return prob
+
+    def checkPartials(self, multi):
+        prob = self.setupProblem(use_partials=True, multi=multi)
+
+        # Every constraint and the point set derivatives come from compute_partials
+        self.assertFalse(prob.model.geometry.matrix_free)
+        data = prob.check_partials(method="fd", compact_print=True, out_stream=None)
+        assert_check_partials(data, atol=1e-5, rtol=1e-5)
+        return prob
+
+    def checkTotals(self, ofs, wrts, multi):
+        totals = self.setupProblem(use_partials=True, multi=multi).compute_totals(of=ofs, wrt=wrts)
+        totalsRef = self.setupProblem(use_partials=False, multi=multi).compute_totals(of=ofs, wrt=wrts)
+
+        for key in totalsRef:
+            np.testing.assert_allclose(totals[key], totalsRef[key], rtol=1e-10, atol=1e-12)
+
+    def test_partials(self):
+        self.checkPartials(multi=False)
+
+    def test_totals(self):
+        self.checkTotals(["thickness", "lete", "pts"], ["twist", "local"], multi=False)
+
+    def test_partials_multi(self):
+        prob = self.checkPartials(multi=True)
+
+        # The point sets only have partials wrt the DVs of their own DVGeo
+        ptSetPartials = prob.model.geometry.ptSetPartials
+        for name in ["box1", "box2"]:
+            dvNames = [dvName for dvName, _, _, _ in ptSetPartials[f"{name}_pts"]]
+            self.assertEqual(dvNames, [f"{name}_twist", f"{name}_local"])
+
+    def test_totals_multi(self):
+        ofs = ["box1_pts", "box2_pts"]
+        wrts = ["box1_twist", "box1_local", "box2_twist", "box2_local"]
+        self.checkTotals(ofs, wrts, multi=True)
+
+
+@unittest.skipUnless(omInstalled, "requires openmdao")
+class TestSensitivityReduction(unittest.TestCase):
+    N_PROCS = 2
+
+    def test_reduceSensitivities(self):
+        geometry = OM_DVGEOCOMP(file=None, type="ffd")
+        geometry.comm = MPI.COMM_WORLD
+        rank = geometry.comm.rank
+
+        # Scalar, vector, and 2D seeds, inserted in a different order on each proc
+        rng = np.random.default_rng(rank)
+        xdot_local = {"twist": rng.random(4), "span": np.array(rng.random()), "shape": rng.random((2, 3))}
+        if rank % 2 == 1:
+            xdot_local = dict(reversed(list(xdot_local.items())))
+
+        xdot_global = geometry._reduceSensitivities(xdot_local)
+
+        # The batched reduction matches a reduction of each DV on its own
+        self.assertEqual(set(xdot_global), set(xdot_local))
+        for k in sorted(xdot_local):
+            xdotRef = geometry.comm.allreduce(xdot_local[k], op=MPI.SUM)
+            self.assertEqual(np.shape(xdot_global[k]), np.shape(xdot_local[k]))
+            np.testing.assert_allclose(xdot_global[k], xdotRef, rtol=1e-14)
+
+
+if __name__ == "__main__":
+    unittest.main()
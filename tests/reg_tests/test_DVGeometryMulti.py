@@ -535,5 +535,116 @@ class TestDVGeoMultiEdgeCases(unittest.TestCase):
         DVGeo.update(ptSetName)
 
 
+@unittest.skipUnless(pysurfInstalled, "requires pySurf")
+class TestDVGeoMultiParallelIntersections(unittest.TestCase):
+    N_PROCS = 2
+
+    def setupBoxes(self, comm, parallelIntersections):
+        comps = ["box1", "box2", "box3"]
+        ffdFiles = [os.path.join(inputDir, f"{comp}.xyz") for comp in comps]
+        triMeshFiles = [os.path.join(inputDir, f"{comp}.cgns") for comp in comps]
+
+        # Set up DVGeometryMulti object
+        DVGeo = DVGeometryMulti(comm=comm, parallelIntersections=parallelIntersections)
+        DVGeo.addComponent("box1", DVGeometry(ffdFiles[0]), triMeshFiles[0])
+        DVGeo.addComponent("box2", DVGeometry(ffdFiles[1]), triMeshFiles[1])
+        DVGeo.addComponent("box3", DVGeometry(ffdFiles[2]), None)
+
+        # Define some feature curves
+        featureCurves = ["part_15_1d", "part_35_1d", "part_37_1d", "part_39_1d"]
+        curveEpsDict = {
+            "part_15_1d": 1e-3,
+            "part_35_1d": 1e-3,
+            "part_37_1d": 1e-3,
+            "part_39_1d": 1e-3,
+            "intersection": 1e-3,
+        }
+
+        # Add the intersection between box1 and box2
+        DVGeo.addIntersection(
+            "box1",
+            "box2",
+            dStarA=0.15,
+            dStarB=0.15,
+            featureCurves=featureCurves,
+            project=True,
+            includeCurves=True,
+            curveEpsDict=curveEpsDict,
+        )
+
+        # Add a twist variable to each component
+        DVGeoDict = DVGeo.getDVGeoDict()
+        for comp in comps:
+            nRefAxPts = DVGeoDict[comp].addRefAxis("box", xFraction=0.5, alignIndex="j", rotType=4)
+            nTwist = nRefAxPts - 1
+
+            def twist(val, geo, nRefAxPts=nRefAxPts):
+                for i in range(1, nRefAxPts):
+                    geo.rot_z["box"].coef[i] = val[i - 1]
+
+            DVGeoDict[comp].addGlobalDV(dvName=f"{comp}_twist", value=[0] * nTwist, func=twist)
+
+        return DVGeo
+
+    def test_parallelIntersections(self):
+        """
+        Tests that the seams computed by processor groups and broadcast with
+        getSeamState and setSeamState give the same results as the serial seam computation
+        """
+
+        comm = MPI.COMM_WORLD
+        DVGeo = self.setupBoxes(comm, parallelIntersections=True)
+        DVGeoRef = self.setupBoxes(comm, parallelIntersections=False)
+
+        # Points on both boxes, away from and near the intersection
+        pts = np.array(
+            [
+                [0.0, 0.0, 0.0],
+                [0.5, 0.0, 2.0],
+                [0.3, 0.0, 0.5],
+                [0.75, -0.25, 0.6],
+                [0.25, 0.1, 0.5],
+                [0.5, -0.3, 0.5],
+                [0.25, 0.251, 0.5],
+                [0.5, 0.25, 0.6],
+            ]
+        )
+        localPts = np.array_split(pts, comm.size)[comm.rank]
+
+        ptSetName = "test_set"
+        DVGeo.addPointSet(localPts, ptSetName, comm=comm, applyIC=True)
+        DVGeoRef.addPointSet(localPts, ptSetName, comm=comm, applyIC=True)
+
+        # Seeds for the derivatives of two functions of interest
+        rng = np.random.default_rng(comm.rank)
+        dIdpt = rng.random((2, localPts.shape[0], 3))
+
+        # Check more than one update to make sure the seams are broadcast each time
+        for twist in [2.0, -1.0]:
+            for geo in [DVGeo, DVGeoRef]:
+                dvDict = geo.getValues()
+                dvDict["box1_twist"] = twist
+                dvDict["box2_twist"] = twist
+                geo.setDesignVars(dvDict)
+
+            # The seam data is the same on every processor
+            for IC, ICRef in zip(DVGeo.intersectComps, DVGeoRef.intersectComps):
+                state = IC.getSeamState()
+                stateRef = ICRef.getSeamState()
+                np.testing.assert_allclose(state["seam"], stateRef["seam"], rtol=1e-14, atol=1e-14)
+                np.testing.assert_array_equal(state["seamConnFull"], stateRef["seamConnFull"])
+                np.testing.assert_array_equal(state["seamConnWarp"], stateRef["seamConnWarp"])
+                self.assertEqual(state["seamDict"].keys(), stateRef["seamDict"].keys())
+                self.assertEqual(state["counter"], stateRef["counter"])
+
+            # The updated points and the derivatives match the serial seam computation
+            np.testing.assert_allclose(DVGeo.update(ptSetName), DVGeoRef.update(ptSetName), rtol=1e-12, atol=1e-14)
+
+            funcSens = DVGeo.totalSensitivity(dIdpt, ptSetName, comm=comm)
+            funcSensRef = DVGeoRef.totalSensitivity(dIdpt, ptSetName, comm=comm)
+            for x in funcSensRef:
+                np.testing.assert_allclose(funcSens[x], funcSensRef[x], rtol=1e-12, atol=1e-14)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -25,7 +25,7 @@ class TestPyGeo(unittest.TestCase):
         with BaseRegTest(self.refFile, train=False) as handler:
             self.regTest(handler)
 
-    def regTest(self, handler):
+    def createWing(self):
         dirName = os.path.join(baseDir, "../../input_files")
 
         # Airfoil file
@@ -65,7 +65,29 @@ class TestPyGeo(unittest.TestCase):
             teHeight=0.25 * 0.0254,
         )
 
+        return wing
+
+    def regTest(self, handler):
+        wing = self.createWing()
+
         for isurf in range(wing.nSurf):
             wing.surfs[isurf].computeData()
         surf = wing.surfs[isurf].data
         handler.root_add_val("sum of surface data", sum(surf.flatten()), tol=1e-10)
+
+    def test_projectPoints(self):
+        wing = self.createWing()
+
+        # Random points inside the bounding box of the wing
+        bounds = np.array([surf.getBounds() for surf in wing.surfs])
+        xMin = np.min(bounds[:, 0], axis=0)
+        xMax = np.max(bounds[:, 1], axis=0)
+        rng = np.random.default_rng(0)
+        points = xMin + rng.random((50, 3)) * (xMax - xMin)
+
+        # The bounding box filter does not change the closest surface or the projected points
+        u, v, patchID = wing.projectPoints(points)
+        uRef, vRef, patchIDRef = wing.projectPoints(points, boundsFilter=False)
+        np.testing.assert_array_equal(patchID, patchIDRef)
+        np.testing.assert_allclose(u, uRef, atol=1e-10)
+        np.testing.assert_allclose(v, vRef, atol=1e-10)
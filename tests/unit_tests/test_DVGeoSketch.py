@@ -0,0 +1,86 @@
+# Standard Python modules
+from collections import OrderedDict
+import unittest
+
+# External modules
+from mpi4py import MPI
+import numpy as np
+
+# First party modules
+from pygeo.parameterization import DVGeoVSP
+
+
+class StandInDV:
+    def __init__(self, value):
+        self.value = np.atleast_1d(np.array(value, dtype=float))
+
+
+class StandInPointSet:
+    def __init__(self):
+        self.jac = None
+
+
+class TestFDScheduling(unittest.TestCase):
+    N_PROCS = 1
+
+    def setUp(self):
+        # Set up the object without reading a model, only the finite difference bookkeeping is tested
+        DVGeo = object.__new__(DVGeoVSP.DVGeometryVSP)
+        DVGeo.comm = MPI.COMM_WORLD
+        DVGeo.DVs = OrderedDict(a=StandInDV(1.0), b=StandInDV([2.0, 3.0]))
+        DVGeo.pointSets = OrderedDict(pts=StandInPointSet())
+        DVGeo.updatedJac = {"pts": False}
+        DVGeo.jacReuseTol = None
+        DVGeo.jacDVs = None
+        DVGeo.dvCosts = None
+        self.DVGeo = DVGeo
+
+    def test_roundRobin(self):
+        np.testing.assert_array_equal(self.DVGeo._getDVOwners(7, 3), [0, 1, 2, 0, 1, 2, 0])
+
+        # Costs from a different number of DVs are not used
+        self.DVGeo.dvCosts = np.ones(3)
+        np.testing.assert_array_equal(self.DVGeo._getDVOwners(4, 2), [0, 1, 0, 1])
+
+    def test_costBalancing(self):
+        self.DVGeo.dvCosts = np.array([1.0, 5.0, 2.0, 2.0, 1.0])
+        owners = self.DVGeo._getDVOwners(5, 2)
+
+        # The most expensive DV goes first, then each DV goes to the least loaded proc
+        np.testing.assert_array_equal(owners, [1, 0, 1, 1, 0])
+        np.testing.assert_allclose(np.bincount(owners, weights=self.DVGeo.dvCosts), [6.0, 5.0])
+
+    def test_jacobianReuse(self):
+        DVGeo = self.DVGeo
+
+        # No tolerance or no previous Jacobian
+        self.assertFalse(DVGeo._reuseSurfJacobian())
+        DVGeo.jacReuseTol = 1e-3
+        self.assertFalse(DVGeo._reuseSurfJacobian())
+
+        DVGeo.pointSets["pts"].jac = np.zeros((3, 3))
+        DVGeo._finalizeSurfJacobian(np.array([1.0, 2.0, 3.0]))
+        np.testing.assert_array_equal(DVGeo.jacDVs, [1.0, 2.0, 3.0])
+        np.testing.assert_allclose(DVGeo.dvCosts, [1.0, 2.0, 3.0])
+        self.assertTrue(DVGeo.updatedJac["pts"])
+
+        # A step below the tolerance reuses the Jacobian
+        DVGeo.updatedJac["pts"] = False
+        DVGeo.DVs["b"].value[1] += 5e-4
+        self.assertTrue(DVGeo._reuseSurfJacobian())
+        self.assertTrue(DVGeo.updatedJac["pts"])
+
+        # A step above the tolerance does not
+        DVGeo.updatedJac["pts"] = False
+        DVGeo.DVs["b"].value[1] += 1e-2
+        self.assertFalse(DVGeo._reuseSurfJacobian())
+        self.assertFalse(DVGeo.updatedJac["pts"])
+
+        # A new point set without a Jacobian is not reused either
+        DVGeo.DVs["b"].value[1] = 3.0
+        DVGeo.pointSets["new"] = StandInPointSet()
+        self.assertFalse(DVGeo._reuseSurfJacobian())
+
+
+if __name__ == "__main__":
+    unittest.main()
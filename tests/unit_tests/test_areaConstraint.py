@@ -0,0 +1,167 @@
+# Standard Python modules
+import unittest
+from unittest.mock import MagicMock, patch
+
+# External modules
+from mpi4py import MPI
+import numpy as np
+
+# First party modules
+from pygeo.constraints import areaConstraint
+
+try:
+    # External modules
+    import geograd  # noqa: F401
+
+    geogradInstalled = True
+except ImportError:
+    geogradInstalled = False
+
+
+def planeSurface(n, size):
+    """Triangulate the square [-size, size]^2 on the z=0 plane with 2*n*n triangles"""
+    x = np.linspace(-size, size, n + 1)
+    X, Y = np.meshgrid(x, x, indexing="ij")
+    pts = np.stack((X, Y, np.zeros_like(X)), axis=-1)
+    a = pts[:-1, :-1].reshape(-1, 3)
+    b = pts[1:, :-1].reshape(-1, 3)
+    c = pts[1:, 1:].reshape(-1, 3)
+    d = pts[:-1, 1:].reshape(-1, 3)
+    return [np.vstack((a, a)), np.vstack((b, c)), np.vstack((c, d))]
+
+
+def tetSurface(center, size):
+    """Triangulate a regular tetrahedron"""
+    verts = np.array(center) + size * np.array([[1, 1, 1], [1, -1, -1], [-1, 1, -1], [-1, -1, 1]])
+    faces = np.array([[0, 1, 2], [0, 3, 1], [0, 2, 3], [1, 3, 2]])
+    return [verts[faces[:, 0]], verts[faces[:, 1]], verts[faces[:, 2]]]
+
+
+def makeConstraint(surface_1, surface_2, heuristic_dist=2.0):
+    return areaConstraint.TriangulatedSurfaceConstraint(
+        MPI.COMM_WORLD,
+        "triSurf",
+        surface_1,
+        "surf1",
+        None,
+        surface_2,
+        "surf2",
+        MagicMock(),
+        1.0,
+        True,
+        10.0,
+        0.1,
+        3.0,
+        heuristic_dist,
+    )
+
+
+class TestTriangleCulling(unittest.TestCase):
+    N_PROCS = 1
+
+    def setUp(self):
+        with patch.object(areaConstraint, "geograd_parallel", MagicMock()):
+            self.con = makeConstraint(planeSurface(40, 10.0), tetSurface([0.0, 0.0, 0.1], 0.2))
+
+    def test_cullTriangles(self):
+        activeTris = self.con._cullTriangles()
+        self.assertIsNotNone(activeTris)
+
+        # Gap between the bounding boxes of all the pairs of triangles
+        surfs = self.con._getSurfaces()
+        xyzmin = [np.minimum(np.minimum(*surfs[i : i + 2]), surfs[i + 2]).T for i in (0, 3)]
+        xyzmax = [np.maximum(np.maximum(*surfs[i : i + 2]), surfs[i + 2]).T for i in (0, 3)]
+        gap = np.maximum(np.maximum(xyzmin[0][:, None] - xyzmax[1][None], xyzmin[1][None] - xyzmax[0][:, None]), 0.0)
+        close = np.linalg.norm(gap, axis=2) <= self.con.maxdim
+
+        # Every triangle that can be within maxdim is kept, the far ones are culled
+        np.testing.assert_array_equal(np.setdiff1d(np.nonzero(close.any(axis=1))[0], activeTris[0]), [])
+        np.testing.assert_array_equal(activeTris[1], np.arange(self.con.surf2_size))
+        self.assertLess(len(activeTris[0]), self.con.surf1_size // 4)
+
+        # Nothing is culled if no pair is certainly within maxdim
+        self.con.surf2_p0[2, :] += 10.0
+        self.con.surf2_p1[2, :] += 10.0
+        self.con.surf2_p2[2, :] += 10.0
+        self.assertIsNone(self.con._cullTriangles())
+
+    def test_expandDerivs(self):
+        self.con.activeTris = self.con._cullTriangles()
+        active1, active2 = self.con.activeTris
+
+        # Stand-in derivatives that are the active vertices times the output index
+        surfs = self.con._getActiveSurfaces()
+        derivs = [0.0] * 5 + [(5 + i) * surfs[i % 6] for i in range(12)]
+        derivs = self.con._expandDerivs(derivs)
+
+        for i, surf in enumerate(self.con._getSurfaces() * 2):
+            active = active1 if i % 6 < 3 else active2
+            expected = np.zeros_like(surf)
+            expected[:, active] = (5 + i) * surf[:, active]
+            np.testing.assert_array_equal(derivs[5 + i], expected)
+
+        # Without culling, the derivatives are passed through
+        self.con.activeTris = None
+        self.assertIs(self.con._expandDerivs(derivs), derivs)
+
+    def test_cache(self):
+        # Stand-in geograd with outputs of the right sizes for the active triangles
+        def computeDerivs(*args):
+            return [0.0] * 5 + [np.ones_like(args[i % 6]) for i in range(12)]
+
+        stubGeograd = MagicMock()
+        stubGeograd.compute.return_value = (1.0, 0.5, 0.1, 0, 0)
+        stubGeograd.compute_derivs.side_effect = computeDerivs
+
+        with patch.object(areaConstraint, "geograd_parallel", stubGeograd):
+            for _ in range(3):
+                self.assertEqual(self.con.evalTriangulatedSurfConstraint(), (1.0, 0.5, False))
+                derivs = self.con.evalTriangulatedSurfConstraintSens()
+
+            # One evaluation of the functions, which runs geograd twice, and one of the derivatives
+            self.assertEqual(stubGeograd.compute.call_count, 2)
+            self.assertEqual(stubGeograd.compute_derivs.call_count, 1)
+            nActive = len(self.con.activeTris[0])
+            self.assertEqual(np.count_nonzero(derivs[5][0]), nActive)
+
+            # The surfaces are evaluated again after a surface moves
+            self.con.surf2_p0[0, :] += 0.1
+            self.con.surf2_p1[0, :] += 0.1
+            self.con.surf2_p2[0, :] += 0.1
+            for _ in range(3):
+                self.con.evalTriangulatedSurfConstraint()
+                self.con.evalTriangulatedSurfConstraintSens()
+
+            self.assertEqual(stubGeograd.compute.call_count, 4)
+            self.assertEqual(stubGeograd.compute_derivs.call_count, 2)
+            self.assertEqual(stubGeograd.compute.call_args.args[1].shape[1], len(self.con.activeTris[0]))
+
+
+@unittest.skipUnless(geogradInstalled, "requires geograd")
+class TestTriangleCullingGeograd(unittest.TestCase):
+    N_PROCS = 1
+
+    def test_culling(self):
+        surface_1 = planeSurface(40, 10.0)
+        surface_2 = tetSurface([0.0, 0.0, 0.1], 0.2)
+
+        con = makeConstraint(surface_1, surface_2)
+        KS, perim, _ = con.evalTriangulatedSurfConstraint()
+        derivs = con.evalTriangulatedSurfConstraintSens()
+        self.assertIsNotNone(con.activeTris)
+        self.assertGreater(perim, 0.0)
+
+        conFull = makeConstraint(surface_1, surface_2)
+        with patch.object(conFull, "_cullTriangles", return_value=None):
+            KSFull, perimFull, _ = conFull.evalTriangulatedSurfConstraint()
+            derivsFull = conFull.evalTriangulatedSurfConstraintSens()
+
+        np.testing.assert_allclose(KS, KSFull, rtol=1e-12)
+        np.testing.assert_allclose(perim, perimFull, rtol=1e-12)
+        np.testing.assert_allclose(con.minimum_distance, conFull.minimum_distance, rtol=1e-12)
+        for deriv, derivFull in zip(derivs[5:], derivsFull[5:]):
+            np.testing.assert_allclose(deriv, derivFull, rtol=1e-10, atol=1e-14)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+# Standard Python modules
+import os
+import tempfile
+import unittest
+
+# External modules
+import numpy as np
+from scipy.interpolate import BSpline
+
+# First party modules
+from pygeo import geo_utils
+
+
+class TestBasisFunctions(unittest.TestCase):
+    N_PROCS = 1
+
+    def test_basisFunctions(self):
+        k = 4
+        t = np.array([0.0, 0.0, 0.0, 0.0, 0.2, 0.5, 0.5, 0.8, 1.0, 1.0, 1.0, 1.0])
+        nCtl = len(t) - k
+        u = np.linspace(0.0, 1.0, 101)
+
+        start, B = geo_utils.basisFunctions(t, k, u)
+
+        # The basis functions are a partition of unity
+        np.testing.assert_allclose(np.sum(B, axis=1), 1.0, rtol=1e-14)
+
+        # Compare against the scipy basis functions away from the right end point,
+        # where scipy returns zero by convention
+        for iCtl in range(nCtl):
+            coef = np.zeros(nCtl)
+            coef[iCtl] = 1.0
+            ref = BSpline(t, coef, k - 1)(u[:-1])
+
+            val = np.zeros(len(u))
+            for ii in range(k):
+                mask = start + ii == iCtl
+                val[mask] = B[mask, ii]
+
+            np.testing.assert_allclose(val[:-1], ref, atol=1e-14)
+
+        # The last control point is interpolated at the right end point
+        self.assertEqual(start[-1], nCtl - k)
+        np.testing.assert_allclose(B[-1], [0.0, 0.0, 0.0, 1.0])
+
+
+class TestProjection(unittest.TestCase):
+    N_PROCS = 1
+
+    def test_closestPointsSegments(self):
+        rng = np.random.default_rng(0)
+        p0, p1, q0, q1 = (rng.normal(size=(50, 3)) for _ in range(4))
+
+        # Include degenerate and parallel segments
+        p1[0] = p0[0]
+        q1[1] = q0[1]
+        q1[2] = q0[2] + 2.0 * (p1[2] - p0[2])
+
+        a, b, D = geo_utils.closestPointsSegments(p0, p1, q0, q1)
+
+        np.testing.assert_allclose(D, q0 + b[:, None] * (q1 - q0) - (p0 + a[:, None] * (p1 - p0)), atol=1e-14)
+
+        # Compare against a brute force search
+        samples = np.linspace(0.0, 1.0, 201)
+        for i in range(len(p0)):
+            P = p0[i] + samples[:, None] * (p1[i] - p0[i])
+            Q = q0[i] + samples[:, None] * (q1[i] - q0[i])
+            dMin = np.min(np.linalg.norm(P[:, None] - Q[None, :], axis=2))
+            self.assertLessEqual(np.linalg.norm(D[i]), dMin + 1e-14)
+
+
+class TestFileIO(unittest.TestCase):
+    N_PROCS = 1
+
+    def test_readPlot3DFile(self):
+        rng = np.random.default_rng(0)
+        sizes = np.array([[2, 3, 4], [3, 2, 2]])
+        values = rng.random(3 * np.sum(np.prod(sizes, axis=1)))
+        blocksRef = []
+        offset = 0
+        for size in sizes:
+            nPts = np.prod(size)
+            block = np.zeros(tuple(size) + (3,))
+            for idim in range(3):
+                block[..., idim] = values[offset : offset + nPts].reshape(size, order="f")
+                offset += nPts
+            blocksRef.append(block)
+
+        with tempfile.TemporaryDirectory() as tmpDir:
+            fileNames = {}
+
+            fileNames["ascii"] = os.path.join(tmpDir, "blocks.xyz")
+            with open(fileNames["ascii"], "w") as f:
+                f.write(f"{len(sizes)}\n")
+                np.savetxt(f, sizes, fmt="%d")
+                np.savetxt(f, values, fmt="%.17g")
+
+            fileNames["binary"] = os.path.join(tmpDir, "blocks.bin")
+            with open(fileNames["binary"], "wb") as f:
+                np.array([len(sizes)], "intc").tofile(f)
+                sizes.astype("intc").tofile(f)
+                values.tofile(f)
+
+            fileNames["fortran"] = os.path.join(tmpDir, "blocks.fort")
+            with open(fileNames["fortran"], "wb") as f:
+                for record in [np.array([len(sizes)], "intc"), sizes.astype("intc"), values]:
+                    marker = np.array([record.nbytes], "intc")
+                    marker.tofile(f)
+                    record.tofile(f)
+                    marker.tofile(f)
+
+            fileNames["npz"] = os.path.join(tmpDir, "blocks.npz")
+            np.savez(fileNames["npz"], sizes=sizes, coords=values)
+
+            for fileType, fileName in fileNames.items():
+                with self.subTest(fileType=fileType):
+                    # Check that the format is detected and that the values are bit-identical
+                    for ft in [fileType, None]:
+                        readSizes, blocks = geo_utils.readPlot3DFile(fileName, fileType=ft)
+                        np.testing.assert_array_equal(readSizes, sizes)
+                        for block, blockRef in zip(blocks, blocksRef):
+                            np.testing.assert_array_equal(block, blockRef)
+
+    def test_writePlot3DFile(self):
+        rng = np.random.default_rng(1)
+        blocksRef = [rng.random((2, 3, 4, 3)), rng.random((3, 2, 2, 3))]
+
+        with tempfile.TemporaryDirectory() as tmpDir:
+            for fileType in ["ascii", "binary", "fortran", "npz"]:
+                with self.subTest(fileType=fileType):
+                    fileName = os.path.join(tmpDir, f"blocks_{fileType}.xyz")
+                    geo_utils.writePlot3DFile(fileName, blocksRef, fileType=fileType)
+                    sizes, blocks = geo_utils.readPlot3DFile(fileName, fileType=fileType)
+                    np.testing.assert_array_equal(sizes, [[2, 3, 4], [3, 2, 2]])
+                    for block, blockRef in zip(blocks, blocksRef):
+                        np.testing.assert_array_equal(block, blockRef)
+
+    def test_writeTecplotBinaryFile(self):
+        rng = np.random.default_rng(2)
+        zonesRef = [("vol0", rng.random((2, 3, 4, 3)), None), ("vol1", rng.random((3, 2, 2, 3)), 1.5)]
+
+        # The zones are collected by writeTecplot3DZone
+        zones = []
+        for name, data, solutionTime in zonesRef:
+            geo_utils.writeTecplot3DZone(zones, name, data, solutionTime)
+
+        with tempfile.TemporaryDirectory() as tmpDir:
+            fileName = os.path.join(tmpDir, "zones.plt")
+            geo_utils.writeTecplotBinaryFile(fileName, zones)
+            with open(fileName, "rb") as f:
+                raw = f.read()
+
+        def readInts(offset, count):
+            return np.frombuffer(raw, "int32", count, offset), offset + 4 * count
+
+        def readString(offset):
+            chars = []
+            while True:
+                (c,), offset = readInts(offset, 1)
+                if c == 0:
+                    return "".join(chars), offset
+                chars.append(chr(c))
+
+        # Header
+        self.assertEqual(raw[:8], b"#!TDV112")
+        ints, offset = readInts(8, 2)
+        np.testing.assert_array_equal(ints, [1, 0])
+        _, offset = readString(offset)
+        (nVar,), offset = readInts(offset, 1)
+        varNames = []
+        for _ in range(nVar):
+            varName, offset = readString(offset)
+            varNames.append(varName)
+        self.assertEqual(varNames, ["CoordinateX", "CoordinateY", "CoordinateZ"])
+
+        for name, data, solutionTime in zonesRef:
+            self.assertEqual(np.frombuffer(raw, "float32", 1, offset)[0], 299.0)
+            zoneName, offset = readString(offset + 4)
+            self.assertEqual(zoneName, name)
+            ints, offset = readInts(offset, 2)
+            np.testing.assert_array_equal(ints, [-1, -1 if solutionTime is None else -2])
+            self.assertEqual(np.frombuffer(raw, "float64", 1, offset)[0], solutionTime or 0.0)
+            ints, offset = readInts(offset + 8, 9)
+            np.testing.assert_array_equal(ints, [-1, 0, 0, 0, 0, *data.shape[:3], 0])
+        self.assertEqual(np.frombuffer(raw, "float32", 1, offset)[0], 357.0)
+        offset += 4
+
+        # Data in block format with the i index running fastest
+        for _, data, _ in zonesRef:
+            self.assertEqual(np.frombuffer(raw, "float32", 1, offset)[0], 299.0)
+            ints, offset = readInts(offset + 4, 6)
+            np.testing.assert_array_equal(ints, [2, 2, 2, 0, 0, -1])
+            nPts = np.prod(data.shape[:3])
+            minMax = np.frombuffer(raw, "float64", 6, offset).reshape((3, 2))
+            values = np.frombuffer(raw, "float64", 3 * nPts, offset + 48).reshape((3, nPts))
+            offset += 48 + 24 * nPts
+            for idim in range(3):
+                np.testing.assert_array_equal(values[idim], data[..., idim].flatten(order="F"))
+                np.testing.assert_array_equal(minMax[idim], [data[..., idim].min(), data[..., idim].max()])
+        self.assertEqual(offset, len(raw))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+# Standard Python modules
+import unittest
+
+# External modules
+import numpy as np
+from pyspline import Curve
+
+# First party modules
+from pygeo import pyNetwork
+
+
+class TestBatchedProjections(unittest.TestCase):
+    N_PROCS = 1
+
+    def setUp(self):
+        # A linear and a cubic curve, both running along x
+        curve1 = Curve(X=np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [2.0, 0.5, 0.0]]), k=2)
+        curve2 = Curve(X=np.array([[0.0, 1.0, 0.0], [0.5, 1.2, 0.3], [1.5, 1.1, 0.2], [2.0, 1.5, 0.0]]), k=4)
+        self.network = pyNetwork([curve1, curve2])
+
+        rng = np.random.default_rng(0)
+        self.points = rng.random((20, 3)) * [1.8, 1.5, 0.5] + [0.1, 0.0, 0.2]
+
+    def checkProjections(self, method, axis):
+        curveID, s = method(self.points, axis.copy(), batched=True)
+        curveIDRef, sRef = method(self.points, axis.copy(), batched=False)
+
+        np.testing.assert_array_equal(curveID, curveIDRef)
+        np.testing.assert_allclose(
+            self.network._evalCurves(curveID, s), self.network._evalCurves(curveIDRef, sRef), atol=1e-6
+        )
+
+    def test_projectRays(self):
+        self.checkProjections(self.network.projectRays, np.array([0.0, 0.0, 1.0]))
+
+    def test_intersectPlanes(self):
+        self.checkProjections(self.network.intersectPlanes, np.array([1.0, 0.0, 0.0]))
+
+    def test_intersectPlanesNearest(self):
+        # Both curves cross every plane, so the one nearest to the points is taken
+        curve1 = Curve(X=np.array([[0.0, 0.2, 0.0], [1.0, 0.3, 0.1], [2.0, 0.2, 0.0]]), k=2)
+        curve2 = Curve(X=np.array([[0.0, -1.0, 0.0], [0.7, -1.1, 0.2], [1.3, -0.9, 0.1], [2.0, -1.0, 0.0]]), k=4)
+        network = pyNetwork([curve2, curve1])
+
+        points = np.column_stack((np.linspace(0.1, 1.9, 10), np.zeros(10), np.zeros(10)))
+        for batched in [True, False]:
+            curveID, s = network.intersectPlanes(points, np.array([1.0, 0.0, 0.0]), batched=batched)
+            np.testing.assert_array_equal(curveID, 1)
+            np.testing.assert_allclose(network._evalCurves(curveID, s)[:, 0], points[:, 0], atol=1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+# Standard Python modules
+import unittest
+
+# External modules
+import numpy as np
+from scipy import sparse
+
+# First party modules
+from pygeo.parameterization.totalJacobian import TotalJacobian
+
+
+class TestTotalJacobian(unittest.TestCase):
+    N_PROCS = 1
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.nDVGlobal = 3
+        self.JTFull = np.zeros((10, 60))
+        self.JTFull[: self.nDVGlobal] = rng.random((self.nDVGlobal, 60))
+        for iDV in range(self.nDVGlobal, 10):
+            self.JTFull[iDV, 6 * iDV - 18 : 6 * iDV - 12] = rng.random(6)
+
+    def test_products(self):
+        rng = np.random.default_rng(1)
+        for JT in [self.JTFull, sparse.csr_matrix(self.JTFull)]:
+            J = TotalJacobian(JT, self.nDVGlobal)
+            np.testing.assert_allclose(J.toarray(), self.JTFull)
+            np.testing.assert_allclose(J.tocsr().toarray(), self.JTFull)
+
+            x = rng.random(60)
+            np.testing.assert_allclose(J.dot(x), self.JTFull.dot(x), rtol=1e-14)
+            X = rng.random((60, 4))
+            np.testing.assert_allclose(J.dot(X), self.JTFull.dot(X), rtol=1e-14)
+
+            y = rng.random(10)
+            np.testing.assert_allclose(J.transDot(y), self.JTFull.T.dot(y), rtol=1e-14)
+
+    def test_memory(self):
+        J = TotalJacobian(self.JTFull, self.nDVGlobal)
+        self.assertEqual(J.localJT.nnz, 7 * 6)
+        self.assertLess(J.nbytes, self.JTFull.nbytes)
+
+
+if __name__ == "__main__":
+    unittest.main()
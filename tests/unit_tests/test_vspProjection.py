@@ -0,0 +1,182 @@
+# Standard Python modules
+from collections import OrderedDict
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# External modules
+from mpi4py import MPI
+import numpy as np
+
+# First party modules
+from pygeo.parameterization import DVGeoVSP
+
+
+class Vec3d:
+    def set_xyz(self, x, y, z):
+        self.xyz = np.array([x, y, z])
+
+    def x(self):
+        return self.xyz[0]
+
+    def y(self):
+        return self.xyz[1]
+
+    def z(self):
+        return self.xyz[2]
+
+
+class StandInVSPModule:
+    vec3d = Vec3d
+
+
+class StandInVSPModel:
+    """
+    A model of two unit boxes, at the origin and shifted by 2 in x. Their
+    volume parametric coordinates are the coordinates relative to the box
+    corner. The surface of each box wraps around its lower (z = 0) and upper
+    (z = 1) faces, with u = r and w = s / 2 on the lower face and
+    w = 1 - s / 2 on the upper face. The projections with a guess fail for
+    points with z > 0.5.
+    """
+
+    offsets = {"box0": np.zeros(3), "box1": np.array([2.0, 0.0, 0.0])}
+
+    def __init__(self):
+        self.nGuessCalls = 0
+        self.guesses = []
+
+    def GetUWTess01(self, gid, surf):
+        return [0.0, 0.1, 0.35, 0.7, 1.0], [0.0, 0.15, 0.3, 0.45, 0.5, 0.6, 0.8, 1.0]
+
+    def CompVecPnt01(self, gid, surf, u, w):
+        w = np.array(w)
+        s = np.where(w <= 0.5, 2.0 * w, 2.0 * (1.0 - w))
+        t = np.where(w <= 0.5, 0.0, 1.0)
+        return self.CompVecPntRST(gid, surf, u, s, t)
+
+    def FindRSTVec(self, gid, surf, pnts):
+        xyz = np.array([pnt.xyz for pnt in pnts]) - self.offsets[gid]
+        rst = np.clip(xyz, 0.0, 1.0)
+        d = np.linalg.norm(xyz - rst, axis=1)
+        return list(rst[:, 0]), list(rst[:, 1]), list(rst[:, 2]), list(d)
+
+    def FindRSTVecGuess(self, gid, surf, pnts, rg, sg, tg):
+        self.nGuessCalls += 1
+        xyz = np.array([pnt.xyz for pnt in pnts])
+        self.guesses.append((xyz - self.offsets[gid], np.column_stack((rg, sg, tg))))
+        r, s, t, d = (np.array(val) for val in self.FindRSTVec(gid, surf, pnts))
+        fail = np.array([pnt.xyz[2] for pnt in pnts]) > 0.5
+        d[fail] = 1.0
+        return list(r), list(s), list(t), list(d)
+
+    def CompVecPntRST(self, gid, surf, r, s, t):
+        pnts = []
+        for rst in np.column_stack((r, s, t)):
+            pnt = Vec3d()
+            pnt.set_xyz(*(rst + self.offsets[gid]))
+            pnts.append(pnt)
+        return pnts
+
+
+class TestVSPProjection(unittest.TestCase):
+    N_PROCS = 1
+
+    def setUp(self):
+        self.tmpDir = tempfile.TemporaryDirectory()
+        fileName = os.path.join(self.tmpDir.name, "boxes.vsp3")
+        with open(fileName, "w") as f:
+            f.write("stand-in model")
+
+        # Set up the object without reading a VSP model
+        DVGeo = object.__new__(DVGeoVSP.DVGeometryVSP)
+        DVGeo.fileName = fileName
+        DVGeo.comm = MPI.COMM_WORLD
+        DVGeo.vspModel = StandInVSPModel()
+        DVGeo.allComps = ["box0", "box1"]
+        DVGeo.bbox = {"box0": np.array([[-0.1, 1.1]] * 3), "box1": np.array([[1.9, 3.1], [-0.1, 1.1], [-0.1, 1.1]])}
+        DVGeo.modelScale = 1.0
+        DVGeo.meshScale = 1.0
+        DVGeo.projTol = 1e-3
+        DVGeo.SMAX = 1.0
+        DVGeo.points = OrderedDict()
+        DVGeo.pointSets = OrderedDict()
+        DVGeo.ptSetNames = []
+        DVGeo.updated = {}
+        DVGeo.updatedJac = {}
+        DVGeo._getQuads()
+        self.DVGeo = DVGeo
+
+        rng = np.random.default_rng(0)
+        self.points = rng.random((20, 3))
+        self.points[10:, 0] += 2.0
+
+    def tearDown(self):
+        self.tmpDir.cleanup()
+
+    def test_projection(self):
+        with patch.object(DVGeoVSP, "openvsp", StandInVSPModule):
+            geom, r, s, t, d = self.DVGeo._projectPoints(self.points)
+
+        np.testing.assert_array_equal(geom, [0] * 10 + [1] * 10)
+        offsets = np.repeat([[0.0, 0.0, 0.0], [2.0, 0.0, 0.0]], 10, axis=0)
+        np.testing.assert_allclose(np.column_stack((r, s, t)), self.points - offsets)
+        np.testing.assert_allclose(d, 0.0, atol=1e-14)
+        np.testing.assert_allclose(self.DVGeo._compPntRST(geom, r, s, t), self.points, atol=1e-14)
+
+    def test_initial_guess(self):
+        # Points on the lower and upper faces of both boxes, away from the quads that join the faces
+        rng = np.random.default_rng(1)
+        lower = np.column_stack((rng.random(10), 0.95 * rng.random(10), np.zeros(10)))
+        upper = np.column_stack((rng.random(10), 0.75 * rng.random(10), np.ones(10)))
+        points = np.vstack((lower, upper))
+        points = np.vstack((points, points + [2.0, 0.0, 0.0]))
+
+        with patch.object(DVGeoVSP, "openvsp", StandInVSPModule):
+            self.DVGeo._projectPoints(points)
+
+        # The guesses of the points on the surface are exact in r and s,
+        # and the guesses of each box are computed together
+        self.assertEqual(len(self.DVGeo.vspModel.guesses), 2)
+        for rst, guess in self.DVGeo.vspModel.guesses:
+            self.assertEqual(len(rst), 20)
+            np.testing.assert_allclose(guess[:, :2], rst[:, :2], atol=1e-10)
+            np.testing.assert_array_equal(guess[:, 2], 0.5)
+
+    def test_cache_projections(self):
+        cacheFile = os.path.join(self.tmpDir.name, "points.npz")
+        with patch.object(DVGeoVSP, "openvsp", StandInVSPModule):
+            self.DVGeo.addPointSet(self.points, "pts", cache_projections=cacheFile)
+            nGuessCalls = self.DVGeo.vspModel.nGuessCalls
+            self.assertTrue(os.path.isfile(cacheFile))
+
+            # The same points are read from the cache
+            self.DVGeo.addPointSet(self.points, "ptsCached", cache_projections=cacheFile)
+            self.assertEqual(self.DVGeo.vspModel.nGuessCalls, nGuessCalls)
+            for name in ["geom", "r", "s", "t", "pts"]:
+                np.testing.assert_array_equal(
+                    getattr(self.DVGeo.pointSets["pts"], name), getattr(self.DVGeo.pointSets["ptsCached"], name)
+                )
+
+            # Different points are projected again
+            self.DVGeo.addPointSet(self.points[::-1], "ptsReversed", cache_projections=cacheFile)
+            self.assertGreater(self.DVGeo.vspModel.nGuessCalls, nGuessCalls)
+            np.testing.assert_array_equal(self.DVGeo.pointSets["ptsReversed"].geom, [1] * 10 + [0] * 10)
+
+    def test_cache_key(self):
+        key = self.DVGeo._getProjectionCacheKey(self.points)
+        self.assertEqual(self.DVGeo._getProjectionCacheKey(self.points.copy()), key)
+
+        # The cached component indices depend on the order of the components
+        self.DVGeo.allComps = ["box1", "box0"]
+        self.assertNotEqual(self.DVGeo._getProjectionCacheKey(self.points), key)
+
+        # The points are scaled before they are projected
+        self.DVGeo.allComps = ["box0", "box1"]
+        self.DVGeo.meshScale = 2.0
+        self.assertNotEqual(self.DVGeo._getProjectionCacheKey(self.points), key)
+
+
+if __name__ == "__main__":
+    unittest.main()